@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+bench_finder.py - per-keystroke latency of the TUI's fuzzy finder.
+
+Builds a PathIndex over a synthetic monorepo-shaped path list and times
+each keystroke (narrowing plus ranking) as a query is typed, the way
+the finder runs it while the user types. Each keystroke's time is the
+best of --repeat typings, so a noisy machine doesn't fail it, and the run
+fails (exit status 1) when the worst keystroke exceeds --budget.
+
+Usage:
+    python3 script/bench_finder.py [--paths 500000] [--query srcmain.py]
+                                   [--repeat 5] [--budget 50]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from xtrshow.finder import FuzzyFinder, PathIndex  # noqa: E402
+
+WORDS = (
+    "src lib core util test api model view controller service handler "
+    "index main config app module component data"
+).split()
+
+
+def synthetic_paths(count, seed=1):
+    rng = random.Random(seed)
+    paths = set()
+    while len(paths) < count:
+        depth = rng.randint(2, 6)
+        parts = [f"{rng.choice(WORDS)}{rng.randint(0, 50)}" for _ in range(depth)]
+        paths.add("/".join(parts) + rng.choice((".py", ".js", ".ts", ".md")))
+    return sorted(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paths", type=int, default=500_000)
+    parser.add_argument("--query", default="srcmain.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=50.0, help="ms per keystroke (default 50)"
+    )
+    args = parser.parse_args()
+
+    paths = synthetic_paths(args.paths)
+    started = time.perf_counter()
+    index = PathIndex(paths)
+    print(f"indexed {len(index)} paths in {time.perf_counter() - started:.2f}s")
+
+    best = [float("inf")] * len(args.query)
+    for _ in range(max(args.repeat, 1)):
+        finder = FuzzyFinder(index)
+        rows = []
+        for n, char in enumerate(args.query):
+            started = time.perf_counter()
+            finder.push(char)
+            results = finder.results(limit=200)
+            elapsed = (time.perf_counter() - started) * 1000
+            best[n] = min(best[n], elapsed)
+            top = index.paths[results[0]] if results else "-"
+            rows.append((finder.query, finder.count, top))
+
+    for (query, count, top), elapsed in zip(rows, best):
+        print(f"{query!r:>14} {count:>8} candidates {elapsed:7.1f} ms  {top}")
+    worst = max(best)
+    verdict = "PASS" if worst <= args.budget else "FAIL"
+    print(f"worst keystroke: {worst:.1f} ms (budget {args.budget:g} ms): {verdict}")
+    return 0 if verdict == "PASS" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
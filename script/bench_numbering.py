@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+bench_numbering.py - throughput of the export's line-number formatter.
+
+Times xtrshow.numbering.number_lines against the per-line f-string it
+replaced, on synthetic source files of several sizes, and reports MB/s of
+input for each (best of --repeat runs).
+
+Usage:
+    python3 script/bench_numbering.py [--repeat 5] [--total-mb 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from xtrshow.numbering import number_lines  # noqa: E402
+
+CHARS = "abcdefghijklmnopqrstuvwxyz_    ()[]{}=:.,'\""
+
+
+def fstring_numbering(text):
+    """The export loop's original formatter"""
+    lines = text.splitlines()
+    max_ln_width = len(str(len(lines)))
+    return "\n".join(f"{i + 1:>{max_ln_width}}:{line}" for i, line in enumerate(lines))
+
+
+def synthetic_source(lines, seed=1):
+    rng = random.Random(seed)
+    return "".join(
+        "".join(rng.choice(CHARS) for _ in range(rng.randint(0, 90))) + "\n"
+        for _ in range(lines)
+    )
+
+
+def throughput(fn, texts, repeat):
+    """Best MB/s over repeat passes through all texts"""
+    size = sum(len(t.encode("utf-8")) for t in texts) / 1e6
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return size / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--total-mb", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{'file size':>20} {'f-string':>12} {'number_lines':>14} {'speedup':>8}")
+    for lines in (50, 2_000, 50_000, 500_000):
+        text = synthetic_source(lines)
+        assert number_lines(text) == fstring_numbering(text)
+        copies = max(1, int(args.total_mb * 1e6 / len(text)))
+        texts = [text] * copies
+        old = throughput(fstring_numbering, texts, args.repeat)
+        new = throughput(number_lines, texts, args.repeat)
+        label = f"{lines} lines x{copies}"
+        print(f"{label:>20} {old:>7.1f} MB/s {new:>9.1f} MB/s {new / old:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - cold-start time of the xtrshow and xtrpatch entry points.
+
+Runs each command in a fresh interpreter (bytecode cached, as in an
+installed package) and reports the best wall time of --repeat runs, plus
+the import time of each entry point module as reported by -X importtime.
+The run fails (exit status 1) when an entry point module takes longer than
+--budget to import; importing curses and importlib.metadata up front put
+both near 50 ms.
+
+Usage:
+    python3 script/bench_startup.py [--repeat 20] [--budget 35]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ("xtrshow.cli", "xtrshow.repatch")
+
+COMMANDS = [
+    ("python -c pass", ["-c", "pass"]),
+    ("xtrshow --help", ["-m", "xtrshow.cli", "--help"]),
+    ("xtrshow --version", ["-m", "xtrshow.cli", "--version"]),
+    ("xtrpatch --help", ["-m", "xtrshow.repatch", "--help"]),
+    ("xtrpatch --version", ["-m", "xtrshow.repatch", "--version"]),
+]
+
+
+def run(args, env, flags=()):
+    return subprocess.run(
+        [sys.executable, *flags, *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def best_wall_ms(args, env, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(args, env)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def best_import_ms(module, env, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        report = run(["-c", f"import {module}"], env, ("-X", "importtime")).stderr
+        line = [l for l in report.splitlines() if l.endswith(f"| {module}")][-1]
+        best = min(best, int(line.split("|")[1]) / 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=35.0,
+        help="ms to import each entry point module (default 35)",
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=tempfile.mkdtemp())
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    run(["-c", "import xtrshow.cli, xtrshow.repatch"], env)  # fill the cache
+
+    print(f"{'command':>22} {'best wall':>10}")
+    for label, command in COMMANDS:
+        print(f"{label:>22} {best_wall_ms(command, env, args.repeat):>8.1f}ms")
+    print()
+    print(f"{'module':>22} {'import':>10}")
+    worst = 0.0
+    for module in ENTRY_POINTS + ("xtrshow.export",):
+        elapsed = best_import_ms(module, env, args.repeat)
+        if module in ENTRY_POINTS:
+            worst = max(worst, elapsed)
+        print(f"{module:>22} {elapsed:>8.1f}ms")
+    verdict = "PASS" if worst <= args.budget else "FAIL"
+    print(f"slowest entry point: {worst:.1f} ms (budget {args.budget:g} ms): {verdict}")
+    return 0 if verdict == "PASS" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# ./tests/conftest.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""Fixtures shared by the test modules"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from xtrshow.cli import flatten_tree, main
+
+# Old enough that no fingerprint or cache entry treats it as racy
+AN_HOUR_AGO = time.time() - 3600
+
+
+def _shape(root):
+    return [
+        (str(n.path), n.depth, n.is_last, n.is_dir, n.size)
+        for n in flatten_tree(root, visible_only=False)
+    ]
+
+
+def _make_wide_tree(root, width=6, files=20):
+    for a in range(width):
+        for b in range(width):
+            d = root / f"dir{a}" / f"sub{b}"
+            d.mkdir(parents=True)
+            for c in range(files):
+                (d / f"file{c}.txt").write_text("x" * c)
+        (root / f"dir{a}" / "node_modules").mkdir()
+        (root / f"dir{a}" / "top.py").write_text("pass\n")
+    (root / "README.md").write_text("# readme\n")
+
+
+def _write_file(path, data, mtime=AN_HOUR_AGO):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def _bump_mtime(path):
+    # Coarse filesystem clocks: make the change visible to mtime polling
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def shape():
+    """
+    shape(root): every node of a tree as (path, depth, is_last, is_dir,
+    size), to compare trees built different ways
+    """
+    return _shape
+
+
+@pytest.fixture
+def src_tree(tmp_path):
+    """tmp_path holding src/pkg/mod.py, src/main.py and README.md"""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "src" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "README.md").write_text("# readme\n")
+    return tmp_path
+
+
+@pytest.fixture
+def make_wide_tree():
+    """
+    make_wide_tree(root, width=6, files=20): width x width directories
+    dirN/subM of files files each, a top.py and an ignored node_modules in
+    every dirN, and a README.md
+    """
+    return _make_wide_tree
+
+
+def _run_cli(argv, selection=None):
+    with patch("xtrshow.cli.curses.wrapper", return_value=selection) as tui, patch(
+        "sys.argv", ["xtrshow", ".", "--no-watch"] + argv
+    ):
+        main()
+    return tui
+
+
+@pytest.fixture
+def run_cli():
+    """
+    run_cli(argv, selection=None): run xtrshow on "." with argv, the TUI
+    stubbed out to return selection; returns the stub, to check whether
+    the TUI was opened
+    """
+    return _run_cli
+
+
+@pytest.fixture
+def an_hour_ago():
+    """A timestamp an hour before the test run"""
+    return AN_HOUR_AGO
+
+
+@pytest.fixture
+def write_file():
+    """
+    write_file(path, data, mtime=an hour ago): write str or bytes data to
+    path and set its mtime; returns str(path)
+    """
+    return _write_file
+
+
+@pytest.fixture
+def bump_mtime():
+    """bump_mtime(path): move path's mtime a second on"""
+    return _bump_mtime
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
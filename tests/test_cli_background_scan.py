@@ -0,0 +1,134 @@
+# ./tests/test_cli_background_scan.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import threading
+
+import pytest
+
+import xtrshow.cli as cli
+from xtrshow.cli import (
+    FileNode,
+    TreeLoader,
+    VisibleRows,
+    build_file_tree,
+    flatten_tree,
+    select_all_in_directory,
+    DEFAULT_IGNORE,
+)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_background_scan_builds_the_full_tree(tmp_path, jobs, make_wide_tree, shape):
+    """The scan thread ends up with exactly the tree an eager build makes"""
+    make_wide_tree(tmp_path)
+    eager, eager_hidden = build_file_tree(tmp_path, ignore_patterns=DEFAULT_IGNORE)
+    root, hidden = build_file_tree(
+        tmp_path, ignore_patterns=DEFAULT_IGNORE, jobs=jobs, background=True
+    )
+
+    assert hidden == 0  # nothing listed up front
+    assert root.loader.scan.wait(timeout=30)
+    assert not root.loader.scanning
+    assert shape(root) == shape(eager)
+    assert root.loader.hidden_count == eager_hidden
+    assert root.loader.file_count == 6 * 6 * 20 + 6 + 1  # and a top.py per dirN
+    assert root.loader.dir_count == 6 + 6 * 6
+
+
+def test_background_build_returns_immediately(tmp_path, make_wide_tree, monkeypatch):
+    """The caller gets the root back without waiting for any listing"""
+    make_wide_tree(tmp_path, width=2, files=2)
+    listing = threading.Event()
+    release = threading.Event()
+    real_scan_directory = cli.scan_directory
+
+    def blocked(path, known=None):
+        listing.set()
+        assert release.wait(timeout=30)
+        return real_scan_directory(path, known)
+
+    monkeypatch.setattr(cli, "scan_directory", blocked)
+
+    # Every listing is held until release: a build that listed anything
+    # before returning would stall here
+    root, hidden = build_file_tree(tmp_path, background=True)
+    assert listing.wait(timeout=30)
+    assert root.loader.scanning
+    assert hidden == 0 and not root.loaded
+
+    release.set()
+    assert root.loader.scan.wait(timeout=30)
+    assert root.loader.file_count == 2 * 2 * 2 + 2 + 1
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_loading_during_scan_lists_each_directory_once(
+    tmp_path, jobs, make_wide_tree, shape
+):
+    """Opening and selecting directories while the scan runs is safe"""
+    make_wide_tree(tmp_path)
+    eager, _ = build_file_tree(tmp_path, ignore_patterns=DEFAULT_IGNORE)
+    root, _ = build_file_tree(
+        tmp_path, ignore_patterns=DEFAULT_IGNORE, jobs=jobs, background=True
+    )
+
+    root.load_children()
+    for child in root.children:
+        if child.is_dir:
+            for grandchild in child.load_children():
+                grandchild.load_children()
+    count = select_all_in_directory(root.children[-2], selected=True)
+    assert root.loader.scan.wait(timeout=30)
+
+    assert shape(root) == shape(eager)
+    assert count == 6 * 20 + 1
+    assert root.sel_count == 6 * 20 + 1
+    # Directories listed twice would have been counted twice
+    assert root.loader.dir_count == 6 + 6 * 6
+
+
+def test_visible_rows_fill_in_when_the_root_is_listed(tmp_path, make_wide_tree):
+    """Rows opened before the scan reached the root appear on refresh()"""
+    make_wide_tree(tmp_path, width=2, files=1)
+    loader = TreeLoader()
+    root = FileNode(tmp_path, loader=loader)
+    root.expanded = True
+
+    rows = VisibleRows(root)
+    assert [n.name for n in rows] == [root.name]
+    assert rows.waiting == [root]
+    assert not rows.refresh()
+
+    loader.start_scan(root)
+    assert loader.scan.wait(timeout=30)
+
+    assert rows.refresh()
+    assert rows.nodes == flatten_tree(root)
+    assert not rows.waiting
+
+
+def test_stop_scan_ends_the_thread(tmp_path, make_wide_tree):
+    """Stopping mid-scan leaves a consistent, partially listed tree"""
+    make_wide_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, background=True)
+
+    root.loader.stop_scan()
+
+    assert not root.loader.scanning
+    for node in flatten_tree(root, visible_only=False):
+        if node.is_dir and node.children:
+            assert node.loaded
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
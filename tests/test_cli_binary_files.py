@@ -0,0 +1,130 @@
+# ./tests/test_cli_binary_files.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+import time
+
+import pytest
+
+from xtrshow.cli import (
+    ScanCache,
+    build_file_tree,
+    scan_directory,
+    select_all_in_directory,
+    set_selected,
+)
+
+
+def _make_tree(root):
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    (root / "src" / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+    (root / "src" / "big.sql").write_text("-- dump\n" * 200)
+    (root / "src" / "empty.txt").write_text("")
+
+
+def _by_name(node):
+    return {child.name: child for child in node.load_children()}
+
+
+def test_scan_marks_binary_files(tmp_path):
+    _make_tree(tmp_path)
+    entries = {e.name: e for e in scan_directory(tmp_path / "src")}
+
+    assert entries["logo.png"].binary
+    assert not entries["main.py"].binary
+    assert not entries["empty.txt"].binary
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs")
+def test_scan_never_opens_special_files(tmp_path):
+    """Sniffing a FIFO would block the scan forever"""
+    os.mkfifo(tmp_path / "pipe")
+    (entry,) = scan_directory(tmp_path)
+    assert not entry.binary
+
+
+def test_select_all_skips_binary_and_large_files(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, max_file_size=1024)
+    src = _by_name(root)["src"]
+    files = _by_name(src)
+
+    assert files["logo.png"].skip_reason() == "binary"
+    assert files["big.sql"].skip_reason() == "large"
+    assert files["main.py"].skip_reason() is None
+
+    count = select_all_in_directory(src, selected=True)
+
+    assert count == 2  # main.py, empty.txt
+    assert not files["logo.png"].selected and not files["big.sql"].selected
+    assert root.sel_count == 2
+
+    # Still selectable by hand, and "deselect all" clears them too
+    set_selected(files["big.sql"], True)
+    assert root.sel_count == 3
+    select_all_in_directory(src, selected=True)
+    assert files["big.sql"].selected and root.sel_count == 3
+    select_all_in_directory(src, selected=False)
+    assert root.sel_count == 0 and root.sel_bytes == 0
+
+
+def test_size_limit_can_be_disabled(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, max_file_size=0)
+    files = _by_name(_by_name(root)["src"])
+    assert files["big.sql"].skip_reason() is None
+
+
+def test_skipped_files_are_marked_in_the_tree(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, max_file_size=1024)
+    files = _by_name(_by_name(root)["src"])
+
+    assert files["logo.png"].get_display_line().endswith("logo.png (binary)")
+    assert files["big.sql"].get_display_line().endswith("big.sql (1.6 KB)")
+    assert files["main.py"].get_display_line().endswith("📄 main.py")
+
+
+def test_binary_flag_survives_the_scan_cache(tmp_path):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(tree)
+    past = time.time() - 3600
+    for d in (tree / "src", tree):
+        os.utime(d, (past, past))
+    cache_file = tmp_path / "scan.json"
+
+    cache = ScanCache(cache_file)
+    build_file_tree(tree, cache=cache)
+    cache.save()
+    root, _ = build_file_tree(tree, cache=ScanCache(cache_file))
+
+    assert _by_name(_by_name(root)["src"])["logo.png"].binary
+
+
+def test_export_skips_binary_without_reading_it(tmp_path, monkeypatch, capsys, run_cli):
+    monkeypatch.chdir(tmp_path)
+    _make_tree(tmp_path)
+    selection = ["src/logo.png", "src/main.py"]
+
+    run_cli([], selection)
+
+    out, err = capsys.readouterr()
+    assert "# File: src/logo.png (binary, skipped)" in err
+    assert "logo.png" not in out
+    assert "1:print('hi')" in out
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
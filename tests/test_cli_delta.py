@@ -0,0 +1,225 @@
+# ./tests/test_cli_delta.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import json
+import os
+import time
+
+import pytest
+
+import xtrshow.manifest as manifest
+
+
+def _exported(out):
+    return [line[6:] for line in out.splitlines() if line.startswith("+++ b/")]
+
+
+@pytest.fixture
+def exported(tmp_path, monkeypatch, capsys, run_cli, write_file):
+    """tmp_path as the working directory, a.py, b.py and c.md exported once"""
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "a.py", "a = 1\n")
+    write_file(tmp_path / "b.py", "b = 1\n")
+    write_file(tmp_path / "c.md", "# c\n")
+    run_cli([], ["a.py", "b.py", "c.md"])
+    capsys.readouterr()
+
+
+def test_nothing_changed(exported, capsys, run_cli):
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == []
+    assert "Delta: 0 changed, 3 unchanged, 0 removed" in err
+
+
+def test_only_changed_files_are_exported(
+    exported, tmp_path, capsys, run_cli, write_file, an_hour_ago
+):
+    write_file(tmp_path / "b.py", "b = 2\n", mtime=an_hour_ago + 60)
+
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == ["b.py"]
+    assert "1:b = 2" in out
+    assert "Delta: 1 changed, 2 unchanged, 0 removed" in err
+
+    # The delta export is the new baseline
+    run_cli(["--update", "--delta"])
+    assert _exported(capsys.readouterr()[0]) == []
+
+
+def test_unchanged_files_are_not_read(
+    exported, tmp_path, monkeypatch, run_cli, write_file, an_hour_ago
+):
+    write_file(tmp_path / "c.md", "# c!\n", mtime=an_hour_ago + 60)
+    hashed = []
+    real_fingerprint = manifest.file_fingerprint
+    monkeypatch.setattr(
+        manifest,
+        "file_fingerprint",
+        lambda path, st=None: hashed.append(path) or real_fingerprint(path, st),
+    )
+
+    run_cli(["--delta"])
+
+    assert hashed == ["c.md"]
+
+
+def test_touched_but_identical_file_is_unchanged(
+    exported, capsys, run_cli, an_hour_ago
+):
+    os.utime("a.py", (an_hour_ago + 60, an_hour_ago + 60))
+
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == []
+    assert "0 changed, 3 unchanged" in err
+
+
+def test_removed_files_are_reported(exported, capsys, run_cli):
+    os.remove("a.py")
+
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == []
+    assert "Delta: 0 changed, 2 unchanged, 1 removed" in err
+    assert "# Removed: a.py" in err
+    assert "Error" not in err
+
+
+def test_new_selection_is_exported_whole(
+    exported, tmp_path, capsys, run_cli, write_file
+):
+    write_file(tmp_path / "d.py", "d = 1\n")
+    run_cli([], ["a.py", "d.py"])
+    capsys.readouterr()
+
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == []
+    assert "0 changed, 2 unchanged, 0 removed" in err
+
+
+def test_other_options_export_everything(exported, capsys, run_cli):
+
+    run_cli(["--delta", "--clean"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == ["a.py", "b.py", "c.md"]
+    assert "a = 1" in out and "1:a = 1" not in out
+
+
+def test_without_a_recorded_export_everything_is_new(
+    tmp_path, monkeypatch, capsys, run_cli, write_file
+):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "a.py", "a = 1\n")
+    (tmp_path / ".xtrshow_manifest").write_text("a.py\n")
+
+    run_cli(["--delta"])
+
+    out, err = capsys.readouterr()
+    assert _exported(out) == ["a.py"]
+    assert "Delta: 1 changed, 0 unchanged, 0 removed" in err
+
+
+def test_update_upgrades_a_plain_manifest(
+    tmp_path, monkeypatch, capsys, run_cli, write_file
+):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "a.py", "a = 1\n")
+    (tmp_path / ".xtrshow_manifest").write_text("a.py\n")
+
+    run_cli(["--update"])
+    assert "Updating 1 file(s) from manifest" in capsys.readouterr().err
+
+    data = json.loads((tmp_path / ".xtrshow_manifest").read_text())
+    assert data["version"] == 2
+    assert data["files"][0]["path"] == "a.py"
+    assert data["files"][0]["lines"] == 1
+
+    run_cli(["--update"])
+    assert "Updating 1 file(s) (6 B) from manifest" in capsys.readouterr().err
+
+
+def test_recently_modified_files_are_rehashed(
+    tmp_path, monkeypatch, capsys, run_cli, write_file
+):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "a.py", "a = 1\n", mtime=time.time())
+    run_cli([], ["a.py"])
+    capsys.readouterr()
+    hashed = []
+    real_fingerprint = manifest.file_fingerprint
+    monkeypatch.setattr(
+        manifest,
+        "file_fingerprint",
+        lambda path, st=None: hashed.append(path) or real_fingerprint(path, st),
+    )
+
+    run_cli(["--delta"])
+
+    # Rehashed rather than trusted, and found to be the same
+    assert hashed == ["a.py"]
+    assert _exported(capsys.readouterr()[0]) == []
+
+
+def _no_hashing(monkeypatch):
+    hashed = []
+    real_fingerprint = manifest.file_fingerprint
+    monkeypatch.setattr(
+        manifest,
+        "file_fingerprint",
+        lambda path, st=None: hashed.append(path) or real_fingerprint(path, st),
+    )
+    return hashed
+
+
+def test_plain_export_hashes_what_it_reads(tmp_path, monkeypatch, run_cli, write_file):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "a.py", "a = 1\nb = 2\n")
+    hashed = _no_hashing(monkeypatch)
+
+    run_cli(["--no-cache"], ["a.py"])
+    run_cli(["--update"])
+
+    assert hashed == []
+    entry = json.loads((tmp_path / ".xtrshow_manifest").read_text())["files"][0]
+    assert entry["hash"] == manifest.file_fingerprint("a.py")["hash"]
+    assert entry["lines"] == 2
+
+
+def test_binaries_are_fingerprinted_from_their_stat(
+    tmp_path, monkeypatch, capsys, run_cli
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "blob.bin").write_bytes(b"\0" * 100_000)
+    hashed = _no_hashing(monkeypatch)
+
+    run_cli([], ["blob.bin"])
+    entry = json.loads((tmp_path / ".xtrshow_manifest").read_text())["files"][0]
+    assert "hash" not in entry and entry["size"] == 100_000
+
+    (tmp_path / "blob.bin").write_bytes(b"\0" * 100_001)
+    run_cli(["--delta"])
+    assert hashed == []
+    assert "Delta: 1 changed, 0 unchanged" in capsys.readouterr().err
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,115 @@
+# ./tests/test_cli_export_stream.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import io
+import tracemalloc
+
+from xtrshow.cli import format_block, iter_export_blocks, write_export
+
+EXPECTED = """
+--- a/a.py
++++ b/a.py
+``` py
+1:x = 1
+2:y = 2
+```
+
+\n--- a/b.txt
++++ b/b.txt
+``` txt
+1:b
+```
+"""
+
+
+def _make_files(root):
+    (root / "a.py").write_bytes(b"x = 1\r\ny = 2\r\n")
+    (root / "b.txt").write_text("b")
+
+
+def test_stdout_export_matches_joined_blocks(tmp_path, monkeypatch, capsys, run_cli):
+    monkeypatch.chdir(tmp_path)
+    _make_files(tmp_path)
+
+    run_cli([], ["a.py", "missing.py", "b.txt"])
+
+    out, err = capsys.readouterr()
+    assert out == EXPECTED + "\n"
+    assert "# File: missing.py (Error:" in err
+
+
+def test_outfile_export_has_no_trailing_newline(tmp_path, monkeypatch, run_cli):
+    monkeypatch.chdir(tmp_path)
+    _make_files(tmp_path)
+
+    run_cli(["-o", "out.md"], ["a.py", "b.txt"])
+
+    assert (tmp_path / "out.md").read_text() == EXPECTED
+
+
+def test_write_export_separates_like_join():
+    blocks = [("a", "\nA\n"), ("b", "\nB\n"), ("c", "\nC\n")]
+    out = io.StringIO()
+
+    assert write_export(iter(blocks), out) == 3
+    assert out.getvalue() == "\n".join(b for _, b in blocks)
+    assert write_export(iter([]), io.StringIO()) == 0
+
+
+def test_blocks_are_read_one_file_at_a_time(tmp_path, run_cli):
+    for name in ("1.py", "2.py"):
+        (tmp_path / name).write_text("pass\n")
+    paths = [str(tmp_path / "1.py"), str(tmp_path / "2.py")]
+    blocks = iter_export_blocks(paths)
+
+    (tmp_path / "2.py").write_text("changed\n")
+    first = next(blocks)
+    (tmp_path / "2.py").write_text("changed again\n")
+
+    assert first == (paths[0], format_block(paths[0], "pass\n"))
+    assert "1:changed again" in next(blocks)[1]
+
+
+def _export_peak(run_cli, tmp_path, count):
+    line = "x = 'some representative line of source code'\n"
+    selection = []
+    for i in range(count):
+        (tmp_path / f"f{i}.py").write_text(line * 5000)  # ~240 KB each
+        selection.append(f"f{i}.py")
+
+    tracemalloc.start()
+    try:
+        run_cli(["-o", "out.md"], selection)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def test_export_memory_does_not_grow_with_selection(tmp_path, monkeypatch, run_cli):
+    """Peak memory tracks the largest file, not the whole selection"""
+    (tmp_path / "small").mkdir()
+    (tmp_path / "large").mkdir()
+
+    monkeypatch.chdir(tmp_path / "small")
+    small = _export_peak(run_cli, tmp_path / "small", 5)
+    monkeypatch.chdir(tmp_path / "large")
+    large = _export_peak(run_cli, tmp_path / "large", 40)
+
+    # Eight times the data, about the same footprint (one file is ~240 KB)
+    assert large < small * 1.5
+    assert large < 4 * 1024 * 1024
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
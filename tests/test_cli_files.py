@@ -0,0 +1,53 @@
+# ./tests/test_cli_files.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_text("def f():\n    return 1\n\n\ndef g():\n    pass\n")
+    (tmp_path / "b.txt").write_text("one\ntwo\n")
+    return tmp_path
+
+
+def test_files_export_without_the_tui(project, capsys, run_cli):
+    tui = run_cli(["--files", "b.txt", "a.py:5-6", "a.py::f"])
+
+    assert not tui.called
+    out = capsys.readouterr().out
+    assert "1:one\n2:two\n" in out
+    assert "5:def g():\n6:    pass\n" in out
+    assert "1:def f():\n2:    return 1\n" in out
+
+
+def test_files_leave_the_manifest_alone(project, run_cli):
+    assert not run_cli(["--files", "a.py:1-2", "-o", "out.md"]).called
+
+    assert (project / "out.md").exists()
+    assert not (project / ".xtrshow_manifest").exists()
+
+
+def test_files_reject_bad_specs(project, capsys, run_cli):
+    with pytest.raises(SystemExit) as e:
+        run_cli(["--files", "a.py:6-2"])
+    assert e.value.code == 2
+    assert "range ends before it starts" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        run_cli(["--files", "a.py", "--update"])
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,87 @@
+# ./tests/test_cli_headless.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+from unittest.mock import patch
+
+import pytest
+
+import xtrshow.cli as cli
+from xtrshow.cli import main
+
+
+def _run(argv):
+    with patch("sys.argv", ["xtrshow"] + argv):
+        main()
+
+
+@pytest.fixture(scope="module")
+def big_tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("repo")
+    for d in range(200):
+        sub = root / "pkg" / f"d{d}"
+        sub.mkdir(parents=True)
+        for f in range(25):
+            (sub / f"f{f}.py").write_text("x = 1\n")
+    (root / "a.py").write_text("a = 1\n")
+    (root / "b.py").write_text("b = 1\n")
+    return root
+
+
+@pytest.fixture
+def big_repo(big_tree, monkeypatch):
+    """A wide tree around a two-file manifest"""
+    monkeypatch.chdir(big_tree)
+    (big_tree / ".xtrshow_manifest").write_text("a.py\nb.py\n")
+    return big_tree
+
+
+@pytest.fixture
+def no_listing(monkeypatch):
+    """Fail the test if anything lists a directory or opens the TUI"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the tree was built")
+
+    monkeypatch.setattr(cli, "build_file_tree", fail)
+    monkeypatch.setattr(cli, "ScanCache", fail)
+    monkeypatch.setattr("xtrshow.watch.create_watcher", fail)
+    monkeypatch.setattr(cli.curses, "wrapper", fail)
+    monkeypatch.setattr(os, "scandir", fail)
+    monkeypatch.setattr(os, "listdir", fail)
+
+
+def test_update_does_not_build_the_tree(big_repo, no_listing, capsys):
+    _run(["--update"])
+    out = capsys.readouterr().out
+    assert "+++ b/a.py" in out
+    assert "+++ b/b.py" in out
+
+
+def test_delta_does_not_build_the_tree(big_repo, no_listing, capsys):
+    _run(["--delta"])
+    assert "Delta: 2 changed" in capsys.readouterr().err
+
+
+def test_prompt_does_not_build_the_tree(big_repo, no_listing, capsys):
+    _run(["--prompt"])
+    assert capsys.readouterr().out
+
+
+def test_update_ignores_an_unreadable_directory_argument(big_repo, capsys):
+    _run(["--update", str(big_repo / "missing")])
+    assert "+++ b/a.py" in capsys.readouterr().out
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
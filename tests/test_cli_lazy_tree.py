@@ -0,0 +1,88 @@
+# ./tests/test_cli_lazy_tree.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+from xtrshow.cli import (
+    build_file_tree,
+    flatten_tree,
+    select_all_in_directory,
+    DEFAULT_IGNORE,
+)
+
+
+@pytest.fixture
+def tree(src_tree):
+    """src_tree plus a node_modules/ the default ignores hide"""
+    (src_tree / "node_modules" / "dep").mkdir(parents=True)
+    return src_tree
+
+
+def _names(node):
+    return [n.path.name for n in flatten_tree(node, visible_only=False)]
+
+
+def test_lazy_tree_lists_only_the_root(tree):
+    """Only the top level is listed until a directory is asked for"""
+    root, hidden = build_file_tree(tree, ignore_patterns=DEFAULT_IGNORE, lazy=True)
+
+    assert [c.path.name for c in root.children] == ["src", "README.md"]
+    src = root.children[0]
+    assert src.is_dir
+    assert not src.loaded
+    assert not src.children
+    assert hidden == 1  # node_modules
+
+    src.load_children()
+    assert src.loaded
+    assert [c.path.name for c in src.children] == ["pkg", "main.py"]
+    assert not src.children[0].loaded
+
+
+def test_lazy_tree_matches_eager_tree_once_loaded(tree):
+    """Loading everything lazily produces the same tree as an eager build"""
+    eager, eager_hidden = build_file_tree(tree, ignore_patterns=DEFAULT_IGNORE)
+    lazy, _ = build_file_tree(tree, ignore_patterns=DEFAULT_IGNORE, lazy=True)
+
+    lazy.loader.load_all(lazy)
+
+    assert _names(lazy) == _names(eager)
+    assert lazy.loader.hidden_count == eager_hidden
+
+
+def test_select_all_loads_unlisted_directories(tree):
+    """'Select all' on a never-expanded directory still reaches every file"""
+    root, _ = build_file_tree(tree, ignore_patterns=DEFAULT_IGNORE, lazy=True)
+    src = root.children[0]
+
+    count = select_all_in_directory(src, selected=True)
+
+    assert count == 2
+    selected = [
+        n.path.name
+        for n in flatten_tree(root, visible_only=False)
+        if n.selected and not n.is_dir
+    ]
+    assert sorted(selected) == ["main.py", "mod.py"]
+
+
+def test_lazy_tree_respects_max_depth(tree):
+    """Directories at the depth limit are never listed"""
+    root, _ = build_file_tree(tree, max_depth=1, lazy=True)
+    src = [c for c in root.children if c.path.name == "src"][0]
+
+    assert not src.load_children()
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,53 @@
+# ./tests/test_cli_parallel_scan.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+from xtrshow.cli import build_file_tree, flatten_tree, DEFAULT_IGNORE
+
+
+def test_parallel_tree_matches_serial_tree(tmp_path, make_wide_tree, shape):
+    """A pooled walk builds exactly the tree a serial walk does"""
+    make_wide_tree(tmp_path, width=4, files=3)
+    serial, serial_hidden = build_file_tree(tmp_path, ignore_patterns=DEFAULT_IGNORE)
+    parallel, parallel_hidden = build_file_tree(
+        tmp_path, ignore_patterns=DEFAULT_IGNORE, jobs=8
+    )
+
+    assert shape(parallel) == shape(serial)
+    assert parallel_hidden == serial_hidden == 4
+
+
+def test_parallel_load_all_finishes_partially_loaded_tree(
+    tmp_path, make_wide_tree, shape
+):
+    """Directories already opened in the TUI are walked through, not re-listed"""
+    make_wide_tree(tmp_path, width=4, files=3)
+    serial, _ = build_file_tree(tmp_path)
+    lazy, _ = build_file_tree(tmp_path, lazy=True, jobs=4)
+    lazy.children[1].load_children()
+
+    lazy.loader.load_all(lazy)
+
+    assert shape(lazy) == shape(serial)
+
+
+def test_parallel_tree_respects_max_depth(tmp_path, make_wide_tree, shape):
+    make_wide_tree(tmp_path, width=4, files=3)
+    serial, _ = build_file_tree(tmp_path, max_depth=2)
+    parallel, _ = build_file_tree(tmp_path, max_depth=2, jobs=3)
+
+    assert shape(parallel) == shape(serial)
+    assert max(n.depth for n in flatten_tree(parallel, visible_only=False)) == 2
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,183 @@
+# ./tests/test_cli_renderer.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+import xtrshow.cli as cli
+from xtrshow.cli import TreeRenderer, VisibleRows, build_file_tree, set_selected
+
+HIGHLIGHT, SELECTED, STATUS = 1, 2, 3
+
+
+class FakeScreen:
+    """Just enough of a curses window to count what gets painted"""
+
+    def __init__(self, height=12, width=60):
+        self.size = (height, width)
+        self.painted = []
+        self.clears = 0
+        self.touched = 0
+
+    def getmaxyx(self):
+        return self.size
+
+    def move(self, y, x):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def addstr(self, y, x, text, attr=0):
+        self.painted.append((y, text, attr))
+
+    def clear(self):
+        self.clears += 1
+
+    def touchwin(self):
+        self.touched += 1
+
+    def noutrefresh(self):
+        pass
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli.curses, "doupdate", lambda: None)
+    for i in range(5):
+        (tmp_path / f"file{i}.txt").write_text("x")
+    root, _ = build_file_tree(tmp_path)
+    return root, VisibleRows(root)
+
+
+def _frame(renderer, screen, rows, idx, status="status"):
+    screen.painted = []
+    renderer.draw(rows, idx, 0, status, "help")
+    return screen.painted
+
+
+def test_first_frame_paints_everything(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen, HIGHLIGHT, SELECTED, STATUS)
+
+    painted = _frame(renderer, screen, rows, 0)
+
+    assert [y for y, _, _ in painted] == [0, 1, 2, 3, 4, 5, 9, 10, 11]
+    assert painted[0][2] == HIGHLIGHT
+    assert renderer.last_frame_bytes == sum(len(t.encode()) for _, t, _ in painted)
+    assert renderer.last_frame_ms >= 0
+
+
+def test_cursor_move_repaints_two_rows(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen, HIGHLIGHT, SELECTED, STATUS)
+    _frame(renderer, screen, rows, 0)
+
+    painted = _frame(renderer, screen, rows, 1)
+
+    assert [(y, attr) for y, _, attr in painted] == [(0, 0), (1, HIGHLIGHT)]
+    assert screen.clears == 1  # only the very first frame
+
+
+def test_unchanged_frame_paints_nothing(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen)
+    _frame(renderer, screen, rows, 0)
+
+    assert _frame(renderer, screen, rows, 0) == []
+    assert renderer.last_frame_bytes == 0
+
+
+def test_selection_change_repaints_row_and_status(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen, HIGHLIGHT, SELECTED, STATUS)
+    _frame(renderer, screen, rows, 0)
+
+    set_selected(rows[2])
+    painted = _frame(renderer, screen, rows, 0, status="1 selected")
+
+    assert [y for y, _, _ in painted] == [2, 9]
+    assert "[×]" in painted[0][1]
+    assert painted[0][2] == SELECTED
+
+
+def test_display_lines_are_cached(tree, monkeypatch):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen)
+    _frame(renderer, screen, rows, 0)
+
+    calls = []
+    real = cli.FileNode.get_display_line
+    monkeypatch.setattr(
+        cli.FileNode, "get_display_line", lambda n: calls.append(n) or real(n)
+    )
+    _frame(renderer, screen, rows, 1)
+    assert calls == []
+
+    set_selected(rows[3])
+    _frame(renderer, screen, rows, 1)
+    assert calls == [rows[3]]
+
+
+def test_size_and_binary_changes_redraw_the_line(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen)
+    _frame(renderer, screen, rows, 0)
+
+    rows[2].size = root.loader.max_file_size + 1
+    rows[3].binary = True
+    painted = _frame(renderer, screen, rows, 0)
+
+    assert [y for y, _, _ in painted] == [2, 3]
+    assert "📦 file1.txt (" in painted[0][1]
+    assert "📦 file2.txt (binary)" in painted[1][1]
+
+
+def test_only_the_last_frame_stays_cached(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen)
+    _frame(renderer, screen, rows, 0)
+    gone = rows[5]
+
+    gone.path.unlink()
+    assert root.loader.refresh(root)
+    rows.rebuild(root)
+    _frame(renderer, screen, rows, 0)
+
+    assert gone not in renderer._lines
+    assert set(renderer._lines) == set(rows[i] for i in range(len(rows)))
+
+
+def test_resize_and_invalidate_repaint_in_full(tree):
+    root, rows = tree
+    screen = FakeScreen()
+    renderer = TreeRenderer(screen)
+    _frame(renderer, screen, rows, 0)
+
+    renderer.invalidate()
+    assert len(_frame(renderer, screen, rows, 0)) == 9
+    assert screen.touched == 1
+
+    screen.size = (14, 80)
+    assert len(_frame(renderer, screen, rows, 0)) == 9
+    assert screen.clears == 2
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,74 @@
+# ./tests/test_cli_scan.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+from pathlib import Path
+
+from xtrshow.cli import (
+    build_file_tree,
+    get_selection_stats,
+    scan_directory,
+    set_selected,
+)
+
+
+def test_scan_directory_records_type_size_and_mtime(tmp_path):
+    """One scandir pass captures everything the tree needs, dirs first"""
+    (tmp_path / "b.txt").write_text("12345")
+    (tmp_path / "a_dir").mkdir()
+    (tmp_path / "a.txt").write_text("1")
+
+    entries = scan_directory(tmp_path)
+
+    assert [e.name for e in entries] == ["a_dir", "a.txt", "b.txt"]
+    assert [e.is_dir for e in entries] == [True, False, False]
+    assert entries[2].size == 5
+    assert entries[2].mtime == os.stat(tmp_path / "b.txt").st_mtime
+    assert entries[0].size == 0
+
+
+def test_scan_directory_unreadable_returns_none(tmp_path):
+    assert scan_directory(tmp_path / "missing") is None
+
+
+def test_scan_directory_keeps_dangling_symlinks(tmp_path):
+    """A broken link is listed as a file instead of aborting the scan"""
+    os.symlink(tmp_path / "nowhere", tmp_path / "broken")
+    (tmp_path / "real.txt").write_text("x")
+
+    entries = scan_directory(tmp_path)
+
+    assert [(e.name, e.is_dir) for e in entries] == [
+        ("broken", False),
+        ("real.txt", False),
+    ]
+
+
+def test_tree_does_not_stat_after_scan(tmp_path, monkeypatch):
+    """Selection stats come from scan-time sizes, not a fresh stat per file"""
+    (tmp_path / "f.txt").write_text("x" * 2048)
+    root, _ = build_file_tree(tmp_path)
+    set_selected(root.children[0])
+
+    def no_stat(self, *args, **kwargs):
+        raise AssertionError(f"unexpected stat of {self}")
+
+    monkeypatch.setattr(Path, "stat", no_stat)
+    monkeypatch.setattr(Path, "is_dir", no_stat)
+
+    assert root.children[0].size == 2048
+    assert get_selection_stats(root) == (1, "2.0 KB")
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,108 @@
+# ./tests/test_cli_scan_cache.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+import time
+
+import xtrshow.cli as cli
+from xtrshow.cli import ScanCache, build_file_tree, flatten_tree
+
+
+def _age(path, seconds=3600):
+    """Push a path's mtime into the past so the cache does not treat it as racy"""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _make_tree(root):
+    for d in ("a", "b", "b/c", "empty"):
+        (root / d).mkdir()
+    (root / "a" / "one.txt").write_text("1")
+    (root / "b" / "c" / "two.txt").write_text("22")
+    for d in ("a", "b/c", "b", "empty", "."):
+        _age(root / d)
+
+
+def _listed_dirs(monkeypatch):
+    listed = []
+    real_scan = cli.scan_directory
+
+    def spy(path, known=None):
+        listed.append(os.path.basename(os.path.abspath(path)))
+        return real_scan(path, known)
+
+    monkeypatch.setattr(cli, "scan_directory", spy)
+    return listed
+
+
+def test_second_scan_is_served_from_cache(tmp_path, monkeypatch, shape):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(tree)
+    cache_file = tmp_path / "cache" / "scan.json"
+
+    cache = ScanCache(cache_file)
+    first, _ = build_file_tree(tree, cache=cache)
+    cache.save()
+    assert cache_file.exists()
+
+    listed = _listed_dirs(monkeypatch)
+    second, _ = build_file_tree(tree, cache=ScanCache(cache_file))
+
+    assert listed == []
+    assert shape(second) == shape(first)
+
+
+def test_only_changed_directories_are_relisted(tmp_path, monkeypatch):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(tree)
+    cache_file = tmp_path / "scan.json"
+
+    cache = ScanCache(cache_file)
+    build_file_tree(tree, cache=cache)
+    cache.save()
+
+    (tree / "b" / "c" / "three.txt").write_text("333")
+    _age(tree / "b" / "c", 60)
+
+    listed = _listed_dirs(monkeypatch)
+    root, _ = build_file_tree(tree, cache=ScanCache(cache_file))
+
+    assert listed == ["c"]
+    names = [n.path.name for n in flatten_tree(root, False)]
+    assert "three.txt" in names
+
+
+def test_recently_modified_directories_are_not_cached(tmp_path):
+    """A directory touched within the racy window is always listed afresh"""
+    (tmp_path / "fresh.txt").write_text("x")
+    cache = ScanCache(tmp_path / "scan.json")
+
+    build_file_tree(tmp_path, cache=cache)
+
+    assert cache.dirs == {}
+    assert not cache.dirty
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    cache_file = tmp_path / "scan.json"
+    cache_file.write_text("{not json")
+
+    cache = ScanCache(cache_file)
+
+    assert cache.dirs == {}
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,108 @@
+# ./tests/test_cli_selection_stats.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+from xtrshow.cli import (
+    build_file_tree,
+    flatten_tree,
+    get_selection_stats,
+    iter_selected_files,
+    select_all_in_directory,
+    set_selected,
+)
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "deep.txt").write_text("x" * 100)
+    (root / "a" / "mid.txt").write_text("x" * 10)
+    (root / "c").mkdir()
+    (root / "c" / "other.txt").write_text("x" * 1000)
+    (root / "top.txt").write_text("x")
+
+
+def _node(root, name):
+    return next(n for n in flatten_tree(root, False) if n.name == name)
+
+
+def _brute_force(root):
+    """What the totals must agree with: a full walk over the tree"""
+    files = [n for n in flatten_tree(root, False) if n.selected and not n.is_dir]
+    return len(files), sum(n.size for n in files)
+
+
+def test_toggle_updates_every_ancestor(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path)
+    deep = _node(root, "deep.txt")
+
+    set_selected(deep)
+    assert (root.sel_count, root.sel_bytes) == (1, 100)
+    assert (_node(root, "a").sel_count, _node(root, "b").sel_bytes) == (1, 100)
+    assert _node(root, "c").sel_count == 0
+
+    set_selected(deep)  # selecting twice must not double count
+    assert root.sel_count == 1
+
+    set_selected(deep, False)
+    assert (root.sel_count, root.sel_bytes) == (0, 0)
+
+
+def test_select_all_merges_with_existing_selection(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, lazy=True)
+    root.loader.load_all(root)
+    set_selected(_node(root, "deep.txt"))
+    set_selected(_node(root, "top.txt"))
+
+    assert select_all_in_directory(_node(root, "a")) == 2
+    assert (root.sel_count, root.sel_bytes) == _brute_force(root) == (3, 111)
+
+    select_all_in_directory(_node(root, "b"), selected=False)
+    assert (root.sel_count, root.sel_bytes) == _brute_force(root) == (2, 11)
+    assert _node(root, "a").sel_count == 1
+
+
+def test_select_all_on_unlisted_directory(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, lazy=True)
+
+    select_all_in_directory(root)
+
+    assert (root.sel_count, root.sel_bytes) == _brute_force(root) == (4, 1111)
+    assert get_selection_stats(root) == (4, "1.1 KB")
+
+
+def test_stats_do_not_walk_the_tree(tmp_path, monkeypatch):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path)
+    select_all_in_directory(root)
+
+    import xtrshow.cli as cli
+
+    monkeypatch.setattr(cli, "flatten_tree", None)
+    assert get_selection_stats(root) == (4, "1.1 KB")
+
+
+def test_iter_selected_files_in_tree_order(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path)
+    for name in ("top.txt", "other.txt", "deep.txt"):
+        set_selected(_node(root, name))
+
+    names = [n.name for n in iter_selected_files(root)]
+
+    assert names == ["deep.txt", "other.txt", "top.txt"]
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,70 @@
+# ./tests/test_cli_tree_memory.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import gc
+import tracemalloc
+
+from xtrshow.cli import build_file_tree, flatten_tree
+
+# Measured at ~160 bytes per entry (node, interned name, size and mtime)
+# against ~470 for the dict-and-Path nodes this replaced. The budget leaves
+# headroom for interpreter differences while still catching a regression to
+# per-node dicts or Path objects.
+BYTES_PER_ENTRY_BUDGET = 256
+
+
+def test_nodes_have_no_instance_dict(tmp_path):
+    (tmp_path / "f.txt").write_text("")
+    root, _ = build_file_tree(tmp_path)
+
+    assert not hasattr(root, "__dict__")
+    assert not hasattr(root.children[0], "__dict__")
+
+
+def test_paths_are_rebuilt_from_names(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c.py").write_text("")
+    root, _ = build_file_tree(tmp_path)
+
+    leaf = flatten_tree(root, visible_only=False)[-1]
+
+    assert leaf.name == "c.py"
+    assert leaf.path == tmp_path / "a" / "b" / "c.py"
+    assert root.path == tmp_path
+
+
+def test_memory_per_entry(tmp_path):
+    for d in range(20):
+        sub = tmp_path / f"dir{d}"
+        sub.mkdir()
+        for f in range(100):
+            (sub / f"module_{f}.py").write_text("")
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        root, _ = build_file_tree(tmp_path)
+        gc.collect()
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    entries = len(flatten_tree(root, visible_only=False))
+    per_entry = used / entries
+
+    assert entries == 20 * 100 + 20 + 1
+    assert per_entry < BYTES_PER_ENTRY_BUDGET
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,90 @@
+# ./tests/test_cli_visible_rows.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+from xtrshow.cli import VisibleRows, build_file_tree, flatten_tree
+
+
+def _make_tree(root):
+    for d in ("a/x", "a/y", "b"):
+        (root / d).mkdir(parents=True)
+    for f in ("a/x/1.py", "a/x/2.py", "a/y/3.py", "a/4.py", "b/5.py", "6.py"):
+        (root / f).write_text("")
+
+
+def _row_names(rows):
+    return [n.name for n in rows.nodes]
+
+
+def _index(rows, name):
+    return _row_names(rows).index(name)
+
+
+def test_rows_track_expand_and_collapse(tmp_path):
+    """Every splice leaves the rows identical to a fresh flatten"""
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, lazy=True)
+    rows = VisibleRows(root)
+    assert _row_names(rows)[1:] == ["a", "b", "6.py"]
+
+    rows.expand(_index(rows, "a"))
+    rows.expand(_index(rows, "x"))
+    rows.expand(_index(rows, "b"))
+    assert rows.nodes == flatten_tree(root, visible_only=True)
+    assert _row_names(rows)[1:] == [
+        "a",
+        "x",
+        "1.py",
+        "2.py",
+        "y",
+        "4.py",
+        "b",
+        "5.py",
+        "6.py",
+    ]
+
+    rows.collapse(_index(rows, "a"))
+    assert rows.nodes == flatten_tree(root, visible_only=True)
+    assert _row_names(rows)[1:] == ["a", "b", "5.py", "6.py"]
+
+    # x stays expanded underneath, so re-expanding a brings its rows back
+    rows.expand(_index(rows, "a"))
+    assert "1.py" in _row_names(rows)
+    assert rows.nodes == flatten_tree(root, visible_only=True)
+
+
+def test_expand_and_collapse_ignore_files(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, lazy=True)
+    rows = VisibleRows(root)
+    before = list(rows.nodes)
+
+    rows.expand(_index(rows, "6.py"))
+    rows.collapse(_index(rows, "6.py"))
+
+    assert rows.nodes == before
+
+
+def test_parent_index(tmp_path):
+    _make_tree(tmp_path)
+    root, _ = build_file_tree(tmp_path, lazy=True)
+    rows = VisibleRows(root)
+    rows.expand(_index(rows, "a"))
+    rows.expand(_index(rows, "x"))
+
+    assert rows.parent_index(_index(rows, "2.py")) == _index(rows, "x")
+    assert rows.parent_index(_index(rows, "4.py")) == _index(rows, "a")
+    assert rows.parent_index(_index(rows, "a")) == 0
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
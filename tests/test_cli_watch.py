@@ -0,0 +1,157 @@
+# ./tests/test_cli_watch.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+
+from xtrshow.cli import (
+    VisibleRows,
+    build_file_tree,
+    flatten_tree,
+    get_selection_stats,
+    select_all_in_directory,
+    set_selected,
+)
+from xtrshow.watch import PollingWatcher
+
+
+def _find(root, name):
+    return next(n for n in flatten_tree(root, visible_only=False) if n.name == name)
+
+
+def test_refresh_patches_children_in_place(src_tree, shape):
+    """Surviving nodes are kept; the result matches a fresh scan"""
+    root, _ = build_file_tree(src_tree)
+    src = _find(root, "src")
+    pkg = _find(root, "pkg")
+
+    (src_tree / "src" / "main.py").unlink()
+    (src_tree / "src" / "zzz.py").write_text("new\n")
+    assert root.loader.refresh(src)
+
+    assert _find(root, "pkg") is pkg
+    assert pkg.loaded and [c.name for c in pkg.children] == ["mod.py"]
+    assert shape(root) == shape(build_file_tree(src_tree)[0])
+    assert not root.loader.refresh(src)  # nothing changed since
+
+
+def test_refresh_keeps_selection_totals_right(src_tree):
+    root, _ = build_file_tree(src_tree)
+    src = _find(root, "src")
+    select_all_in_directory(src, selected=True)
+    set_selected(_find(root, "README.md"), True)
+    assert root.sel_count == 3
+
+    # Grown in place, deleted, and a whole selected directory removed
+    (src_tree / "README.md").write_text("# readme, longer now\n")
+    (src_tree / "src" / "main.py").unlink()
+    (src_tree / "src" / "pkg" / "mod.py").unlink()
+    (src_tree / "src" / "pkg").rmdir()
+    root.loader.refresh(root)
+    root.loader.refresh(src)
+
+    assert root.sel_count == 1
+    assert root.sel_bytes == len("# readme, longer now\n")
+    assert src.sel_count == 0 and src.sel_bytes == 0
+    assert get_selection_stats(root)[0] == 1
+    assert root.loader.file_count == 1
+    assert root.loader.dir_count == 1
+
+
+def test_refresh_only_sniffs_new_and_modified_files(tmp_path, monkeypatch):
+    import xtrshow.cli as cli
+
+    for i in range(20):
+        (tmp_path / f"f{i}.txt").write_text("x\n")
+    (tmp_path / "blob.bin").write_bytes(b"\0binary")
+    root, _ = build_file_tree(tmp_path)
+    sniffed = []
+    real = cli.is_binary_file
+    monkeypatch.setattr(cli, "is_binary_file", lambda p: sniffed.append(p) or real(p))
+
+    with open(tmp_path / "f3.txt", "a") as f:
+        f.write("appended\n")
+    (tmp_path / "new.txt").write_text("new\n")
+    assert root.loader.refresh(root)
+
+    assert sorted(os.path.basename(p) for p in sniffed) == ["f3.txt", "new.txt"]
+    assert _find(root, "blob.bin").binary
+
+
+def test_refresh_handles_a_file_replaced_by_a_directory(src_tree):
+    root, _ = build_file_tree(src_tree)
+    set_selected(_find(root, "README.md"), True)
+
+    (src_tree / "README.md").unlink()
+    (src_tree / "README.md").mkdir()
+    root.loader.refresh(root)
+
+    readme = _find(root, "README.md")
+    assert readme.is_dir and not readme.selected
+    assert root.sel_count == 0
+
+
+def test_watcher_changes_flow_into_tree_and_rows(src_tree, bump_mtime):
+    """apply_changes() re-lists reported directories and rows follow"""
+    watcher = PollingWatcher()
+    root, _ = build_file_tree(src_tree, lazy=True, watcher=watcher)
+    rows = VisibleRows(root)
+    src_idx = [n.name for n in rows].index("src")
+    rows.expand(src_idx)
+    assert len(watcher) == 2  # root and src; pkg is not listed yet
+
+    (src_tree / "src" / "added.py").write_text("pass\n")
+    bump_mtime(src_tree / "src")
+    changed = root.loader.apply_changes()
+    for node in changed:
+        rows.rebuild(node)
+
+    assert [n.name for n in changed] == ["src"]
+    assert rows.nodes == flatten_tree(root)
+    assert "added.py" in [n.name for n in rows]
+
+
+def test_removed_directories_are_unwatched(src_tree):
+    watcher = PollingWatcher()
+    root, _ = build_file_tree(src_tree, watcher=watcher)
+    assert len(watcher) == 3
+
+    (src_tree / "src" / "pkg" / "mod.py").unlink()
+    (src_tree / "src" / "pkg").rmdir()
+    root.loader.refresh(_find(root, "src"))
+
+    assert len(watcher) == 2
+
+
+def test_directory_dropped_before_its_own_refresh(src_tree):
+    """The watcher reports a directory and its deleted child together"""
+    watcher = PollingWatcher()
+    root, _ = build_file_tree(src_tree, watcher=watcher)
+    src = _find(root, "src")
+    pkg = _find(root, "pkg")
+    set_selected(_find(root, "mod.py"), True)
+
+    (src_tree / "src" / "new.py").write_text("pass\n")
+    (src_tree / "src" / "pkg" / "mod.py").unlink()
+    (src_tree / "src" / "pkg").rmdir()
+    watcher.changes = lambda: [src, pkg]
+    changed = root.loader.apply_changes()
+
+    assert changed == [src]
+    assert get_selection_stats(root)[0] == 0
+    assert (root.sel_count, root.sel_bytes) == (0, 0)
+    assert root.loader.file_count == 3
+    assert root.loader.dir_count == 1
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
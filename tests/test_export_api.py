@@ -0,0 +1,91 @@
+# ./tests/test_export_api.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+import subprocess
+import sys
+
+import pytest
+
+import xtrshow.cli as cli
+import xtrshow.export as export
+from xtrshow.export import BlockCache, export_text, iter_export_blocks
+
+
+@pytest.fixture
+def files(tmp_path, write_file):
+    """a.py with CRLF endings, b.txt and a binary blob.bin in tmp_path"""
+    write_file(tmp_path / "a.py", b"x = 1\r\ny = 2\r\n")
+    write_file(tmp_path / "b.txt", "b")
+    (tmp_path / "blob.bin").write_bytes(b"\0\1\2")
+
+
+def test_export_does_not_import_curses():
+    code = (
+        "import sys, xtrshow.export;"
+        "print(any(m == 'curses' or m.startswith('_curses') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        # The source tree, which need not be installed
+        cwd=os.path.dirname(os.path.dirname(export.__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_export_text_matches_the_cli_outfile(files, tmp_path, monkeypatch, run_cli):
+    monkeypatch.chdir(tmp_path)
+    selection = ["a.py", "blob.bin", "b.txt"]
+    run_cli(["-o", "out.md"], selection)
+
+    assert export_text(selection) == (tmp_path / "out.md").read_text()
+    assert export_text(selection, jobs=3) == (tmp_path / "out.md").read_text()
+
+
+def test_blocks_come_in_order_with_paths(files, tmp_path, capsys):
+    paths = [str(tmp_path / n) for n in ("b.txt", "blob.bin", "a.py")]
+    problems = []
+
+    blocks = list(
+        iter_export_blocks(paths, clean=True, on_problem=lambda *p: problems.append(p))
+    )
+
+    assert [p for p, _ in blocks] == [paths[0], paths[2]]
+    assert blocks[1][1].endswith("x = 1\ny = 2\n\n```\n")
+    assert problems == [(paths[1], "binary, skipped")]
+    # Reporting is left to the caller
+    assert list(iter_export_blocks(paths, clean=True)) == blocks
+    assert capsys.readouterr().err == ""
+
+
+def test_repeated_exports_in_one_process_reuse_the_cache(files, tmp_path, monkeypatch):
+    paths = [str(tmp_path / "a.py"), str(tmp_path / "b.txt")]
+    cache = BlockCache(tmp_path / "cache")
+    first = export_text(paths, cache=cache)
+
+    monkeypatch.setattr(export, "format_block", None)
+    for _ in range(3):
+        assert export_text(paths, cache=cache) == first
+    assert cache.hits == 6
+
+
+def test_cli_reexports_the_api():
+    for name in ("format_block", "iter_export_blocks", "write_block", "write_export"):
+        assert getattr(cli, name) is getattr(export, name)
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,198 @@
+# ./tests/test_export_block_cache.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import io
+import os
+import time
+
+import pytest
+
+import xtrshow.export as export
+from xtrshow.export import BlockCache, iter_export_blocks, write_export
+
+
+def _export(paths, cache=None, clean=False, jobs=1, on_problem=None):
+    out = io.StringIO()
+    blocks = iter_export_blocks(
+        paths, clean=clean, jobs=jobs, cache=cache, on_problem=on_problem
+    )
+    write_export(blocks, out)
+    return out.getvalue()
+
+
+@pytest.fixture
+def files(tmp_path, write_file):
+    return [
+        write_file(tmp_path / "a.py", "def a():\n    return 1\n"),
+        write_file(tmp_path / "b.txt", "one\r\ntwo\rthree"),
+        write_file(tmp_path / "c.md", "naïve ✓\n" * 20),
+        write_file(tmp_path / "empty.py", ""),
+    ]
+
+
+@pytest.mark.parametrize("clean", [False, True])
+def test_cached_export_is_identical(tmp_path, files, clean):
+    cache = BlockCache(tmp_path / "cache")
+    expected = _export(files, clean=clean)
+    assert _export(files, cache, clean=clean) == expected
+    assert _export(files, cache, clean=clean) == expected
+    assert cache.hits == len(files)
+
+
+def test_second_export_skips_reading_and_formatting(tmp_path, files, monkeypatch):
+    cache = BlockCache(tmp_path / "cache")
+    expected = _export(files, cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(export, "format_block", fail)
+    monkeypatch.setattr(export, "is_binary_file", fail)
+    monkeypatch.setattr(cache, "lookup_content", fail)
+    assert _export(files, cache) == expected
+    assert _export(files, cache, jobs=3) == expected
+
+
+def test_touched_file_is_found_by_content(tmp_path, files, monkeypatch, an_hour_ago):
+    cache = BlockCache(tmp_path / "cache")
+    expected = _export(files, cache)
+    os.utime(files[0], (an_hour_ago + 60, an_hour_ago + 60))
+
+    formatted = []
+    real_format_block = export.format_block
+    monkeypatch.setattr(
+        export,
+        "format_block",
+        lambda path, *a: formatted.append(path) or real_format_block(path, *a),
+    )
+    assert _export(files, cache) == expected
+    assert formatted == []
+
+
+def test_modified_file_is_reformatted(tmp_path, files, write_file, an_hour_ago):
+    cache = BlockCache(tmp_path / "cache")
+    _export(files, cache)
+    write_file(tmp_path / "a.py", "def a():\n    return 2\n", mtime=an_hour_ago + 60)
+    out = _export(files, cache)
+    assert "2:    return 2" in out
+    assert out == _export(files)
+
+
+def test_numbered_and_clean_blocks_are_kept_apart(tmp_path, files):
+    cache = BlockCache(tmp_path / "cache")
+    numbered = _export(files, cache)
+    clean = _export(files, cache, clean=True)
+    assert numbered != clean
+    assert _export(files, cache) == numbered
+    assert _export(files, cache, clean=True) == clean
+
+
+def test_same_content_under_another_path_gets_its_own_block(tmp_path, write_file):
+    cache = BlockCache(tmp_path / "cache")
+    first = write_file(tmp_path / "first.py", "x = 1\n")
+    second = write_file(tmp_path / "second.py", "x = 1\n")
+    out = _export([first, second], cache)
+    assert out == _export([first, second])
+    assert f"+++ b/{second}" in out
+
+
+def test_recently_modified_files_are_not_trusted_by_stat(tmp_path, write_file):
+    cache = BlockCache(tmp_path / "cache")
+    path = write_file(tmp_path / "fresh.py", "x = 1\n", mtime=time.time())
+    _export([path], cache)
+    assert cache.stats == {}
+    assert len(cache.blocks) == 1
+
+
+def test_binary_and_unreadable_files_are_not_cached(tmp_path):
+    cache = BlockCache(tmp_path / "cache")
+    binary = tmp_path / "blob.bin"
+    binary.write_bytes(b"\x00\x01" * 10)
+    bad = tmp_path / "bad.txt"
+    bad.write_bytes(b"\xff\xfe\xfa")
+    missing = str(tmp_path / "missing.txt")
+
+    problems = []
+    paths = [str(binary), str(bad), missing]
+    assert _export(paths, cache, on_problem=lambda *p: problems.append(p)) == ""
+    assert [path for path, _ in problems] == paths
+    assert problems[0][1] == "binary, skipped"
+    assert problems[1][1].startswith("Error:")
+    assert problems[2][1].startswith("Error: [Errno 2]")
+    assert cache.blocks == {}
+
+
+def test_least_recently_used_blocks_are_evicted(tmp_path, write_file):
+    paths = [write_file(tmp_path / f"f{i}.py", f"{i}\n" * 100) for i in range(6)]
+    one = len(_export(paths[:1]).encode())
+    cache = BlockCache(tmp_path / "cache", max_bytes=one * 3 + 10)
+
+    expected = _export(paths)
+    assert _export(paths, cache) == expected
+    assert len(cache.blocks) == 3
+    assert sum(size for size, _ in cache.blocks.values()) <= cache.max_bytes
+    # Stat entries of evicted blocks go with them, and so do the files
+    assert set(cache.stats.values()) == set(cache.blocks)
+    blobs = [p for p in (tmp_path / "cache").rglob("*") if p.is_file()]
+    assert len([p for p in blobs if p.name != ".gitignore"]) == 3
+    assert _export(paths, cache) == expected
+
+
+def test_eviction_follows_use_not_insertion(tmp_path, write_file):
+    paths = [write_file(tmp_path / f"f{i}.py", f"{i}\n" * 100) for i in range(4)]
+    one = len(_export(paths[:1]).encode())
+    cache = BlockCache(tmp_path / "cache", max_bytes=one * 3 + 10)
+    _export(paths[:3], cache)
+    _export(paths[:1], cache)  # f0 is now the most recently used
+    _export(paths[3:], cache)
+
+    assert cache.lookup(paths[0], os.stat(paths[0]), False) is not None
+    assert cache.lookup(paths[1], os.stat(paths[1]), False) is None
+    assert cache.total_bytes == sum(size for size, _ in cache.blocks.values())
+
+    cache.save()
+    reloaded = BlockCache(tmp_path / "cache", max_bytes=cache.max_bytes)
+    assert reloaded.total_bytes == cache.total_bytes
+    assert list(reloaded.blocks) == list(cache.blocks)
+
+
+def test_cache_persists_across_runs(tmp_path, files, monkeypatch):
+    expected = _export(files)
+    cache = BlockCache(tmp_path / "cache")
+    _export(files, cache)
+    cache.save()
+    assert (tmp_path / "cache" / ".gitignore").exists()
+
+    reloaded = BlockCache(tmp_path / "cache")
+    monkeypatch.setattr(export, "format_block", None)
+    assert _export(files, reloaded) == expected
+    assert reloaded.hits == len(files)
+
+
+def test_missing_blob_is_a_miss(tmp_path, files):
+    cache = BlockCache(tmp_path / "cache")
+    expected = _export(files, cache)
+    for name in list(cache.blocks):
+        cache._blob(name).unlink()
+    assert _export(files, cache) == expected
+
+
+def test_corrupt_index_is_ignored(tmp_path, files):
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "index.json").write_text("{not json")
+    cache = BlockCache(tmp_path / "cache")
+    assert _export(files, cache) == _export(files)
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,107 @@
+# ./tests/test_export_dedup.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+import xtrshow.export as export
+from xtrshow.export import export_text, iter_export_blocks
+
+SOURCE = "def f():\n    return 1\n"
+
+
+@pytest.fixture
+def vendored(tmp_path, monkeypatch):
+    """A package, a vendored copy of it, and one file that differs"""
+    monkeypatch.chdir(tmp_path)
+    for root in ("pkg", "vendor/pkg"):
+        (tmp_path / root).mkdir(parents=True)
+        (tmp_path / root / "a.py").write_text(SOURCE)
+        (tmp_path / root / "b.py").write_text(f"# {root}\n")
+    return ["pkg/a.py", "pkg/b.py", "vendor/pkg/a.py", "vendor/pkg/b.py"]
+
+
+def test_later_copies_become_references(vendored):
+    blocks = dict(iter_export_blocks(vendored, dedup=True))
+
+    assert blocks["pkg/a.py"] == export.format_block("pkg/a.py", SOURCE)
+    assert blocks["vendor/pkg/a.py"] == (
+        "\n# File: vendor/pkg/a.py (identical to pkg/a.py)\n"
+    )
+    assert blocks["vendor/pkg/b.py"].startswith("\n--- a/vendor/pkg/b.py")
+
+
+def test_without_dedup_every_copy_is_exported(vendored):
+    text = export_text(vendored)
+    assert text.count("return 1") == 2
+    assert "identical to" not in text
+
+
+def test_same_listing_counts_as_identical(vendored, tmp_path):
+    (tmp_path / "crlf.py").write_bytes(SOURCE.replace("\n", "\r\n").encode())
+    text = export_text(["pkg/a.py", "crlf.py"], dedup=True)
+    assert "# File: crlf.py (identical to pkg/a.py)" in text
+
+
+@pytest.mark.parametrize("clean", [False, True])
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_dedup_output_matches_across_modes(vendored, tmp_path, clean, jobs):
+    cache = export.BlockCache(tmp_path / "cache")
+    expected = export_text(vendored, clean=clean, dedup=True)
+    assert export_text(vendored, clean=clean, jobs=jobs, dedup=True) == expected
+    assert export_text(vendored, clean=clean, cache=cache, dedup=True) == expected
+    assert export_text(vendored, clean=clean, cache=cache, dedup=True) == expected
+    assert expected.count("return 1") == 1
+
+
+def test_mapped_files_are_deduplicated(vendored, monkeypatch):
+    monkeypatch.setattr(export, "MMAP_THRESHOLD", 1)
+    opened = []
+    monkeypatch.setattr(
+        export,
+        "open",
+        lambda path, *args: opened.append(path) or open(path, *args),
+        raising=False,
+    )
+    text = export_text(vendored, dedup=True)
+    assert text.count("return 1") == 1
+    assert "# File: vendor/pkg/a.py (identical to pkg/a.py)" in text
+    assert "# File: vendor/pkg/b.py (identical" not in text
+    # Digested in the counting pass: sniffed, counted, then written if need be
+    assert opened.count("pkg/a.py") == 3
+    assert opened.count("vendor/pkg/a.py") == 2
+
+
+def test_skipped_files_take_no_part(vendored, tmp_path, capsys):
+    (tmp_path / "blob.bin").write_bytes(b"\0" * 4)
+    (tmp_path / "blob2.bin").write_bytes(b"\0" * 4)
+    paths = ["blob.bin", "missing.py", "pkg/a.py", "blob2.bin", "vendor/pkg/a.py"]
+    blocks = list(iter_export_blocks(paths, dedup=True))
+    assert [p for p, _ in blocks] == ["pkg/a.py", "vendor/pkg/a.py"]
+    assert "identical to pkg/a.py" in blocks[1][1]
+
+
+def test_cli_dedup(vendored, capsys, run_cli):
+    run_cli(["--dedup"], vendored)
+    out = capsys.readouterr().out
+    assert out.count("return 1") == 1
+    assert "# File: vendor/pkg/a.py (identical to pkg/a.py)\n" in out
+
+
+def test_cli_dedup_multi(vendored, tmp_path, run_cli):
+    run_cli(["--dedup", "--multi", "out"], vendored)
+    reference = tmp_path / "out" / "vendor__pkg__a.py.xtr.md"
+    assert reference.read_text() == "# File: vendor/pkg/a.py (identical to pkg/a.py)"
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,109 @@
+# ./tests/test_export_mmap.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import io
+import random
+
+import pytest
+
+import xtrshow.export as export
+from xtrshow.export import iter_export_blocks, write_block, write_export
+
+SAMPLES = {
+    "plain": "def f():\n    return 1\n" * 40,
+    "no_final_newline": "a\nb\nc",
+    "crlf": "one\r\ntwo\r\n\r\nthree\r\n" * 10,
+    "lone_cr": "mac\rstyle\rlines\r" * 10,
+    "mixed": "a\r\nb\rc\nd\x0ce\x1cf g\x85h" * 7,
+    "unicode": "naïve café ✓ 日本語\n" * 25,
+    "blank_lines": "\n\n\nx\n\n",
+    "ten_lines": "".join(f"{i}\n" for i in range(10)),
+}
+
+
+@pytest.fixture
+def mapped(monkeypatch):
+    """Send every file through the mmap reader, in awkwardly small pieces"""
+    monkeypatch.setattr(export, "MMAP_THRESHOLD", 1)
+    return monkeypatch
+
+
+def _export(paths, clean=False):
+    out = io.StringIO()
+    write_export(iter_export_blocks(paths, clean=clean), out)
+    return out.getvalue()
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("clean", [False, True])
+@pytest.mark.parametrize("chunk", [1, 2, 3, 7, 64, 1 << 20])
+def test_mapped_export_matches_regular_read(tmp_path, monkeypatch, chunk, clean):
+    paths = [_write(tmp_path, name + ".txt", text) for name, text in SAMPLES.items()]
+    expected = _export(paths, clean)
+
+    monkeypatch.setattr(export, "MMAP_THRESHOLD", 1)
+    monkeypatch.setattr(export, "MMAP_CHUNK_SIZE", chunk)
+    blocks = list(iter_export_blocks(paths, clean=clean))
+
+    assert all(not isinstance(block, str) for _, block in blocks)
+    assert _export(paths, clean) == expected
+
+
+def test_mapped_export_random_content(tmp_path, monkeypatch):
+    rng = random.Random(7)
+    alphabet = ["a", "b", " ", "\n", "\r", "\r\n", "é", "✓", "\x0b", " "]
+    paths = [
+        _write(tmp_path, f"r{i}.txt", "".join(rng.choices(alphabet, k=500)))
+        for i in range(20)
+    ]
+    expected = _export(paths)
+
+    monkeypatch.setattr(export, "MMAP_THRESHOLD", 1)
+    monkeypatch.setattr(export, "MMAP_CHUNK_SIZE", 5)
+
+    assert _export(paths) == expected
+
+
+def test_mapped_decode_error_is_reported_before_output(tmp_path, mapped):
+    good = _write(tmp_path, "good.txt", "fine\n")
+    bad = tmp_path / "bad.txt"
+    bad.write_bytes(b"ok\n" * 10 + b"\xff\xfe\n")
+    mapped.setattr(export, "MMAP_CHUNK_SIZE", 4)
+
+    problems = []
+    blocks = iter_export_blocks(
+        [str(bad), good], on_problem=lambda *p: problems.append(p)
+    )
+    assert [p for p, _ in blocks] == [good]
+    assert [(p, why[:6]) for p, why in problems] == [(str(bad), "Error:")]
+
+
+def test_write_block_strip_matches_str_strip(tmp_path, mapped):
+    path = _write(tmp_path, "f.py", SAMPLES["crlf"])
+    mapped.setattr(export, "MMAP_CHUNK_SIZE", 3)
+    ((_, pieces),) = iter_export_blocks([path])
+    mapped.setattr(export, "MMAP_THRESHOLD", 1 << 30)
+    ((_, text),) = iter_export_blocks([path])
+
+    out = io.StringIO()
+    write_block(out, pieces, strip=True)
+    assert out.getvalue() == text.strip()
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
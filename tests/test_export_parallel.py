@@ -0,0 +1,89 @@
+# ./tests/test_export_parallel.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import threading
+
+import xtrshow.export as export
+from xtrshow.export import iter_export_blocks
+
+
+def _make_files(root, count=30):
+    paths = []
+    for i in range(count):
+        path = root / f"f{i:02d}.py"
+        path.write_text("line\n" * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def test_parallel_export_keeps_selection_order(tmp_path):
+    paths = _make_files(tmp_path)
+    (tmp_path / "bin.dat").write_bytes(b"\x00\x01")
+    paths[3:3] = [str(tmp_path / "missing.py"), str(tmp_path / "bin.dat")]
+
+    serial_problems, parallel_problems = [], []
+    serial = list(
+        iter_export_blocks(paths, on_problem=lambda *p: serial_problems.append(p))
+    )
+    parallel = list(
+        iter_export_blocks(
+            paths, jobs=6, on_problem=lambda *p: parallel_problems.append(p)
+        )
+    )
+
+    assert parallel == serial
+    assert len(serial) == 30
+    assert parallel_problems == serial_problems
+    assert [p for p, _ in serial_problems] == paths[3:5]
+
+
+def test_parallel_export_reads_a_bounded_window_ahead(tmp_path, monkeypatch):
+    paths = _make_files(tmp_path)
+    started = []
+    real_export_one = export._export_one
+
+    def spy(path, clean, cache=None):
+        started.append(path)
+        return real_export_one(path, clean, cache)
+
+    monkeypatch.setattr(export, "_export_one", spy)
+    blocks = iter_export_blocks(paths, jobs=3)
+
+    assert next(blocks)[0] == paths[0]
+    assert len(started) <= 3 * 2
+    blocks.close()
+
+
+def test_parallel_export_overlaps_slow_reads(tmp_path, monkeypatch):
+    """Latency-bound reads (network mounts) run concurrently"""
+    paths = _make_files(tmp_path, count=16)
+    real_export_one = export._export_one
+    # Only passable with all 8 workers reading at once; raises
+    # BrokenBarrierError in the worker, and so here, otherwise
+    together = threading.Barrier(8, timeout=30)
+
+    def slow(path, clean, cache=None):
+        if path in paths[:8]:
+            together.wait()
+        return real_export_one(path, clean, cache)
+
+    monkeypatch.setattr(export, "_export_one", slow)
+
+    blocks = list(iter_export_blocks(paths, jobs=8))
+
+    assert [p for p, _ in blocks] == paths
+    assert not together.broken
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
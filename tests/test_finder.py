@@ -0,0 +1,156 @@
+# ./tests/test_finder.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import random
+
+from xtrshow.cli import build_file_tree, build_path_index, set_selected
+from xtrshow.finder import SCORE_POOL, FuzzyFinder, PathIndex, score
+
+PATHS = [
+    "src/xtrshow/cli.py",
+    "src/xtrshow/repatch.py",
+    "tests/test_cli_multi.py",
+    "doc/FEATURES.md",
+    "web/vendor/xtrshow/cli.py",
+    "README.md",
+]
+
+
+def _is_subsequence(query, path):
+    it = iter(path.lower())
+    return all(c in it for c in query.lower())
+
+
+def _ranked(index, query, limit=50):
+    finder = FuzzyFinder(index)
+    finder.set_query(query)
+    return [index.paths[i] for i in finder.results(limit)]
+
+
+def test_exact_file_name_ranks_first():
+    index = PathIndex(PATHS)
+
+    assert _ranked(index, "cli.py")[:2] == [
+        "src/xtrshow/cli.py",
+        "web/vendor/xtrshow/cli.py",
+    ]
+    assert _ranked(index, "readme")[0] == "README.md"
+
+
+def test_fuzzy_subsequence_matches():
+    index = PathIndex(PATHS)
+
+    assert _ranked(index, "rptch") == ["src/xtrshow/repatch.py"]
+    assert _ranked(index, "zzz") == []
+
+
+def test_matches_agree_with_brute_force():
+    rng = random.Random(7)
+    alphabet = "abcde/."
+    paths = sorted(
+        {"".join(rng.choice(alphabet) for _ in range(12)) for _ in range(400)}
+    )
+    index = PathIndex(paths)
+
+    for query in ("a", "ab", "a/b", "e.d", "abcde"):
+        expected = {p for p in paths if _is_subsequence(query, p)}
+        assert set(_ranked(index, query, limit=len(paths))) <= expected
+        # Every true match survives the incremental narrowing
+        finder = FuzzyFinder(index)
+        finder.set_query(query)
+        assert expected <= set(finder.candidates)
+
+
+def test_typing_narrows_to_exactly_the_matches():
+    rng = random.Random(11)
+    alphabet = "abcé/.ß"
+    paths = sorted(
+        {"".join(rng.choice(alphabet) for _ in range(10)) for _ in range(300)}
+    )
+    index = PathIndex(paths)
+    finder = FuzzyFinder(index)
+
+    # Type, backspace and retype so later keystrokes narrow earlier results
+    for keys in ("aé", "\b", "b/", "\b\b", "ß.c"):
+        for key in keys:
+            if key == "\b":
+                finder.pop()
+            else:
+                finder.push(key)
+        query = finder.query
+        expected = {p for p in paths if _is_subsequence(query, p)}
+        found = [index.paths[i] for i in finder.results(limit=len(paths))]
+        assert set(found) == expected
+        assert finder.count == len(finder.candidates)
+        assert finder.count == sum(all(c in p for c in query) for p in paths)
+
+
+def test_file_name_matches_outrank_a_full_pool():
+    deep = ["src/deep/nested/package/module/test.py", "lib/a/b/c/d/e/mytest.py"]
+    paths = [f"test/m{i}.py" for i in range(2000)] + deep
+    index = PathIndex(paths)
+    assert len(paths) > SCORE_POOL
+
+    assert _ranked(index, "test")[:2] == deep
+    finder = FuzzyFinder(index)
+    for c in "tes/m1":
+        finder.push(c)
+    assert index.paths[finder.results()[0]] == "test/m1.py"
+
+
+def test_backspace_restores_previous_candidates():
+    index = PathIndex(PATHS)
+    finder = FuzzyFinder(index)
+    finder.push("c")
+    before = list(finder.candidates)
+
+    finder.push("l")
+    finder.push("q")
+    finder.pop()
+    finder.pop()
+
+    assert finder.query == "c"
+    assert finder.candidates == before
+
+
+def test_score_prefers_file_name_then_contiguous_then_scattered():
+    name = score("a/b/cli.py", "cli")
+    contiguous = score("cli/b/x.py", "cli")
+    scattered = score("c/l/i.py", "cli")
+
+    assert name > contiguous > scattered
+    assert score("abc", "cb") is None
+
+
+def test_path_index_over_tree_toggles_nodes(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x")
+    (tmp_path / "top.txt").write_text("x")
+    root, _ = build_file_tree(tmp_path, lazy=True)
+
+    index = build_path_index(root)
+
+    assert index.paths == ["pkg/mod.py", "top.txt"]
+    node = index.items[_ranked_index(index, "mod")]
+    set_selected(node)
+    assert root.sel_count == 1
+
+
+def _ranked_index(index, query):
+    finder = FuzzyFinder(index)
+    finder.set_query(query)
+    return finder.results(1)[0]
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
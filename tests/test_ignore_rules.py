@@ -0,0 +1,114 @@
+# ./tests/test_ignore_rules.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+from xtrshow.cli import DEFAULT_IGNORE, build_file_tree, flatten_tree
+from xtrshow.ignore import IgnoreMatcher, IgnoreRules
+
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, expected",
+    [
+        ("*.log", "app.log", False, True),
+        ("*.log", "deep/nested/app.log", False, True),
+        ("*.log", "app.log.txt", False, None),
+        ("coverage/", "coverage", True, True),
+        ("coverage/", "coverage", False, None),
+        ("/out", "out", True, True),
+        ("/out", "sub/out", True, None),
+        ("docs/*.md", "docs/a.md", False, True),
+        ("docs/*.md", "docs/x/a.md", False, None),
+        ("**/gen", "a/b/gen", True, True),
+        ("logs/**", "logs/x/y", False, True),
+        ("a/**/b", "a/b", False, True),
+        ("a/**/b", "a/x/y/b", False, True),
+        ("file?.txt", "file1.txt", False, True),
+        ("[abc].py", "b.py", False, True),
+        ("[!abc].py", "b.py", False, None),
+        ("\\#hash", "#hash", False, True),
+        ("# comment", "# comment", False, None),
+    ],
+)
+def test_single_rule(pattern, path, is_dir, expected):
+    assert IgnoreRules([pattern]).match(path, is_dir) is expected
+
+
+def test_last_matching_rule_wins():
+    rules = IgnoreRules(["*.txt", "!keep.txt"])
+    assert rules.match("drop.txt", False) is True
+    assert rules.match("keep.txt", False) is False
+
+    rules = IgnoreRules(["!keep.txt", "*.txt"])
+    assert rules.match("keep.txt", False) is True
+
+
+def test_deeper_ignore_files_override_shallower_ones():
+    root = IgnoreMatcher().with_rules(IgnoreRules(["*.gen"]))
+    sub = root.descend("pkg", IgnoreRules(["!api.gen"]))
+
+    assert root.match("x.gen", False)
+    assert sub.match("x.gen", False)
+    assert not sub.match("api.gen", False)
+
+
+def test_anchored_rules_follow_the_stack_down():
+    root = IgnoreMatcher().with_rules(IgnoreRules(["src/generated/"]))
+    src = root.descend("src")
+
+    assert src.match("generated", True)
+    assert not root.match("generated", True)
+    assert not src.descend("other").match("generated", True)
+
+
+def test_tree_prunes_gitignored_subtrees(tmp_path, monkeypatch):
+    (tmp_path / ".gitignore").write_text("coverage/\n*.tmp\n")
+    (tmp_path / "coverage" / "html").mkdir(parents=True)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / ".ignore").write_text("local_out/\n")
+    (tmp_path / "src" / "local_out").mkdir()
+    (tmp_path / "src" / "main.py").write_text("")
+    (tmp_path / "src" / "scratch.tmp").write_text("")
+    (tmp_path / "pkg.egg-info").mkdir()
+
+    import xtrshow.cli as cli
+
+    listed = []
+    real_scan = cli.scan_directory
+    monkeypatch.setattr(
+        cli,
+        "scan_directory",
+        lambda p, known=None: listed.append(str(p)) or real_scan(p, known),
+    )
+
+    root, hidden = build_file_tree(
+        tmp_path, ignore_patterns=DEFAULT_IGNORE, gitignore=True
+    )
+
+    names = sorted(n.path.name for n in flatten_tree(root, False))
+    assert names == sorted([tmp_path.name, ".gitignore", "src", ".ignore", "main.py"])
+    assert hidden == 4
+    assert not any("coverage" in p or "local_out" in p for p in listed)
+
+
+def test_gitignore_is_off_unless_asked_for(tmp_path):
+    (tmp_path / ".gitignore").write_text("*.txt\n")
+    (tmp_path / "a.txt").write_text("")
+
+    root, _ = build_file_tree(tmp_path)
+
+    assert "a.txt" in [c.path.name for c in root.children]
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
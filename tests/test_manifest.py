@@ -0,0 +1,173 @@
+# ./tests/test_manifest.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import json
+
+import pytest
+
+import xtrshow.manifest as manifest_module
+from xtrshow.manifest import Manifest, file_fingerprint
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"x",
+        b"a\nb\n",
+        b"a\nb",
+        b"a\r\nb\r\n",
+        b"a\rb\rc",
+        b"\n\n\n",
+        b"a\r\n\r\nb",
+        "naïve\n✓".encode("utf-8"),
+    ],
+)
+def test_line_count_matches_export_numbering(tmp_path, data, write_file):
+    path = write_file(tmp_path / "f.txt", data)
+    with open(path) as f:
+        expected = len(f.read().splitlines())
+    assert file_fingerprint(path)["lines"] == expected
+
+
+def test_line_count_across_chunks(tmp_path, monkeypatch, write_file):
+    monkeypatch.setattr(manifest_module, "HASH_CHUNK_SIZE", 3)
+    data = b"ab\r\ncd\r\r\nef\rg\n\r\nh"
+    path = write_file(tmp_path / "f.txt", data)
+    fingerprint = file_fingerprint(path)
+    assert fingerprint["lines"] == len(data.decode().splitlines())
+
+    monkeypatch.setattr(manifest_module, "HASH_CHUNK_SIZE", 1 << 20)
+    assert file_fingerprint(path)["hash"] == fingerprint["hash"]
+
+
+def test_plain_path_list_is_read_as_version_1(tmp_path):
+    (tmp_path / "m").write_text("a.py\n\nsrc/b.py\n")
+    manifest = Manifest(tmp_path / "m")
+    assert manifest.exists
+    assert manifest.version == 1
+    assert manifest.paths == ["a.py", "src/b.py"]
+    assert manifest.files == {}
+    assert manifest.total_size() is None
+
+
+def test_missing_manifest(tmp_path):
+    manifest = Manifest(tmp_path / "m")
+    assert not manifest.exists
+    assert manifest.paths == []
+
+
+def test_round_trip(tmp_path, write_file):
+    a = write_file(tmp_path / "a.py", b"x = 1\ny = 2\n")
+    b = write_file(tmp_path / "b.py", b"z")
+    manifest = Manifest(tmp_path / "m")
+    manifest.select([b, a])
+    manifest.record({p: manifest.fingerprint(p) for p in (a, b)}, {"clean": True})
+    manifest.save()
+
+    data = json.loads((tmp_path / "m").read_text())
+    assert data["version"] == 2
+    assert data["options"] == {"clean": True}
+    assert [f["path"] for f in data["files"]] == [b, a]
+    assert data["files"][1]["size"] == 12
+    assert data["files"][1]["lines"] == 2
+
+    reloaded = Manifest(tmp_path / "m")
+    assert reloaded.version == 2
+    assert reloaded.paths == [b, a]
+    assert reloaded.files == manifest.files
+    assert reloaded.options == {"clean": True}
+    assert reloaded.total_size() == 13
+
+
+def test_upgrade_from_plain_list_keeps_order(tmp_path, write_file):
+    a = write_file(tmp_path / "a.py", b"a\n")
+    (tmp_path / "m").write_text(f"{a}\nmissing.py\n")
+    manifest = Manifest(tmp_path / "m")
+    manifest.record({a: manifest.fingerprint(a)}, {"clean": False})
+    manifest.save()
+
+    reloaded = Manifest(tmp_path / "m")
+    assert reloaded.paths == [a, "missing.py"]
+    assert list(reloaded.files) == [a]
+
+
+def test_unchanged_stat_is_trusted_without_reading(tmp_path, monkeypatch, write_file):
+    a = write_file(tmp_path / "a.py", b"a\n")
+    manifest = Manifest(tmp_path / "m")
+    manifest.select([a])
+    manifest.record({a: manifest.fingerprint(a)}, {})
+    manifest.save()
+
+    def fail(*args):
+        raise AssertionError("read")
+
+    monkeypatch.setattr(manifest_module, "file_fingerprint", fail)
+    reloaded = Manifest(tmp_path / "m")
+    fingerprint = reloaded.fingerprint(a)
+    assert not reloaded.changed(a, fingerprint)
+
+
+def test_changed_content_is_detected(tmp_path, write_file, an_hour_ago):
+    a = write_file(tmp_path / "a.py", b"a\n")
+    manifest = Manifest(tmp_path / "m")
+    manifest.select([a])
+    manifest.record({a: manifest.fingerprint(a)}, {})
+
+    write_file(tmp_path / "a.py", b"b\n", mtime=an_hour_ago + 1)
+    assert manifest.changed(a, manifest.fingerprint(a))
+    assert manifest.fingerprint(str(tmp_path / "gone.py")) is None
+
+
+def test_select_keeps_fingerprints_of_files_still_selected(tmp_path, write_file):
+    a = write_file(tmp_path / "a.py", b"a\n")
+    b = write_file(tmp_path / "b.py", b"b\n")
+    manifest = Manifest(tmp_path / "m")
+    manifest.select([a, b])
+    manifest.record({p: manifest.fingerprint(p) for p in (a, b)}, {})
+
+    manifest.select([b, "c.py"])
+    assert list(manifest.files) == [b]
+    assert manifest.total_size() is None
+
+
+def test_unknown_version_is_not_read_as_paths(tmp_path):
+    (tmp_path / "m").write_text('{"version": 99, "files": []}\n')
+    assert Manifest(tmp_path / "m").paths == []
+
+    (tmp_path / "m").write_text("{odd}.py\n")
+    assert Manifest(tmp_path / "m").paths == ["{odd}.py"]
+
+
+def test_newer_version_is_not_overwritten(tmp_path, capsys):
+    text = '{"version": 99, "files": [{"path": "a.py"}]}\n'
+    (tmp_path / "m").write_text(text)
+    manifest = Manifest(tmp_path / "m")
+    manifest.select(["b.py"])
+    manifest.save()
+    manifest.save()
+
+    assert (tmp_path / "m").read_text() == text
+    assert capsys.readouterr().err.count("newer xtrshow (version 99)") == 1
+
+
+def test_entries_without_a_path_are_skipped(tmp_path):
+    files = [{"size": 1}, {"path": 3}, "b.py", {"path": "a.py", "size": 2}]
+    (tmp_path / "m").write_text(json.dumps({"version": 2, "files": files}))
+    manifest = Manifest(tmp_path / "m")
+    assert manifest.paths == ["a.py"]
+    assert manifest.files == {"a.py": {"size": 2}}
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
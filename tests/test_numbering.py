@@ -0,0 +1,61 @@
+# ./tests/test_numbering.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import pytest
+
+import xtrshow.numbering as numbering
+from xtrshow.numbering import number_lines
+
+
+def _reference(text):
+    lines = text.splitlines()
+    max_ln_width = len(str(len(lines)))
+    return "\n".join(f"{i + 1:>{max_ln_width}}:{line}" for i, line in enumerate(lines))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "\n",
+        "one line, no newline",
+        "a\nb\n",
+        "a\n\n\nb",
+        "mac\rline\rends",
+        "form\x0cfeed\x0bvtab\x1cfs\x85nel ls ps",
+        "unicode ✓ ünïcödé\n日本語\n",
+    ],
+)
+def test_matches_per_line_formatting(text):
+    assert number_lines(text) == _reference(text)
+
+
+@pytest.mark.parametrize("count", [9, 10, 99, 100, 101, 1000])
+def test_widths_at_digit_boundaries(count):
+    text = "".join(f"line {i}\n" for i in range(count))
+    assert number_lines(text) == _reference(text)
+
+
+def test_files_beyond_the_prefix_cache(monkeypatch):
+    monkeypatch.setattr(numbering, "PREFIX_CACHE_LINES", 16)
+    monkeypatch.setattr(numbering, "_prefixes", {})
+    text = "x\n" * 50
+
+    assert number_lines(text) == _reference(text)
+    assert len(numbering._prefixes[2]) == 16
+    # A shorter file afterwards reuses the same cache
+    assert number_lines("y\n" * 12) == _reference("y\n" * 12)
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
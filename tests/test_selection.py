@@ -0,0 +1,188 @@
+# ./tests/test_selection.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+
+import pytest
+
+import xtrshow.selection as selection
+from xtrshow.export import export_text, format_block
+from xtrshow.selection import (
+    Selection,
+    find_symbol,
+    line_index,
+    parse_selection,
+    read_lines,
+)
+
+SOURCE = """\
+import os
+
+
+@decorated
+@twice
+def top():
+    return 1
+
+
+class Loader:
+    def refresh(self):
+        return 2
+
+    class Inner:
+        def refresh(self):
+            return 3
+"""
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "mod.py").write_text(SOURCE)
+    return "mod.py"
+
+
+def test_parse_ranges(source):
+    s = parse_selection("mod.py:3-5")
+    assert (s.path, s.start, s.end, s.symbol) == ("mod.py", 3, 5, None)
+    assert parse_selection("mod.py:4").end == 4
+    assert parse_selection("mod.py:4-").end is None
+    assert str(parse_selection("mod.py:4-")) == "mod.py:4-"
+    assert parse_selection("mod.py::Loader.refresh").symbol == "Loader.refresh"
+
+
+def test_whole_files_stay_paths(tmp_path, source):
+    (tmp_path / "odd:12").write_text("x\n")
+    assert parse_selection("odd:12") == "odd:12"
+    assert parse_selection("mod.py") == "mod.py"
+
+
+def test_backwards_range_is_rejected():
+    with pytest.raises(ValueError, match="ends before it starts"):
+        parse_selection("mod.py:5-3")
+
+
+def test_find_symbol_includes_decorators(source):
+    assert find_symbol(source, "top") == (4, 7)
+    assert find_symbol(source, "Loader") == (10, 16)
+    assert find_symbol(source, "Loader.refresh") == (11, 12)
+    assert find_symbol(source, "Loader.Inner.refresh") == (15, 16)
+    with pytest.raises(ValueError, match="no def or class named Loader.missing"):
+        find_symbol(source, "Loader.missing")
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_lines_are_counted_like_xtrpatch(tmp_path, newline):
+    path = tmp_path / "f.txt"
+    path.write_bytes(newline.join(["one", "two", "three", "four"]).encode())
+    assert len(line_index(path)) - 1 == 4
+    assert read_lines(path, 2, 3) == ["two", "three"]
+    assert read_lines(path, 4, 4) == ["four"]
+    with open(path, newline="") as f:
+        assert len(f.readlines()) == 4
+
+
+def test_index_spans_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(selection, "INDEX_CHUNK_SIZE", 3)
+    selection._line_index.cache_clear()
+    path = tmp_path / "f.txt"
+    text = "alpha\r\nb\r\n\r\ncharlie\rdelta"
+    path.write_bytes(text.encode())
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    index = line_index(path)
+    assert len(index) - 1 == len(lines)
+    assert index[-1] == len(text)
+    assert read_lines(path, 1, len(lines)) == lines
+
+
+def test_index_follows_edits(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("a\nb\n")
+    assert read_lines(path, 2, 2) == ["b"]
+    path.write_text("a\nb\nc\n")
+    os.utime(path, ns=(0, 10**9))
+    assert read_lines(path, 2, 3) == ["b", "c"]
+
+
+def test_large_file_index_is_kept_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(selection, "PERSIST_INDEX_SIZE", 0)
+    scans = []
+    real_scan = selection._scan_lines
+    monkeypatch.setattr(
+        selection, "_scan_lines", lambda p: scans.append(p) or real_scan(p)
+    )
+    path = tmp_path / "big.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 1001)))
+    os.utime(path, ns=(0, 10**9))
+    lines_dir = tmp_path / "cache" / "lines"
+
+    first = line_index(path, lines_dir)
+    selection._line_index.cache_clear()  # as in the next xtrshow run
+    assert line_index(path, lines_dir) == first
+    assert read_lines(path, 700, 702, lines_dir) == [
+        "line 700",
+        "line 701",
+        "line 702",
+    ]
+    assert len(scans) == 1
+
+    path.write_text("changed\n")
+    os.utime(path, ns=(0, 2 * 10**9))
+    selection._line_index.cache_clear()
+    assert read_lines(path, 1, 1, lines_dir) == ["changed"]
+    assert len(scans) == 2
+
+
+def test_export_keeps_indexes_with_its_block_cache(source, monkeypatch):
+    from xtrshow.export import BlockCache
+
+    monkeypatch.setattr(selection, "PERSIST_INDEX_SIZE", 0)
+    os.utime("mod.py", ns=(0, 10**9))
+    selection._line_index.cache_clear()
+    cache = BlockCache("blocks")
+    export_text([Selection("mod.py", 11, 12)], cache=cache)
+    assert len(list((cache.root / "lines").glob("[0-9a-f]*"))) == 1
+
+
+def test_selection_keeps_line_numbers(source):
+    text = export_text([Selection("mod.py", 11, 12)])
+    assert "--- a/mod.py\n+++ b/mod.py\n" in text
+    assert "11:    def refresh(self):\n12:        return 2\n```" in text
+
+    clean = export_text([parse_selection("mod.py::Loader.refresh")], clean=True)
+    assert "\n    def refresh(self):\n        return 2\n```" in clean
+
+
+def test_width_is_that_of_the_last_line(source):
+    text = export_text([Selection("mod.py", 9, 11)])
+    assert " 9:\n10:class Loader:\n11:" in text
+
+
+def test_whole_file_range_matches_file_export(source):
+    assert export_text([Selection("mod.py", 1)]) == format_block("mod.py", SOURCE)
+
+
+def test_bad_selections_are_reported(source):
+    problems = []
+    text = export_text(
+        [Selection("mod.py", 40, 50), Selection("gone.py", 1, 2)],
+        on_problem=lambda *p: problems.append(p),
+    )
+    assert text == ""
+    assert problems[0] == ("mod.py:40-50", "Error: mod.py:40-50: the file has 16 lines")
+    assert problems[1][0] == "gone.py:1-2"
+    assert problems[1][1].startswith("Error:")
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
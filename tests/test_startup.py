@@ -0,0 +1,86 @@
+# ./tests/test_startup.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import xtrshow
+import xtrshow.cli as cli
+import xtrshow.repatch as repatch
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(xtrshow.__file__))
+
+# Only needed by the TUI, scans, --version, or backups. The import-time
+# budget deferring them keeps is checked by script/bench_startup.py.
+DEFERRED = (
+    "curses",
+    "_curses",
+    "importlib.metadata",
+    "shutil",
+    "xtrshow.finder",
+    "xtrshow.ignore",
+    "xtrshow.watch",
+)
+
+
+def _python(code, tmp_path):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path / "pycache"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SOURCE_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("module", ["xtrshow.cli", "xtrshow.repatch"])
+def test_entry_points_defer_heavy_imports(module, tmp_path):
+    code = f"import sys, {module}; print(sorted(set({DEFERRED!r}) & set(sys.modules)))"
+    assert _python(code, tmp_path).stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("main", [cli.main, repatch.main])
+def test_version_is_only_looked_up_for_version(main, monkeypatch, capsys):
+    def fail():
+        raise AssertionError("version looked up")
+
+    monkeypatch.setattr(xtrshow, "get_version", fail)
+    with patch("sys.argv", ["prog", "--help"]), pytest.raises(SystemExit):
+        main()
+    assert "--version" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("main", [cli.main, repatch.main])
+@pytest.mark.parametrize("flag", ["-v", "--version"])
+def test_version_is_printed(main, flag, monkeypatch, capsys):
+    monkeypatch.setattr(xtrshow, "get_version", lambda: "9.9.9")
+    with patch("sys.argv", ["prog", flag]), pytest.raises(SystemExit) as exit:
+        main()
+    assert exit.value.code == 0
+    assert capsys.readouterr().out == "prog 9.9.9\n"
+
+
+def test_curses_is_imported_for_the_tui(monkeypatch):
+    monkeypatch.setattr(cli, "curses", cli._LazyModule("curses"))
+    assert cli.curses.wrapper is sys.modules["curses"].wrapper
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,129 @@
+# ./tests/test_watch.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+import time
+
+import pytest
+
+from xtrshow.watch import InotifyWatcher, PollingWatcher, create_watcher
+
+
+def _inotify_or_skip():
+    try:
+        return InotifyWatcher()
+    except OSError as e:
+        pytest.skip(f"inotify unavailable: {e}")
+
+
+def _wait_for(watcher, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changes = watcher.changes()
+        if changes:
+            return changes
+        time.sleep(0.01)
+    return []
+
+
+def test_polling_watcher_reports_changed_directories(tmp_path, bump_mtime):
+    """Only the directory whose mtime moved is reported, once"""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    watcher = PollingWatcher()
+    watcher.watch(str(tmp_path / "a"), "a")
+    watcher.watch(str(tmp_path / "b"), "b")
+    assert watcher.changes() == []
+
+    (tmp_path / "b" / "new.txt").write_text("x")
+    bump_mtime(tmp_path / "b")
+
+    assert watcher.changes() == ["b"]
+    assert watcher.changes() == []
+
+
+def test_polling_watcher_checks_a_bounded_slice_per_call(tmp_path, bump_mtime):
+    """A large tree is swept over several calls, not all at once"""
+    for i in range(5):
+        (tmp_path / str(i)).mkdir()
+    watcher = PollingWatcher(batch=2)
+    for i in range(5):
+        watcher.watch(str(tmp_path / str(i)), i)
+    for i in range(5):
+        bump_mtime(tmp_path / str(i))
+
+    seen = [watcher.changes() for _ in range(3)]
+
+    assert [len(s) for s in seen] == [2, 2, 1]
+    assert sorted(k for s in seen for k in s) == [0, 1, 2, 3, 4]
+
+
+def test_polling_watcher_forgets_unwatched_and_deleted(tmp_path, bump_mtime):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    watcher = PollingWatcher()
+    watcher.watch(str(tmp_path / "a"), "a")
+    watcher.watch(str(tmp_path / "b"), "b")
+
+    watcher.unwatch("a")
+    bump_mtime(tmp_path / "a")
+    (tmp_path / "b").rmdir()
+
+    assert watcher.changes() == []
+    assert len(watcher) == 0
+
+
+def test_inotify_watcher_reports_creates_and_deletes(tmp_path):
+    watcher = _inotify_or_skip()
+    try:
+        (tmp_path / "sub").mkdir()
+        watcher.watch(str(tmp_path), "root")
+        watcher.watch(str(tmp_path / "sub"), "sub")
+        assert watcher.changes() == []
+
+        (tmp_path / "sub" / "new.txt").write_text("x")
+        assert _wait_for(watcher) == ["sub"]
+
+        (tmp_path / "sub" / "new.txt").unlink()
+        (tmp_path / "sub").rmdir()
+        assert _wait_for(watcher) == ["sub", "root"]
+        # The removed directory's watch is gone
+        assert len(watcher) == 1
+    finally:
+        watcher.close()
+
+
+def test_inotify_watcher_reports_in_place_writes(tmp_path):
+    """A file rewritten in place changes size without touching the dir mtime"""
+    target = tmp_path / "f.txt"
+    target.write_text("x")
+    watcher = _inotify_or_skip()
+    try:
+        watcher.watch(str(tmp_path), "root")
+        with open(target, "a") as f:
+            f.write("more")
+        assert _wait_for(watcher) == ["root"]
+    finally:
+        watcher.close()
+
+
+def test_create_watcher_always_returns_a_watcher(tmp_path):
+    watcher = create_watcher()
+    try:
+        assert watcher.watch(str(tmp_path), "root")
+        assert not watcher.watch(str(tmp_path / "missing"), "missing")
+    finally:
+        watcher.close()
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -21,7 +21,7 @@ const metaPyodide = document
 const PYODIDE_URL =
   new URLSearchParams(location.search).get("pyodide") ||
   (metaPyodide || `https://cdn.jsdelivr.net/pyodide/v${PYODIDE_VERSION}/full/`);
-const VENDOR_FILES = ["__init__.py", "cli.py", "repatch.py"];
+const VENDOR_FILES = ["__init__.py", "cli.py", "numbering.py", "repatch.py"];
 const PATCH_NAME = "xpatch.txt";
 
 const REDUCED = window.matchMedia("(prefers-reduced-motion: reduce)").matches;
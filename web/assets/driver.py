@@ -16,6 +16,7 @@ from pathlib import Path
 
 import xtrshow.repatch as rp
 from xtrshow import get_version
+from xtrshow.numbering import number_lines
 
 ROOT = Path("/demo")
 PATCH_NAME = "xpatch.txt"
@@ -185,13 +186,11 @@ def extract(src_name, src_text):
     """
     Reproduce what `xtrshow` writes for a single selected file.
 
-    Mirrors the block construction in xtrshow/cli.py: a --- a/ +++ b/ header
-    pair, then the file fenced and prefixed with right-aligned line numbers.
+    Mirrors the block construction in xtrshow/export.py: a --- a/ +++ b/ header
+    pair, then the file fenced and prefixed with right-aligned line numbers
+    by the same xtrshow.numbering formatter.
     """
-    content = src_text.replace("\r\n", "\n")
-    lines = content.splitlines()
-    width = len(str(len(lines))) if lines else 1
-    body = "\n".join(f"{i + 1:>{width}}:{line}" for i, line in enumerate(lines))
+    body = number_lines(src_text.replace("\r\n", "\n"))
     ext = os.path.splitext(src_name)[1]
     lang = ext[1:] if ext.startswith(".") else ext
     fence = "```"
@@ -2,8 +2,6 @@
 # License: Apache-2.0 (disclaimer at bottom of file)
 """xtrshow - Interactive file tree selector for LLM workflows"""
 
-from importlib.metadata import version as _pkg_version, PackageNotFoundError
-
 __version__ = "0.3.0"
 
 
@@ -13,14 +11,44 @@ def get_version():
     source tree that was never pip-installed.
 
     Lives here rather than in cli.py so that importing the patcher does not
-    drag in the TUI -- cli.py imports curses at module scope, which is absent
-    on any curses-less interpreter (Pyodide/WASM, minimal containers), and
-    repatch.py itself needs nothing beyond the standard library.
+    drag in the TUI -- curses is absent on any curses-less interpreter
+    (Pyodide/WASM, minimal containers), and repatch.py itself needs nothing
+    beyond the standard library. importlib.metadata is imported here, not
+    at the top: it costs more than the rest of startup put together, and
+    is only needed for --version.
     """
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
-        return _pkg_version("xtrshow")
+        return version("xtrshow")
     except PackageNotFoundError:
         return "unknown (not installed)"
+
+
+def add_version_argument(parser):
+    """
+    -v/--version on an argparse parser, like action="version" but looking
+    the version up only when the option is actually given.
+    """
+    import argparse
+
+    class VersionAction(argparse.Action):
+        def __init__(self, option_strings, dest, **kwargs):
+            super().__init__(
+                option_strings,
+                dest=argparse.SUPPRESS,
+                default=argparse.SUPPRESS,
+                nargs=0,
+                help="show program's version number and exit",
+            )
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            print(f"{parser.prog} {get_version()}")
+            parser.exit()
+
+    parser.add_argument("-v", "--version", action=VersionAction)
+
+
 # Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -5,7 +5,11 @@
 """
 Interactive file tree selector for sharing code with LLMs
 
-usage: xtrshow [-h] [--max-depth MAX_DEPTH] [--pattern PATTERN] [--ignore] [--no-ignore] [-o OUTFILE] [directory]
+usage: xtrshow [-h] [-v] [--max-depth MAX_DEPTH] [--pattern PATTERN] [-j JOBS]
+               [--no-cache] [--no-watch] [--max-file-size SIZE] [--clean]
+               [--dedup] [--ignore] [--no-ignore] [-o OUTFILE] [--multi [DIR]]
+               [--update] [--delta] [--files SPEC [SPEC ...]] [--prompt]
+               [directory]
 
 Interactive file tree selector
 
@@ -14,13 +18,39 @@ positional arguments:
 
 options:
   -h, --help            show this help message and exit
+  -v, --version         show program's version number and exit
   --max-depth MAX_DEPTH
                         Maximum depth to traverse
   --pattern PATTERN     Filter files by name pattern
+  -j JOBS, --jobs JOBS  Threads used to list directories and read exported
+                        files concurrently (default: 1)
+  --no-cache            Do not read or write the scan and export caches in
+                        .xtrshow_cache/
+  --no-watch            Do not watch the tree for changes while the TUI is
+                        open
+  --max-file-size SIZE  Files larger than SIZE (e.g. 500K, 2M; 0 for no limit)
+                        are skipped by "select all", as binary files are
+                        (default: 1M)
+  --clean               Omit line number prefixes (print raw file content)
+  --dedup               Export files identical to one already exported as a
+                        one-line reference to it
   --ignore              Ignore common directories (node_modules, .git, etc.)
-  --no-ignore           Show all files (disable default ignore patterns)
+  --no-ignore           Show all files (disable default ignore patterns and
+                        .gitignore)
   -o OUTFILE, --outfile OUTFILE
                         Print output to file
+  --multi [DIR]         Output individual files to directory (default:
+                        .xtrshow)
+  --update, -u          Re-export previously selected files from
+                        .xtrshow_manifest without launching TUI
+  --delta               Like --update, but only export the files that changed
+                        since the last export
+  --files SPEC [SPEC ...]
+                        Export these files without launching the TUI. A SPEC
+                        is a path, path:START-END for some of its lines, or
+                        path::Name for a Python def or class (Class.method
+                        works too)
+  --prompt, -p          Print the LLM prompting instructions and exit
 ---
 
 Copyright [2026] [michael@aloecraft.org]
@@ -43,13 +73,59 @@ specific language governing permissions and limitations
 under the License.
 """
 
-import curses
+import fnmatch
 import os
+import stat
 import sys
+import threading
 import argparse
+import json
+import time
 from pathlib import Path
 
-from xtrshow import get_version
+from xtrshow import add_version_argument
+from xtrshow.export import (
+    CACHE_DIR,
+    EXPORT_BUFFER_SIZE,
+    BlockCache,
+    is_binary_file,
+    iter_export_blocks,
+    prepare_cache_dir,
+    split_delta,
+    write_block,
+    write_export,
+)
+
+# Re-exported for code importing the export from here, as it could import
+# format_block before the export moved to export.py
+from xtrshow.export import export_text, format_block  # noqa: F401
+from xtrshow.manifest import MANIFEST_PATH, RACY_WINDOW_NS, Manifest
+from xtrshow.selection import parse_selection
+
+
+class _LazyModule:
+    """
+    Stands in for a module until one of its attributes is first used, and
+    imports it then. Attributes set on the stand-in (tests patching
+    curses.wrapper) shadow the module's own.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            import importlib
+
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# Only the TUI needs curses: headless exports, --help and --version don't
+# pay for importing it (and work where it is missing). The finder, watcher
+# and ignore rules are likewise imported by the functions that use them.
+curses = _LazyModule("curses")
 
 
 # Default ignore patterns
@@ -66,23 +142,100 @@ DEFAULT_IGNORE = {
     "dist",
     "build",
     ".egg-info",
+    "*.egg-info",
     ".eggs",
     "target",
     ".idea",
     ".vscode",
+    ".xtrshow_cache",
 }
 
+# Shared by every file and not-yet-listed directory instead of a fresh list
+_NO_CHILDREN = ()
+
 
 class FileNode:
-    def __init__(self, path, depth=0, is_last=False, parent=None):
-        self.path = Path(path)
+    """
+    One entry of the file tree.
+
+    Directories carry running totals of the selected files beneath them
+    (sel_count/sel_bytes); change selection through set_selected() or
+    select_all_in_directory() so those totals stay right.
+
+    Nodes are slotted and keep only their own name; the full path is
+    rebuilt from the parent chain on demand. A million-entry tree would
+    otherwise hold a million Path objects and instance dicts. Names are
+    interned, so the countless __init__.py / index.js share one string.
+    """
+
+    __slots__ = (
+        "name",
+        "depth",
+        "is_last",
+        "selected",
+        "is_dir",
+        "size",
+        "mtime",
+        "parent",
+        "children",
+        "expanded",
+        "loader",
+        "loaded",
+        "sel_count",
+        "sel_bytes",
+        "binary",
+    )
+
+    def __init__(
+        self,
+        path,
+        depth=0,
+        is_last=False,
+        parent=None,
+        loader=None,
+        is_dir=None,
+        size=0,
+        mtime=0.0,
+        binary=None,
+    ):
+        if parent is None:
+            self.name = str(Path(path))
+        else:
+            self.name = sys.intern(os.path.basename(os.fspath(path)))
         self.depth = depth
         self.is_last = is_last
         self.selected = False
-        self.is_dir = self.path.is_dir()
         self.parent = parent
-        self.children = []
+        if is_dir is None:
+            # Not produced by a directory scan (the root): stat it ourselves
+            try:
+                st = self.path.stat()
+                is_dir = stat.S_ISDIR(st.st_mode)
+                size = 0 if is_dir else st.st_size
+                mtime = st.st_mtime
+            except OSError:
+                is_dir = False
+        if binary is None:
+            binary = not is_dir and size > 0 and is_binary_file(self.path)
+        self.is_dir = is_dir
+        self.binary = binary
+        self.size = size
+        self.mtime = mtime
+        self.children = _NO_CHILDREN
         self.expanded = False
+        self.loader = loader
+        # Files have nothing to list; directories are listed on first use
+        self.loaded = not self.is_dir
+        # Selected files and their bytes anywhere below this directory
+        self.sel_count = 0
+        self.sel_bytes = 0
+
+    @property
+    def path(self):
+        """Full path, rebuilt from the root's path and the names below it"""
+        if self.parent is None:
+            return Path(self.name)
+        return self.parent.path / self.name
 
     def get_display_line(self):
         """Generate the tree-style display line"""
@@ -100,77 +253,649 @@ class FileNode:
             icon = f"{expand_indicator} {icon}"
         else:
             icon = "📄"
+            reason = self.skip_reason()
+            if reason is not None:
+                # Left out of "select all"; say why
+                note = "binary" if reason == "binary" else format_size(self.size)
+                return f"{indent}{prefix}{checkbox} 📦 {self.name} ({note})"
 
-        name = self.path.name if self.depth > 0 else str(self.path)
-
-        return f"{indent}{prefix}{checkbox} {icon} {name}"
+        return f"{indent}{prefix}{checkbox} {icon} {self.name}"
 
     def get_size(self):
-        """Get file size in bytes"""
-        try:
-            if self.is_dir:
-                return 0
-            return self.path.stat().st_size
-        except Exception:
-            return 0
+        """File size in bytes, as recorded when the parent was scanned"""
+        return 0 if self.is_dir else self.size
+
+    def skip_reason(self):
+        """Why "select all" passes this file over ("binary"/"large"), or None"""
+        if self.is_dir:
+            return None
+        if self.binary:
+            return "binary"
+        limit = self.loader.max_file_size if self.loader else DEFAULT_MAX_FILE_SIZE
+        if limit and self.size > limit:
+            return "large"
+        return None
+
+    def load_children(self):
+        """List this directory if it has not been listed yet"""
+        if not self.loaded and self.loader is not None:
+            self.loader.load(self)
+        return self.children
 
 
 def should_ignore(path, ignore_patterns):
-    """Check if path should be ignored"""
-    return path.name in ignore_patterns
+    """Check if path should be ignored (entries may be globs like *.egg-info)"""
+    if path.name in ignore_patterns:
+        return True
+    return any(
+        fnmatch.fnmatchcase(path.name, p)
+        for p in ignore_patterns
+        if any(c in p for c in "*?[")
+    )
 
 
-def build_file_tree(root_path, max_depth=None, pattern=None, ignore_patterns=None):
-    """Build a hierarchical tree of FileNode objects"""
-    root = Path(root_path)
+# Files above this are left out of "select all" (--max-file-size)
+DEFAULT_MAX_FILE_SIZE = 1024 * 1024
 
-    if not root.exists():
-        return None, 0
 
-    if ignore_patterns is None:
-        ignore_patterns = set()
+class ScanEntry:
+    """What one os.scandir() pass learns about a directory entry"""
+
+    __slots__ = ("name", "is_dir", "size", "mtime", "binary")
 
-    hidden_count = 0
+    def __init__(self, name, is_dir, size, mtime, binary=False):
+        self.name = name
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+        self.binary = binary
 
-    def build_node(path, depth, is_last=False, parent=None):
-        nonlocal hidden_count
 
-        if max_depth is not None and depth > max_depth:
+def scan_directory(path, known=None):
+    """
+    List a directory with os.scandir(), directories first then by name.
+
+    Type information comes from the DirEntry (d_type, free on most
+    filesystems) and size/mtime from a single stat per entry, so nothing
+    downstream needs to touch the filesystem again -- on network mounts
+    every extra stat is a round trip. Non-empty regular files also have
+    their leading block sniffed, so binaries are known before anyone tries
+    to export them. known, if given, maps names to the entries of an earlier
+    listing (ScanEntry or FileNode): a file whose size and mtime are the
+    same keeps its binary flag instead of being sniffed again. Returns None
+    if the directory cannot be read.
+    """
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                try:
+                    is_dir = dir_entry.is_dir()
+                    st = dir_entry.stat()
+                except OSError:
+                    # Dangling symlink or a file that vanished mid-scan
+                    is_dir = False
+                    try:
+                        st = dir_entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                if is_dir or st.st_size == 0 or not stat.S_ISREG(st.st_mode):
+                    binary = False
+                else:
+                    old = known.get(dir_entry.name) if known else None
+                    if (
+                        old is not None
+                        and not old.is_dir
+                        and old.size == st.st_size
+                        and old.mtime == st.st_mtime
+                    ):
+                        binary = old.binary
+                    else:
+                        binary = is_binary_file(dir_entry.path)
+                entries.append(
+                    ScanEntry(
+                        dir_entry.name,
+                        is_dir,
+                        0 if is_dir else st.st_size,
+                        st.st_mtime,
+                        binary,
+                    )
+                )
+    except OSError:
+        return None
+
+    entries.sort(key=lambda e: (not e.is_dir, e.name))
+    return entries
+
+
+class ScanCache:
+    """
+    On-disk record of directory listings, keyed by path and directory mtime.
+
+    Adding, removing or renaming an entry bumps its directory's mtime, so a
+    directory whose mtime is unchanged since it was cached still has the
+    same entries and does not need to be listed again -- one stat instead
+    of a scandir plus a stat per entry. Sizes and binary flags of files
+    edited in place can lag behind (editing a file does not touch its
+    directory); they only feed the selection estimate and "select all", the
+    export always checks the real file.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else CACHE_DIR / "scan.json"
+        self.dirs = {}
+        self.dirty = False
+        self._started_ns = time.time_ns()
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self.dirs = data.get("dirs", {})
+
+    def lookup(self, dir_path, mtime_ns):
+        """Cached ScanEntry list for dir_path, or None if missing or stale"""
+        record = self.dirs.get(dir_path)
+        if record is None or record[0] != mtime_ns:
             return None
+        if not record[1]:
+            return []
+        # Entries are packed into one "/"-separated string -- the one
+        # character no file name can contain -- so loading the cache is a
+        # single cheap json.loads and only directories actually opened get
+        # unpacked.
+        fields = record[1].split("/")
+        return [
+            ScanEntry(
+                fields[i],
+                fields[i + 1] == "d",
+                int(fields[i + 2]),
+                float(fields[i + 3]),
+                fields[i + 1] == "b",
+            )
+            for i in range(0, len(fields), 4)
+        ]
+
+    def store(self, dir_path, mtime_ns, entries):
+        """Remember a fresh listing of dir_path (None if it was unreadable)"""
+        if entries is None or self._started_ns - mtime_ns < RACY_WINDOW_NS:
+            if self.dirs.pop(dir_path, None) is not None:
+                self.dirty = True
+            return
+        self.dirs[dir_path] = [
+            mtime_ns,
+            "/".join(
+                f"{e.name}/{'d' if e.is_dir else 'b' if e.binary else 'f'}"
+                f"/{e.size}/{e.mtime!r}"
+                for e in entries
+            ),
+        ]
+        self.dirty = True
+
+    def save(self):
+        """Write the cache back if anything changed; failures are not fatal"""
+        if not self.dirty:
+            return
+        try:
+            prepare_cache_dir(self.path.parent)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {"version": self.VERSION, "dirs": self.dirs},
+                    separators=(",", ":"),
+                )
+            )
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: could not write scan cache: {e}", file=sys.stderr)
+
+
+class TreeLoader:
+    """
+    Lists directories for a FileNode tree, one directory at a time.
+
+    Walking a large repository up front costs far more than the handful of
+    directories a user actually opens, so nodes are created unloaded and
+    listed the first time something needs their children (expanding them in
+    the TUI, or "select all"). hidden_count grows as directories are listed.
+
+    With gitignore=True, .gitignore/.ignore files found along the way are
+    honoured as well: every listed directory gets an IgnoreMatcher
+    stacking the rules from the root down, and ignored entries are dropped
+    before they become nodes, so their subtrees are never listed.
+
+    With jobs > 1, load_all() lists sibling subtrees concurrently. Listing
+    is latency-bound (NFS, large monorepos), so threads overlap the waits;
+    the resulting tree is identical to a serial walk because every
+    directory's children are sorted and attached on the calling thread.
+
+    Attaching is serialised by a lock and happens at most once per
+    directory, so the TUI can keep listing what the user opens while a
+    BackgroundScan fills in the rest of the tree. dir_count and file_count
+    count the nodes created so far.
+
+    A watcher (see xtrshow.watch) is handed every directory once it is
+    listed; apply_changes() then re-lists only the directories it reports,
+    so the tree stays current without ever being rescanned.
+    """
+
+    def __init__(
+        self,
+        max_depth=None,
+        pattern=None,
+        ignore_patterns=None,
+        jobs=1,
+        cache=None,
+        gitignore=False,
+        watcher=None,
+        max_file_size=DEFAULT_MAX_FILE_SIZE,
+    ):
+        self.max_depth = max_depth
+        self.pattern = pattern
+        self.ignore_patterns = ignore_patterns if ignore_patterns is not None else set()
+        self.jobs = max(1, jobs or 1)
+        self.cache = cache
+        self.gitignore = gitignore
+        self.watcher = watcher
+        self.max_file_size = max_file_size
+        self.hidden_count = 0
+        self.dir_count = 0
+        self.file_count = 0
+        self.scan = None
+        self._lock = threading.Lock()
+        from xtrshow.ignore import IgnoreRules
+
+        # ignore_patterns compiled once; checked on bare names at every level
+        self._base_rules = IgnoreRules(sorted(self.ignore_patterns))
+        self._matchers = {}
+
+    def load(self, node):
+        """List node's directory and attach its (filtered, sorted) children"""
+        if node.loaded:
+            return
+        self._attach(node, self._list(node))
+
+    def _list(self, node, fresh=False, known=None):
+        """
+        Filesystem half of load(): safe to run on a worker thread.
+        fresh=True bypasses the cache's copy (a file may have changed size
+        without touching the directory's mtime); known is passed on to
+        scan_directory().
+        """
+        if self.max_depth is not None and node.depth + 1 > self.max_depth:
+            return None
+        if self.cache is None:
+            return scan_directory(node.path, known)
 
-        node = FileNode(path, depth, is_last, parent)
+        scan_path = os.fspath(node.path)
+        key = os.path.abspath(scan_path)
+        try:
+            mtime_ns = os.stat(scan_path).st_mtime_ns
+        except OSError:
+            return None
+        entries = None if fresh else self.cache.lookup(key, mtime_ns)
+        if entries is None:
+            entries = scan_directory(scan_path, known)
+            self.cache.store(key, mtime_ns, entries)
+        return entries
+
+    def _attach(self, node, entries):
+        """Tree half of load(): filters entries and creates child nodes"""
+        with self._lock:
+            # Another thread may have listed it while we were
+            if not node.loaded:
+                self._attach_locked(node, entries)
+
+    def _attach_locked(self, node, entries):
+        if entries is None:
+            node.loaded = True
+            return
 
-        if path.is_dir():
-            try:
-                entries = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-            except PermissionError:
-                return node
-
-            filtered_entries = []
-            for entry in entries:
-                # Check ignore patterns
-                if should_ignore(entry, ignore_patterns):
-                    hidden_count += 1
+        filtered_entries, hidden = self._filter(node, entries)
+        self.hidden_count += hidden
+        last = len(filtered_entries) - 1
+        node.children = [
+            self._new_child(node, entry, i == last)
+            for i, entry in enumerate(filtered_entries)
+        ]
+        dirs = sum(1 for entry in filtered_entries if entry.is_dir)
+        self.dir_count += dirs
+        self.file_count += len(filtered_entries) - dirs
+        # Only now: other threads take loaded=True to mean children are there
+        node.loaded = True
+        if self.watcher is not None:
+            self.watcher.watch(os.fspath(node.path), node)
+
+    def _new_child(self, node, entry, is_last):
+        return FileNode(
+            entry.name,
+            node.depth + 1,
+            is_last,
+            node,
+            self,
+            is_dir=entry.is_dir,
+            size=entry.size,
+            mtime=entry.mtime,
+            binary=entry.binary,
+        )
+
+    def _filter(self, node, entries):
+        """Entries of node's listing that become nodes, and the ignored count"""
+        matcher = None
+        if self.gitignore:
+            from xtrshow.ignore import IgnoreMatcher, read_rules
+
+            rules = read_rules(node.path, [e.name for e in entries])
+            parent_matcher = self._matchers.get(node.parent)
+            if parent_matcher is None:
+                matcher = IgnoreMatcher().with_rules(rules)
+            else:
+                matcher = parent_matcher.descend(node.name, rules)
+            self._matchers[node] = matcher
+
+        filtered_entries = []
+        hidden = 0
+        for entry in entries:
+            # Check ignore patterns, then the .gitignore stack
+            if self._base_rules.match(entry.name, entry.is_dir) or (
+                matcher is not None and matcher.match(entry.name, entry.is_dir)
+            ):
+                hidden += 1
+                continue
+
+            # Apply name pattern filter
+            if self.pattern and node.depth > 0:
+                if self.pattern not in entry.name:
                     continue
 
-                # Apply name pattern filter
-                if pattern and depth > 0:
-                    if pattern not in entry.name:
-                        continue
+            filtered_entries.append(entry)
+        return filtered_entries, hidden
+
+    def refresh(self, node):
+        """
+        Re-list a loaded directory and patch its children in place.
+
+        Children whose name and kind survive keep their node -- selection,
+        fold state and listed subtree included -- and only pick up a new
+        size/mtime. Removed children leave the selection totals and the
+        watcher; new ones arrive unselected and unlisted. Returns True if
+        anything changed. Entries hidden by ignore rules are not recounted
+        in hidden_count. Directories dropped by an earlier refresh are
+        left alone.
+        """
+        if not node.loaded or not node.is_dir:
+            return False
+        # Only new and modified files are sniffed for binary content again
+        known = {child.name: child for child in node.children}
+        entries = self._list(node, fresh=True, known=known)
+        with self._lock:
+            return self._refresh_locked(node, entries or [])
+
+    def _refresh_locked(self, node, entries):
+        # Re-reads the directory's ignore files too, in case they changed
+        filtered_entries, _ = self._filter(node, entries)
+        old = {child.name: child for child in node.children}
+
+        changed = False
+        children = []
+        last = len(filtered_entries) - 1
+        for i, entry in enumerate(filtered_entries):
+            child = old.pop(entry.name, None)
+            if child is not None and child.is_dir != entry.is_dir:
+                # Replaced by an entry of the other kind
+                self._drop(child)
+                child = None
+            if child is None:
+                child = self._new_child(node, entry, i == last)
+                if entry.is_dir:
+                    self.dir_count += 1
+                else:
+                    self.file_count += 1
+                changed = True
+            else:
+                if child.is_last != (i == last):
+                    child.is_last = i == last
+                    changed = True
+                if not child.is_dir and (
+                    child.size != entry.size
+                    or child.mtime != entry.mtime
+                    or child.binary != entry.binary
+                ):
+                    if child.selected:
+                        _add_to_ancestors(child, 0, entry.size - child.size)
+                    child.size = entry.size
+                    child.mtime = entry.mtime
+                    child.binary = entry.binary
+                    changed = True
+            children.append(child)
+
+        for child in old.values():
+            self._drop(child)
+            changed = True
+        if changed:
+            node.children = children
+        return changed
+
+    def _drop(self, child):
+        """Take a removed child out of the totals, counts and watcher"""
+        if child.is_dir:
+            _add_to_ancestors(child, -child.sel_count, -child.sel_bytes)
+        elif child.selected:
+            _add_to_ancestors(child, -1, -child.size)
+        stack = [child]
+        while stack:
+            current = stack.pop()
+            if current.is_dir:
+                self.dir_count -= 1
+                self._matchers.pop(current, None)
+                if self.watcher is not None and current.loaded:
+                    self.watcher.unwatch(current)
+                # Detached: a refresh already queued for it (the watcher
+                # reported it alongside its parent) must not drop it again
+                current.loaded = False
+                stack.extend(current.children)
+            else:
+                self.file_count -= 1
+
+    def apply_changes(self):
+        """
+        Refresh every directory the watcher reports as changed. Returns the
+        directories whose children changed, outermost first.
+        """
+        if self.watcher is None:
+            return []
+        refreshed = [n for n in self.watcher.changes() if self.refresh(n)]
+        refreshed.sort(key=lambda n: n.depth)
+        return refreshed
+
+    def start_scan(self, node):
+        """List everything below node on a background thread"""
+        self.scan = BackgroundScan(self, node)
+        self.scan.start()
+        return self.scan
+
+    def stop_scan(self):
+        """Stop the background scan, if any, and wait for it to wind down"""
+        if self.scan is not None:
+            self.scan.stop()
+
+    @property
+    def scanning(self):
+        return self.scan is not None and self.scan.running
+
+    def load_all(self, node):
+        """Load node and every directory beneath it"""
+        if self.jobs > 1:
+            self._load_all_parallel(node)
+            return
 
-                filtered_entries.append(entry)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.is_dir:
+                self.load(current)
+                stack.extend(current.children)
+
+    def _load_all_parallel(self, node):
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            pending = {}
+
+            def visit(current):
+                # Already-listed directories (expanded in the TUI) are walked
+                # through so that their unlisted descendants get scheduled.
+                stack = [current]
+                while stack:
+                    n = stack.pop()
+                    if not n.is_dir:
+                        continue
+                    if n.loaded:
+                        stack.extend(n.children)
+                    else:
+                        pending[pool.submit(self._list, n)] = n
+
+            visit(node)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current = pending.pop(future)
+                    self._attach(current, future.result())
+                    for child in current.children:
+                        visit(child)
+
+
+class BackgroundScan:
+    """
+    Lists a whole tree on a daemon thread, shallowest directories first, so
+    the levels a user looks at first fill in first. With loader.jobs > 1
+    listings run on a small pool, at most a couple per worker in flight so
+    that stop() never waits on a long queue.
+    """
+
+    def __init__(self, loader, root):
+        self.loader = loader
+        self.root = root
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="xtrshow-scan", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def wait(self, timeout=None):
+        """Block until the scan has finished; True if it has"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        from collections import deque
+
+        loader = self.loader
+        queue = deque([self.root])
+        if loader.jobs == 1:
+            while queue and not self._stopping.is_set():
+                node = queue.popleft()
+                loader.load(node)
+                queue.extend(child for child in node.children if child.is_dir)
+            return
 
-            for i, entry in enumerate(filtered_entries):
-                is_last_entry = i == len(filtered_entries) - 1
-                child = build_node(entry, depth + 1, is_last_entry, node)
-                if child:
-                    node.children.append(child)
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        with ThreadPoolExecutor(max_workers=loader.jobs) as pool:
+            pending = {}
+            while (queue or pending) and not self._stopping.is_set():
+                while queue and len(pending) < loader.jobs * 2:
+                    node = queue.popleft()
+                    if node.loaded:
+                        # Opened in the TUI already; just walk through it
+                        queue.extend(c for c in node.children if c.is_dir)
+                    else:
+                        pending[pool.submit(loader._list, node)] = node
+                if not pending:
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    loader._attach(node, future.result())
+                    queue.extend(child for child in node.children if child.is_dir)
+
+
+def build_file_tree(
+    root_path,
+    max_depth=None,
+    pattern=None,
+    ignore_patterns=None,
+    lazy=False,
+    jobs=1,
+    cache=None,
+    gitignore=False,
+    background=False,
+    watcher=None,
+    max_file_size=DEFAULT_MAX_FILE_SIZE,
+):
+    """
+    Build a hierarchical tree of FileNode objects.
+
+    With lazy=True only the root directory is listed; everything below it is
+    listed on demand through FileNode.load_children(). The returned
+    hidden_count covers only what has been listed so far -- the live figure
+    is root_node.loader.hidden_count.
+
+    jobs sets the size of the thread pool used whenever a whole subtree is
+    listed (an eager build here, or "select all" on a lazy tree). A ScanCache
+    passed as cache is consulted before listing any directory; the caller
+    decides when to save() it. gitignore=True also applies the .gitignore
+    and .ignore files found in the tree.
+
+    With background=True nothing is listed before returning: a
+    BackgroundScan (root_node.loader.scan) lists the tree while the caller
+    gets on with it. Stop it with loader.stop_scan() before saving the cache.
+    A watcher from xtrshow.watch is registered for every listed directory;
+    call root_node.loader.apply_changes() to bring the tree up to date.
+    Files over max_file_size bytes (0: no limit), like binary files, are
+    shown but left out of "select all".
+    """
+    root = Path(root_path)
 
-        return node
+    if not root.exists():
+        return None, 0
 
-    root_node = build_node(root, 0)
+    loader = TreeLoader(
+        max_depth,
+        pattern,
+        ignore_patterns,
+        jobs,
+        cache,
+        gitignore,
+        watcher,
+        max_file_size,
+    )
+    root_node = FileNode(root, 0, loader=loader)
+    if background:
+        loader.start_scan(root_node)
+    elif lazy:
+        root_node.load_children()
+    else:
+        loader.load_all(root_node)
     root_node.expanded = True
-    return root_node, hidden_count
+    return root_node, loader.hidden_count
 
 
 def flatten_tree(root, visible_only=True):
@@ -188,37 +913,208 @@ def flatten_tree(root, visible_only=True):
     return nodes
 
 
+class VisibleRows:
+    """
+    The TUI's visible rows, kept in step with the tree instead of being
+    re-flattened on every keypress.
+
+    Expanding a directory splices its visible descendants in after it and
+    collapsing cuts them out again, so navigation costs nothing and
+    (un)folding costs only the rows that appear or disappear.
+
+    An expanded directory that is not listed yet (the root, while a
+    background scan is still getting to it) waits in `waiting` until
+    refresh() sees it listed.
+    """
+
+    def __init__(self, root):
+        self.nodes = flatten_tree(root, visible_only=True)
+        self.waiting = [
+            n for n in self.nodes if n.is_dir and n.expanded and not n.loaded
+        ]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __getitem__(self, idx):
+        return self.nodes[idx]
+
+    def _subtree_end(self, idx):
+        """Index just past the rows shown beneath row idx"""
+        depth = self.nodes[idx].depth
+        end = idx + 1
+        while end < len(self.nodes) and self.nodes[end].depth > depth:
+            end += 1
+        return end
+
+    def expand(self, idx):
+        """Expand the directory at row idx, listing it first if needed"""
+        node = self.nodes[idx]
+        if not node.is_dir or node.expanded:
+            return
+        node.load_children()
+        node.expanded = True
+        self.nodes[idx + 1 : idx + 1] = flatten_tree(node, visible_only=True)[1:]
+
+    def collapse(self, idx):
+        """Collapse the directory at row idx"""
+        node = self.nodes[idx]
+        if not node.is_dir or not node.expanded:
+            return
+        del self.nodes[idx + 1 : self._subtree_end(idx)]
+        node.expanded = False
+        if node in self.waiting:
+            self.waiting.remove(node)
+
+    def rebuild(self, node):
+        """Re-splice the rows below node after its children changed"""
+        if not node.expanded:
+            return
+        try:
+            idx = self.nodes.index(node)
+        except ValueError:
+            return  # inside a collapsed directory
+        self.nodes[idx + 1 : self._subtree_end(idx)] = flatten_tree(
+            node, visible_only=True
+        )[1:]
+
+    def refresh(self):
+        """Show the children of waiting directories listed since; True if any"""
+        ready = [n for n in self.waiting if n.loaded]
+        if not ready:
+            return False
+        self.waiting = [n for n in self.waiting if not n.loaded]
+        for node in ready:
+            idx = self.nodes.index(node)
+            self.nodes[idx + 1 : idx + 1] = flatten_tree(node, visible_only=True)[1:]
+        return True
+
+    def parent_index(self, idx):
+        """Row of the parent of row idx (the nearest shallower row above it)"""
+        depth = self.nodes[idx].depth
+        while idx > 0:
+            idx -= 1
+            if self.nodes[idx].depth < depth:
+                return idx
+        return 0
+
+
+def _add_to_ancestors(node, count, size):
+    """Apply a selection delta to every directory above node"""
+    parent = node.parent
+    while parent is not None:
+        parent.sel_count += count
+        parent.sel_bytes += size
+        parent = parent.parent
+
+
+def set_selected(node, selected=True):
+    """Select/deselect a single node, updating only its ancestors' totals"""
+    if node.selected == selected:
+        return
+    node.selected = selected
+    if node.is_dir:
+        # A directory's own checkbox does not put anything in the export
+        return
+    if selected:
+        _add_to_ancestors(node, 1, node.size)
+    else:
+        _add_to_ancestors(node, -1, -node.size)
+
+
 def select_all_in_directory(node, selected=True):
-    """Recursively select/deselect all files in a directory"""
-    count = 0
+    """
+    Recursively select/deselect all files in a directory. Selecting passes
+    over binary and oversized files (FileNode.skip_reason()); they can still
+    be picked one by one. Returns the number of files it set.
+    """
     if not node.is_dir:
-        node.selected = selected
+        set_selected(node, selected)
         return 1
 
-    for child in node.children:
-        count += select_all_in_directory(child, selected)
+    if not node.loaded and node.loader is not None:
+        # List the whole subtree in one go so the loader can use its pool
+        node.loader.load_all(node)
 
-    return count
+    old_count, old_bytes = node.sel_count, node.sel_bytes
 
+    def walk(current):
+        """Set every file below current and rebuild the totals bottom-up"""
+        files = sel_count = sel_bytes = 0
+        for child in current.load_children():
+            if child.is_dir:
+                files += walk(child)
+                sel_count += child.sel_count
+                sel_bytes += child.sel_bytes
+            else:
+                if not (selected and child.skip_reason()):
+                    child.selected = selected
+                    files += 1
+                if child.selected:
+                    sel_count += 1
+                    sel_bytes += child.size
+        current.sel_count = sel_count
+        current.sel_bytes = sel_bytes
+        return files
+
+    count = walk(node)
+    _add_to_ancestors(node, node.sel_count - old_count, node.sel_bytes - old_bytes)
+    return count
 
-def get_selection_stats(root_node):
-    """Get statistics about selected files"""
-    all_nodes = flatten_tree(root_node, visible_only=False)
-    selected_files = [n for n in all_nodes if n.selected and not n.is_dir]
-
-    total_size = sum(n.get_size() for n in selected_files)
 
-    # Format size nicely
+def iter_selected_files(root_node):
+    """Selected files in tree order, skipping subtrees with nothing selected"""
+    if not root_node.is_dir:
+        if root_node.selected:
+            yield root_node
+        return
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        for child in reversed(node.children):
+            if child.is_dir:
+                if child.sel_count:
+                    stack.append(child)
+            elif child.selected:
+                # Files are pushed too so the output keeps tree order
+                stack.append(child)
+        if not node.is_dir:
+            yield node
+
+
+def format_size(total_size):
+    """Human-readable byte count"""
     if total_size < 1024:
-        size_str = f"{total_size} B"
+        return f"{total_size} B"
     elif total_size < 1024 * 1024:
-        size_str = f"{total_size / 1024:.1f} KB"
+        return f"{total_size / 1024:.1f} KB"
     elif total_size < 1024 * 1024 * 1024:
-        size_str = f"{total_size / (1024 * 1024):.1f} MB"
+        return f"{total_size / (1024 * 1024):.1f} MB"
     else:
-        size_str = f"{total_size / (1024 * 1024 * 1024):.1f} GB"
+        return f"{total_size / (1024 * 1024 * 1024):.1f} GB"
+
+
+def parse_size(text):
+    """Parse a byte count such as 4096, 500K, 2M or 1G (argparse type)"""
+    units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+    value = text.strip().upper().rstrip("B")
+    unit = value[-1:] if value[-1:] in "KMG" else ""
+    try:
+        return int(float(value[: len(value) - len(unit)]) * units[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
 
-    return len(selected_files), size_str
+
+def get_selection_stats(root_node):
+    """
+    Get statistics about selected files.
+
+    Constant time: read straight off the root's running totals.
+    """
+    if not root_node.is_dir:
+        selected = 1 if root_node.selected else 0
+        return selected, format_size(root_node.size if selected else 0)
+    return root_node.sel_count, format_size(root_node.sel_bytes)
 
 
 def show_confirmation(stdscr, selected_count, size_str):
@@ -250,7 +1146,211 @@ def show_confirmation(stdscr, selected_count, size_str):
             return False
 
 
-def main_curses(stdscr, root_node, hidden_count):
+# How often the TUI asks the watcher for changes when otherwise idle
+WATCH_INTERVAL_MS = 500
+
+HELP_TEXT = "↑/↓: Navigate | ←/→: Collapse/Expand | SPC: Select | a/A: Select/Deselect All | /: Find | p: Export | q: Quit"
+
+
+class TreeRenderer:
+    """
+    Paints the TUI, touching only what changed since the previous frame.
+
+    Each node's display line is cached until its checkbox, fold state, tree
+    branch, size or binary flag changes (only for the nodes of the last
+    frame, so nodes scrolled away or dropped by a refresh don't pile up),
+    every screen row remembers the text and attribute last drawn there, and
+    a row is only re-sent when that pair differs. The frame is flushed with
+    noutrefresh()/doupdate() instead of clear()+refresh(), so moving the
+    cursor repaints two rows rather than the whole screen -- the difference
+    between smooth and flickering over a slow SSH link.
+
+    last_frame_ms and last_frame_bytes measure the most recent draw();
+    the byte count is the UTF-8 size of the text handed to curses.
+    """
+
+    def __init__(self, stdscr, highlight_attr=0, selected_attr=0, status_attr=0):
+        self.stdscr = stdscr
+        self.highlight_attr = highlight_attr
+        self.selected_attr = selected_attr
+        self.status_attr = status_attr
+        self._lines = {}
+        self._drawn = {}
+        self._rows = []
+        self._size = None
+        self.last_frame_ms = 0.0
+        self.last_frame_bytes = 0
+
+    def invalidate(self):
+        """Force a full repaint on the next draw (e.g. after a dialog)"""
+        self._rows = [None] * len(self._rows)
+        self.stdscr.touchwin()
+
+    def line_for(self, node, width):
+        """The node's display line fitted to width, cached per node"""
+        key = (node.selected, node.expanded, node.is_last, node.size, node.binary)
+        cached = self._lines.get(node)
+        if cached is None or cached[0] != key or cached[1] != width:
+            line = node.get_display_line()
+            # Truncate if too long
+            if len(line) > width - 1:
+                line = line[: width - 4] + "..."
+            cached = (key, width, line)
+        self._drawn[node] = cached
+        return cached[2]
+
+    def _put(self, y, text, attr):
+        if self._rows[y] == (text, attr):
+            return 0
+        self._rows[y] = (text, attr)
+        self.stdscr.move(y, 0)
+        self.stdscr.clrtoeol()
+        if text:
+            self.stdscr.addstr(y, 0, text, attr)
+        return len(text.encode("utf-8"))
+
+    def draw(self, rows, current_idx, scroll_offset, status_line, help_text):
+        """Bring the screen up to date with rows and the status/help bars"""
+        self._drawn = {}
+        self._paint(
+            rows, self.line_for, current_idx, scroll_offset, status_line, help_text
+        )
+        self._lines = self._drawn
+
+    def draw_lines(self, items, current_idx, scroll_offset, status_line, help_text):
+        """Like draw(), for ready-made (text, selected) rows"""
+        self._paint(
+            items, self._fit_item, current_idx, scroll_offset, status_line, help_text
+        )
+
+    @staticmethod
+    def _fit_item(item, width):
+        text = item[0]
+        if len(text) > width - 1:
+            text = text[: width - 4] + "..."
+        return text
+
+    def _paint(self, rows, line_fn, current_idx, scroll_offset, status_line, help_text):
+        started = time.perf_counter()
+        height, width = self.stdscr.getmaxyx()
+        if (height, width) != self._size:
+            # New geometry: nothing on screen can be trusted any more
+            self._size = (height, width)
+            self._rows = [None] * height
+            self.stdscr.clear()
+
+        written = 0
+        visible_lines = height - 4
+        for y in range(max(visible_lines, 0)):
+            i = scroll_offset + y
+            if i < len(rows):
+                row = rows[i]
+                text = line_fn(row, width)
+                if i == current_idx:
+                    attr = self.highlight_attr
+                elif row.selected if isinstance(row, FileNode) else row[1]:
+                    attr = self.selected_attr
+                else:
+                    attr = 0
+            else:
+                text, attr = "", 0
+            written += self._put(y, text, attr)
+
+        if height >= 3:
+            written += self._put(height - 3, status_line[: width - 1], self.status_attr)
+            written += self._put(height - 2, "─" * min(width - 1, len(help_text)), 0)
+            written += self._put(height - 1, help_text[: width - 1], 0)
+
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+        self.last_frame_ms = (time.perf_counter() - started) * 1000
+        self.last_frame_bytes = written
+
+
+# Enough to fill a tall terminal; ranking more than can be shown is wasted work
+FINDER_RESULT_LIMIT = 200
+
+FINDER_HELP_TEXT = "Type to filter | ↑/↓: Navigate | Enter/Tab: Select | Backspace: Erase | ESC: Back to tree"
+
+
+def build_path_index(root_node, load=True):
+    """
+    Index every file under root_node for the finder, listing whatever the
+    tree has not loaded yet (or, with load=False, only what is listed
+    already). Paths are relative to the root.
+    """
+    if load and root_node.loader is not None:
+        root_node.loader.load_all(root_node)
+    paths, nodes = [], []
+    stack = [(child, "") for child in reversed(root_node.children)]
+    while stack:
+        node, prefix = stack.pop()
+        if node.is_dir:
+            prefix += node.name + "/"
+            stack.extend((child, prefix) for child in reversed(node.children))
+        else:
+            paths.append(prefix + node.name)
+            nodes.append(node)
+    from xtrshow.finder import PathIndex
+
+    return PathIndex(paths, nodes)
+
+
+def run_finder(stdscr, renderer, index):
+    """
+    Type-to-filter mode: rank the index against the query as it is typed
+    and toggle the selection of the chosen files. Returns on ESC.
+    """
+    from xtrshow.finder import FuzzyFinder
+
+    finder = FuzzyFinder(index)
+    current_idx = 0
+    scroll_offset = 0
+    results = finder.results(limit=FINDER_RESULT_LIMIT)
+
+    while True:
+        height, width = stdscr.getmaxyx()
+        visible_lines = max(height - 4, 1)
+        current_idx = max(0, min(current_idx, len(results) - 1))
+        if current_idx < scroll_offset:
+            scroll_offset = current_idx
+        elif current_idx >= scroll_offset + visible_lines:
+            scroll_offset = current_idx - visible_lines + 1
+
+        items = [
+            (
+                f"{'[×]' if index.items[i].selected else '[ ]'} {index.paths[i]}",
+                index.items[i].selected,
+            )
+            for i in results
+        ]
+        status_line = f"Find: {finder.query}_  ({finder.count} of {len(index)})"
+        renderer.draw_lines(
+            items, current_idx, scroll_offset, status_line, FINDER_HELP_TEXT
+        )
+
+        key = stdscr.getch()
+        if key == 27:  # ESC
+            return
+        elif key == curses.KEY_UP and current_idx > 0:
+            current_idx -= 1
+        elif key == curses.KEY_DOWN and current_idx < len(results) - 1:
+            current_idx += 1
+        elif key in (ord("\t"), ord("\n"), curses.KEY_ENTER, 10, 13):
+            if results:
+                node = index.items[results[current_idx]]
+                set_selected(node, not node.selected)
+        elif key in (curses.KEY_BACKSPACE, 127, 8):
+            finder.pop()
+            results = finder.results(limit=FINDER_RESULT_LIMIT)
+            current_idx = 0
+        elif 32 <= key < 127:
+            finder.push(chr(key))
+            results = finder.results(limit=FINDER_RESULT_LIMIT)
+            current_idx = 0
+
+
+def main_curses(stdscr, root_node):
     """Main TUI loop using curses"""
     curses.curs_set(0)  # Hide cursor
     curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Highlight
@@ -260,14 +1360,48 @@ def main_curses(stdscr, root_node, hidden_count):
     current_idx = 0
     scroll_offset = 0
 
+    # Visible nodes, updated in place as directories are (un)folded
+    nodes = VisibleRows(root_node)
+    # Built on the first "/" and reused for every later search; one built
+    # mid-scan covers only what was listed, so it is rebuilt next time
+    path_index = None
+    path_index_partial = False
+    loader = root_node.loader
+    watching = loader is not None and loader.watcher is not None
+    scanning = None
+
+    renderer = TreeRenderer(
+        stdscr, curses.color_pair(1), curses.color_pair(2), curses.color_pair(3)
+    )
+
     while True:
-        # Get visible nodes
-        nodes = flatten_tree(root_node, visible_only=True)
+        # While a background scan runs, wake up regularly to show progress;
+        # with a watcher, less often to pick up filesystem changes
+        now_scanning = loader is not None and loader.scanning
+        if now_scanning != scanning:
+            scanning = now_scanning
+            if scanning:
+                stdscr.timeout(100)
+            else:
+                stdscr.timeout(WATCH_INTERVAL_MS if watching else -1)
+        nodes.refresh()
+
+        if watching:
+            changed = loader.apply_changes()
+            if changed:
+                # Keep the cursor on the same node as rows come and go
+                current_node = nodes[min(current_idx, len(nodes) - 1)]
+                for node in changed:
+                    nodes.rebuild(node)
+                try:
+                    current_idx = nodes.nodes.index(current_node)
+                except ValueError:
+                    pass  # it was deleted; the clamp below keeps us in range
+                path_index = None
 
         # Get selection stats
         selected_count, size_str = get_selection_stats(root_node)
 
-        stdscr.clear()
         height, width = stdscr.getmaxyx()
         visible_lines = height - 4  # Leave room for help text and status bar
 
@@ -282,34 +1416,17 @@ def main_curses(stdscr, root_node, hidden_count):
         elif current_idx >= scroll_offset + visible_lines:
             scroll_offset = current_idx - visible_lines + 1
 
-        # Draw visible nodes
-        for i in range(scroll_offset, min(scroll_offset + visible_lines, len(nodes))):
-            node = nodes[i]
-            line = node.get_display_line()
-
-            # Truncate if too long
-            if len(line) > width - 1:
-                line = line[: width - 4] + "..."
-
-            y_pos = i - scroll_offset
-
-            if i == current_idx:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y_pos, 0, line)
-                stdscr.attroff(curses.color_pair(1))
-            elif node.selected:
-                stdscr.attron(curses.color_pair(2))
-                stdscr.addstr(y_pos, 0, line)
-                stdscr.attroff(curses.color_pair(2))
-            else:
-                stdscr.addstr(y_pos, 0, line)
-
         # Status bar
-        status_y = height - 3
-        stdscr.attron(curses.color_pair(3))
         status_left = f"Selected: {selected_count} files ({size_str})"
-        if hidden_count > 0:
-            status_right = f"{hidden_count} hidden"
+        # Directories are listed as they are opened, so this keeps climbing
+        hidden_count = loader.hidden_count if loader else 0
+        status_right = f"{hidden_count} hidden" if hidden_count > 0 else ""
+        if scanning:
+            status_right = (
+                f"Scanning... {loader.dir_count} dirs, {loader.file_count} files"
+                + (f", {status_right}" if status_right else "")
+            )
+        if status_right:
             status_line = (
                 status_left
                 + " " * (width - len(status_left) - len(status_right) - 1)
@@ -317,20 +1434,15 @@ def main_curses(stdscr, root_node, hidden_count):
             )
         else:
             status_line = status_left
-        stdscr.addstr(status_y, 0, status_line[: width - 1])
-        stdscr.attroff(curses.color_pair(3))
-
-        # Help text
-        help_text = "↑/↓: Navigate | ←/→: Collapse/Expand | SPC: Select | a/A: Select/Deselect All | p: Export | q: Quit"
-        stdscr.addstr(height - 2, 0, "─" * min(width - 1, len(help_text)))
-        stdscr.addstr(height - 1, 0, help_text[: width - 1])
 
-        stdscr.refresh()
+        renderer.draw(nodes, current_idx, scroll_offset, status_line, HELP_TEXT)
 
         # Handle input
         key = stdscr.getch()
 
-        if key == curses.KEY_UP and current_idx > 0:
+        if key == -1:  # Timed out: redraw with the scan's progress
+            continue
+        elif key == curses.KEY_UP and current_idx > 0:
             current_idx -= 1
         elif key == curses.KEY_DOWN and current_idx < len(nodes) - 1:
             current_idx += 1
@@ -338,35 +1450,45 @@ def main_curses(stdscr, root_node, hidden_count):
             # Collapse directory
             current_node = nodes[current_idx]
             if current_node.is_dir and current_node.expanded:
-                current_node.expanded = False
+                nodes.collapse(current_idx)
             elif current_node.parent and current_node.depth > 0:
                 # If already collapsed or is a file, jump to parent
-                parent_idx = nodes.index(current_node.parent)
-                current_idx = parent_idx
+                current_idx = nodes.parent_index(current_idx)
         elif key == curses.KEY_RIGHT:
             # Expand directory
             current_node = nodes[current_idx]
             if current_node.is_dir and not current_node.expanded:
-                current_node.expanded = True
+                nodes.expand(current_idx)
             elif (
                 current_node.is_dir and current_node.expanded and current_node.children
             ):
                 # If already expanded, jump to first child
                 current_idx += 1
         elif key == ord(" "):  # Space to toggle selection
-            nodes[current_idx].selected = not nodes[current_idx].selected
+            set_selected(nodes[current_idx], not nodes[current_idx].selected)
         elif key == ord("a"):  # Select all in current directory/file
             current_node = nodes[current_idx]
             if current_node.is_dir:
                 select_all_in_directory(current_node, selected=True)
             else:
-                current_node.selected = True
+                set_selected(current_node, True)
         elif key == ord("A"):  # Deselect all in current directory/file
             current_node = nodes[current_idx]
             if current_node.is_dir:
                 select_all_in_directory(current_node, selected=False)
             else:
-                current_node.selected = False
+                set_selected(current_node, False)
+        elif key == ord("/"):  # Fuzzy finder over every file in the tree
+            if path_index is None or path_index_partial:
+                renderer.draw(
+                    nodes, current_idx, scroll_offset, "Indexing files...", HELP_TEXT
+                )
+                # Don't block on the scan: index what it has listed so far
+                path_index_partial = scanning
+                path_index = build_path_index(root_node, load=not scanning)
+            stdscr.timeout(-1)
+            run_finder(stdscr, renderer, path_index)
+            scanning = None  # restore the polling timeout
         elif key in (ord("q"), ord("Q")):  # Quit without output
             return None
         elif key in (ord("p"), ord("P"), ord("\n"), curses.KEY_ENTER, 10, 13):
@@ -374,19 +1496,109 @@ def main_curses(stdscr, root_node, hidden_count):
                 continue  # No files selected, do nothing
 
             # Show confirmation
-            if show_confirmation(stdscr, selected_count, size_str):
-                all_nodes = flatten_tree(root_node, visible_only=False)
-                selected_files = [n for n in all_nodes if n.selected and not n.is_dir]
-                return [str(node.path) for node in selected_files]
+            stdscr.timeout(-1)
+            confirmed = show_confirmation(stdscr, selected_count, size_str)
+            scanning = None  # restore the polling timeout
+            renderer.invalidate()  # the dialog painted over the tree
+            if confirmed:
+                return [str(node.path) for node in iter_selected_files(root_node)]
             else:
                 continue  # Return to tree view
 
 
+def _run_tui(args):
+    """Build the tree and let the user pick files: their paths, or None"""
+    # Determine ignore patterns
+    if args.no_ignore:
+        ignore_patterns = set()
+    elif args.ignore:
+        ignore_patterns = DEFAULT_IGNORE
+    else:
+        # Default: use ignore patterns
+        ignore_patterns = DEFAULT_IGNORE
+
+    from xtrshow.watch import create_watcher
+
+    scan_cache = None if args.no_cache else ScanCache()
+    watcher = None if args.no_watch else create_watcher()
+
+    # Build the file tree. Nothing is listed here: the TUI opens at once
+    # while a background scan lists the tree, and anything the user opens
+    # before the scan gets there is listed on the spot.
+    root_node, _ = build_file_tree(
+        args.directory,
+        args.max_depth,
+        args.pattern,
+        ignore_patterns,
+        lazy=True,
+        jobs=args.jobs,
+        cache=scan_cache,
+        gitignore=not args.no_ignore,
+        background=True,
+        watcher=watcher,
+        max_file_size=args.max_file_size,
+    )
+
+    if not root_node:
+        if watcher is not None:
+            watcher.close()
+        print(f"Error: Could not read directory '{args.directory}'", file=sys.stderr)
+        sys.exit(1)
+
+    # ESC leaves the finder; don't make it wait curses' default second
+    os.environ.setdefault("ESCDELAY", "25")
+    try:
+        return curses.wrapper(main_curses, root_node)
+    finally:
+        root_node.loader.stop_scan()
+        if watcher is not None:
+            watcher.close()
+        if scan_cache is not None:
+            scan_cache.save()
+
+
+def _track_export(args, manifest, result):
+    """
+    Fingerprint the files about to be exported. Returns the ones to export
+    -- all of them, or with --delta just the changed ones -- and the
+    fingerprints to record once they are exported.
+    """
+    # Save manifest after a fresh TUI selection
+    if not args.update:
+        manifest.select(result)
+        manifest.save()
+
+    # Stat'ed before the export: a file changing while it is read is seen
+    # as changed next time, never as unchanged. Only --delta reads files
+    # up front; otherwise the export hashes the bytes it reads anyway.
+    options = {"clean": args.clean}
+    fingerprints = {}
+    for path in result:
+        fingerprint = manifest.fingerprint(path, read=args.delta)
+        if fingerprint is not None:
+            fingerprints[path] = fingerprint
+    if args.delta:
+        result, unchanged, removed = split_delta(
+            result, fingerprints, manifest, options
+        )
+        print(
+            f"Delta: {len(result)} changed, {len(unchanged)} unchanged, "
+            f"{len(removed)} removed since the last export",
+            file=sys.stderr,
+        )
+        for path in removed:
+            print(f"# Removed: {path}", file=sys.stderr)
+    return result, fingerprints
+
+
+def _report_skipped(path, problem):
+    """on_problem for iter_export_blocks(): note a skipped file on stderr"""
+    print(f"# File: {path} ({problem})", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Interactive file tree selector")
-    parser.add_argument(
-        "-v", "--version", action="version", version=f"%(prog)s {get_version()}"
-    )
+    add_version_argument(parser)
     parser.add_argument(
         "directory",
         nargs="?",
@@ -399,11 +1611,43 @@ def main():
     parser.add_argument(
         "--pattern", type=str, default=None, help="Filter files by name pattern"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Threads used to list directories and read exported files "
+        "concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the scan and export caches in .xtrshow_cache/",
+    )
+    parser.add_argument(
+        "--no-watch",
+        action="store_true",
+        help="Do not watch the tree for changes while the TUI is open",
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=parse_size,
+        default=DEFAULT_MAX_FILE_SIZE,
+        metavar="SIZE",
+        help="Files larger than SIZE (e.g. 500K, 2M; 0 for no limit) are skipped "
+        'by "select all", as binary files are (default: 1M)',
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
         help="Omit line number prefixes (print raw file content)",
     )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Export files identical to one already exported as a one-line "
+        "reference to it",
+    )
     parser.add_argument(
         "--ignore",
         action="store_true",
@@ -412,7 +1656,7 @@ def main():
     parser.add_argument(
         "--no-ignore",
         action="store_true",
-        help="Show all files (disable default ignore patterns)",
+        help="Show all files (disable default ignore patterns and .gitignore)",
     )
     parser.add_argument(
         "-o", "--outfile", type=str, default=None, help="Print output to file"
@@ -431,6 +1675,20 @@ def main():
         action="store_true",
         help="Re-export previously selected files from .xtrshow_manifest without launching TUI",
     )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Like --update, but only export the files that changed since the "
+        "last export",
+    )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        metavar="SPEC",
+        help="Export these files without launching the TUI. A SPEC is a path, "
+        "path:START-END for some of its lines, or path::Name for a Python def "
+        "or class (Class.method works too)",
+    )
     parser.add_argument(
         "--prompt",
         "-p",
@@ -439,6 +1697,15 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.delta:
+        args.update = True
+    if args.files:
+        if args.update:
+            parser.error("--files cannot be combined with --update or --delta")
+        try:
+            selections = [parse_selection(spec) for spec in args.files]
+        except ValueError as e:
+            parser.error(str(e))
 
     if args.prompt:
         prompt_path = Path(__file__).parent / "assets" / "llm_prompt.md"
@@ -455,49 +1722,47 @@ def main():
             print(f"Directory '{directory}' is not writable. Cannot create file.")
             return
 
-    # Determine ignore patterns
-    if args.no_ignore:
-        ignore_patterns = set()
-    elif args.ignore:
-        ignore_patterns = DEFAULT_IGNORE
-    else:
-        # Default: use ignore patterns
-        ignore_patterns = DEFAULT_IGNORE
-
-    # Build the file tree
-    root_node, hidden_count = build_file_tree(
-        args.directory, args.max_depth, args.pattern, ignore_patterns
-    )
+    # Files given on the command line are a one-off: the manifest keeps
+    # the last selection made in the TUI
+    manifest = None if args.files else Manifest(MANIFEST_PATH)
+    block_cache = None
 
-    if not root_node:
-        print(f"Error: Could not read directory '{args.directory}'", file=sys.stderr)
-        sys.exit(1)
-
-    MANIFEST_PATH = Path(".xtrshow_manifest")
-
-    # Run the TUI (or load manifest for --update)
+    # Run the TUI (or load manifest for --update). Only the TUI needs the
+    # tree: a headless export costs what its files cost, however large
+    # the directory around them.
     try:
-        if args.update:
-            if not MANIFEST_PATH.exists():
+        if args.files:
+            result = selections
+        elif args.update:
+            if not manifest.exists:
                 print(
                     "Error: No .xtrshow_manifest found. Run xtrshow normally first to create one.",
                     file=sys.stderr,
                 )
                 sys.exit(1)
-            result = [l for l in MANIFEST_PATH.read_text().splitlines() if l.strip()]
+            result = list(manifest.paths)
             if not result:
                 print("Error: .xtrshow_manifest is empty.", file=sys.stderr)
                 sys.exit(1)
-            print(f"Updating {len(result)} file(s) from manifest...", file=sys.stderr)
+            # Sizes as of the last export, straight from the manifest
+            total_size = manifest.total_size()
+            size_note = (
+                f" ({format_size(total_size)})" if total_size is not None else ""
+            )
+            print(
+                f"Updating {len(result)} file(s){size_note} from manifest...",
+                file=sys.stderr,
+            )
         else:
-            result = curses.wrapper(main_curses, root_node, hidden_count)
+            result = _run_tui(args)
 
         if result is not None:
-            # Save manifest after a fresh TUI selection
-            if not args.update:
-                MANIFEST_PATH.write_text("\n".join(result) + "\n")
+            read = None
+            if manifest is not None:
+                result, fingerprints = _track_export(args, manifest, result)
+                if not args.delta:
+                    read = {}
 
-            output = []
             multi_dir = None
 
             if args.multi:
@@ -509,58 +1774,44 @@ def main():
                     print(f"Error creating directory {multi_dir}: {e}", file=sys.stderr)
                     return
 
-            for path in result:
-                try:
-                    with open(path, "r") as f:
-                        content = f.read().replace("\r\n", "\n")
-                        root_ext = os.path.splitext(path)
-                        file_extension = root_ext[1]
-
-                        if not args.clean:
-                            lines = content.splitlines()
-                            max_ln_width = len(str(len(lines)))
-                            formatted_content = "\n".join(
-                                f"{i + 1:>{max_ln_width}}:{line}"
-                                for i, line in enumerate(lines)
-                            )
-                        else:
-                            formatted_content = content
-
-                        # We construct the block using concatenation to avoid confusing LLM parsers
-                        # when this file is pasted into prompts.
-                        code_fence = "```"
-                        block = f"""
---- a/{path}
-+++ b/{path}
-{code_fence} {file_extension[1:] if file_extension.startswith(".") else file_extension}
-{formatted_content}
-{code_fence}
-"""
-                        if multi_dir:
-                            # Replace path separators with double underscore for flat filename
-                            safe_name = path.replace(os.sep, "__") + ".xtr.md"
-                            out_path = multi_dir / safe_name
-                            with open(out_path, "w") as out_f:
-                                out_f.write(block.strip())
-                        else:
-                            output.append(block)
-
-                except (IOError, UnicodeDecodeError) as e:
-                    print(f"# File: {path} (Error: {e})", file=sys.stderr)
-
-            if not multi_dir:
-                final_output = "\n".join(output)
-                if args.outfile:
-                    with open(args.outfile, "w") as outfile:
-                        outfile.write(final_output)
-                else:
-                    print(final_output)
-            else:
+            block_cache = None if args.no_cache else BlockCache()
+            blocks = iter_export_blocks(
+                result,
+                clean=args.clean,
+                jobs=args.jobs,
+                cache=block_cache,
+                dedup=args.dedup,
+                fingerprints=read,
+                on_problem=_report_skipped,
+            )
+            if multi_dir:
+                for path, block in blocks:
+                    # Replace path separators with double underscore for flat filename
+                    safe_name = path.replace(os.sep, "__") + ".xtr.md"
+                    out_path = multi_dir / safe_name
+                    try:
+                        with open(out_path, "w") as out_f:
+                            write_block(out_f, block, strip=True)
+                    except IOError as e:
+                        print(f"# File: {path} (Error: {e})", file=sys.stderr)
                 print(f"hint:\n\tcd {multi_dir}\n")
                 print('hint:\n\tfor file in *; do mv "$file" "r1_${file}"; done')
+            elif args.outfile:
+                with open(args.outfile, "w", buffering=EXPORT_BUFFER_SIZE) as outfile:
+                    write_export(blocks, outfile)
+            else:
+                write_export(blocks, sys.stdout)
+                sys.stdout.write("\n")
+            if manifest is not None:
+                fingerprints.update(read or {})
+                manifest.record(fingerprints, {"clean": args.clean})
+                manifest.save()
 
     except KeyboardInterrupt:
         pass
+    finally:
+        if block_cache is not None:
+            block_cache.save()
 
 
 if __name__ == "__main__":
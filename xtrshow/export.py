@@ -0,0 +1,638 @@
+# ./xtrshow/export.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+Export: turning a list of files into the text xtrshow hands to an LLM.
+
+Everything here works without a terminal -- nothing imports curses -- so
+other tools can build contexts in-process, as often as they like, instead
+of shelling out to xtrshow:
+
+    from xtrshow.export import BlockCache, export_text, iter_export_blocks
+
+    text = export_text(["src/app.py", "README.md"])
+
+    cache = BlockCache()  # reuse across calls: unchanged files cost a stat
+    for path, block in iter_export_blocks(paths, jobs=4, cache=cache):
+        ...
+
+iter_export_blocks() yields one block per file, in order, reading ahead on
+a thread pool with jobs > 1; write_export() streams them to any text file
+object exactly as xtrshow -o would. xtrshow.cli re-exports these names.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from xtrshow.manifest import RACY_WINDOW_NS
+from xtrshow.numbering import number_lines, number_lines_from
+from xtrshow.selection import Selection, read_lines
+
+# Lives next to .xtrshow_manifest, i.e. in the directory xtrshow is run from
+CACHE_DIR = Path(".xtrshow_cache")
+
+
+# Leading bytes checked for NUL to tell binary files from text (git's rule)
+SNIFF_BYTES = 8000
+
+
+def is_binary_file(path):
+    """True if the file's leading block contains a NUL byte"""
+    try:
+        with open(path, "rb") as f:
+            return b"\0" in f.read(SNIFF_BYTES)
+    except OSError:
+        return False
+
+
+def prepare_cache_dir(directory):
+    """Create a cache directory that git will not pick up"""
+    directory.mkdir(parents=True, exist_ok=True)
+    ignore_file = directory / ".gitignore"
+    if not ignore_file.exists():
+        ignore_file.write_text("# Created by xtrshow\n*\n")
+
+
+class BlockCache:
+    """
+    On-disk cache of formatted export blocks, so re-exporting unchanged
+    files (xtrshow --update, iteration after iteration) costs a stat and a
+    copy instead of a read, decode and reformat.
+
+    Blocks are stored content-addressed under blocks/: a block's name is
+    the SHA-256 of the file's bytes, its path as written in the header and
+    the --clean flag -- everything the block depends on. An index maps
+    (path, size, mtime_ns, inode, device, clean) to that name, so an
+    unchanged file is found from its stat alone. When the stat changed but
+    the bytes did not (a touch, a checkout), hashing the content finds the
+    block again. The cache is capped at max_bytes; least recently used
+    blocks are evicted first.
+    """
+
+    VERSION = 1
+
+    MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = Path(root) if root is not None else CACHE_DIR / "blocks"
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+        self.stats = {}  # stat key -> block name
+        # block name -> [size, last used], least recently used first, so
+        # eviction takes blocks off the front instead of sorting them all
+        self.blocks = {}
+        self.total_bytes = 0
+        self._keys = {}  # block name -> stat keys naming it
+        self._made = set()  # blob directories known to exist
+        self.dirty = False
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def _index_path(self):
+        return self.root / "index.json"
+
+    def _load(self):
+        try:
+            data = json.loads(self._index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self.stats = data.get("stats", {})
+            blocks = data.get("blocks", {})
+            self.blocks = dict(sorted(blocks.items(), key=lambda item: item[1][1]))
+            self.total_bytes = sum(size for size, _ in self.blocks.values())
+            for key, name in self.stats.items():
+                self._keys.setdefault(name, set()).add(key)
+
+    def _blob(self, name):
+        return self.root / name[:2] / name[2:]
+
+    @staticmethod
+    def _stat_key(path, st, clean):
+        return (
+            f"{path}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ino}\0{st.st_dev}"
+            f"\0{int(bool(clean))}"
+        )
+
+    @staticmethod
+    def block_name(path, data, clean):
+        """Content address of the block for path holding data"""
+        import hashlib
+
+        digest = hashlib.sha256(f"{int(bool(clean))}\0{path}\0".encode("utf-8"))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _read(self, name):
+        try:
+            text = self._blob(name).read_bytes().decode("utf-8", "surrogatepass")
+        except OSError:
+            return None
+        with self._lock:
+            record = self.blocks.pop(name, None)
+            if record is not None:
+                record[1] = time.time()
+                self.blocks[name] = record
+                self.dirty = True
+        return text
+
+    def lookup(self, path, st, clean):
+        """The cached block for path if its stat is unchanged, else None"""
+        with self._lock:
+            name = self.stats.get(self._stat_key(path, st, clean))
+            if name is None or name not in self.blocks:
+                return None
+        block = self._read(name)
+        if block is not None:
+            self.hits += 1
+        return block
+
+    def lookup_content(self, path, st, clean, data):
+        """
+        The cached block for path holding data, found by content hash when
+        the stat did not match. Returns (block or None, block name).
+        """
+        name = self.block_name(path, data, clean)
+        with self._lock:
+            known = name in self.blocks
+        block = self._read(name) if known else None
+        if block is None:
+            self.misses += 1
+            return None, name
+        self.hits += 1
+        self._remember(path, st, clean, name)
+        return block, name
+
+    def _remember(self, path, st, clean, name):
+        if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        key = self._stat_key(path, st, clean)
+        with self._lock:
+            old = self.stats.get(key)
+            if old is not None and old != name:
+                self._keys.get(old, set()).discard(key)
+            self.stats[key] = name
+            self._keys.setdefault(name, set()).add(key)
+            self.dirty = True
+
+    def store(self, path, st, clean, name, block):
+        """Add a freshly formatted block, evicting old ones over the cap"""
+        encoded = block.encode("utf-8", "surrogatepass")
+        if len(encoded) > self.max_bytes:
+            return
+        blob = self._blob(name)
+        try:
+            if name[:2] not in self._made:
+                prepare_cache_dir(self.root)
+                blob.parent.mkdir(exist_ok=True)
+                self._made.add(name[:2])
+            tmp = blob.with_name(f"{blob.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(encoded)
+            os.replace(tmp, blob)
+        except OSError:
+            return
+        with self._lock:
+            record = self.blocks.pop(name, None)
+            if record is not None:
+                self.total_bytes -= record[0]
+            self.blocks[name] = [len(encoded), time.time()]
+            self.total_bytes += len(encoded)
+            self.dirty = True
+        self._remember(path, st, clean, name)
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            if self.total_bytes <= self.max_bytes:
+                return
+            doomed = []
+            for name, (size, _) in self.blocks.items():
+                if self.total_bytes <= self.max_bytes:
+                    break
+                doomed.append(name)
+                self.total_bytes -= size
+            for name in doomed:
+                del self.blocks[name]
+                for key in self._keys.pop(name, ()):
+                    if self.stats.get(key) == name:
+                        del self.stats[key]
+            self.dirty = True
+        for name in doomed:
+            try:
+                self._blob(name).unlink()
+            except OSError:
+                pass
+
+    def save(self):
+        """Write the index back if anything changed; failures are not fatal"""
+        if not self.dirty:
+            return
+        try:
+            prepare_cache_dir(self.root)
+            tmp = self._index_path.with_name("index.json.tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "version": self.VERSION,
+                        "stats": self.stats,
+                        "blocks": self.blocks,
+                    },
+                    separators=(",", ":"),
+                )
+            )
+            os.replace(tmp, self._index_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: could not write block cache: {e}", file=sys.stderr)
+
+
+# Write buffer for --outfile: few, large writes however many files there are
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+
+# Files at least this large are exported through a memory map, in pieces
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Bytes of a mapped file decoded and formatted at a time
+MMAP_CHUNK_SIZE = 1024 * 1024
+
+
+def _block_parts(path):
+    """The text before and after the listing in a file's export block"""
+    file_extension = os.path.splitext(path)[1]
+    # We construct the block using concatenation to avoid confusing LLM parsers
+    # when this file is pasted into prompts.
+    code_fence = "```"
+    head = f"""
+--- a/{path}
++++ b/{path}
+{code_fence} {file_extension[1:] if file_extension.startswith(".") else file_extension}
+"""
+    return head, f"\n{code_fence}\n"
+
+
+def format_block(path, content, clean=False):
+    """One file's export block: a diff-style header and a fenced listing"""
+    content = content.replace("\r\n", "\n")
+
+    if not clean:
+        formatted_content = number_lines(content)
+    else:
+        formatted_content = content
+
+    head, tail = _block_parts(path)
+    return head + formatted_content + tail
+
+
+# What str.splitlines() splits on, once \r has been translated
+_LINE_BREAKS = tuple("\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+def _mapped_text(path):
+    """
+    Decoded text of a large file, in pieces, without reading it into memory
+    whole: the file is memory-mapped and decoded MMAP_CHUNK_SIZE bytes at a
+    time. Newlines are translated as open(path, "r") does (\r\n and lone
+    \r become \n), a \r at the end of a piece waiting for the next one.
+    """
+    import codecs
+    import locale
+    import mmap
+
+    decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        held = ""
+        for pos in range(0, len(m), MMAP_CHUNK_SIZE):
+            text = held + decoder.decode(m[pos : pos + MMAP_CHUNK_SIZE])
+            held = ""
+            if text.endswith("\r"):
+                text, held = text[:-1], "\r"
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            yield text
+        text = held + decoder.decode(b"", final=True)
+        yield text.replace("\r", "\n")
+
+
+def _mapped_lines(texts):
+    """
+    Lists of lines of a large file as str.splitlines() would split it,
+    from the pieces of text _mapped_text() decodes it to
+    """
+    partial = ""
+    for text in texts:
+        text = partial + text
+        lines = text.splitlines()
+        # Anything after the last line break continues in the next piece
+        partial = ""
+        if lines and not text.endswith(_LINE_BREAKS):
+            partial = lines.pop()
+        if lines:
+            yield lines
+    if partial:
+        yield [partial]
+
+
+def _digested(texts, digest):
+    """Pass pieces of text through, feeding them to digest on the way"""
+    for text in texts:
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        yield text
+
+
+def _export_mapped(path, clean, digest=None):
+    """
+    A large file's export block as an iterator of pieces. The file is
+    decoded once up front (counting its lines for the number width and
+    surfacing any UnicodeDecodeError before output starts), then again
+    piece by piece as the block is written. A hashlib digest, if given,
+    is fed the decoded text in that first pass.
+    """
+    texts = _mapped_text(path)
+    if digest is not None:
+        texts = _digested(texts, digest)
+    if clean:
+        for _ in texts:
+            pass
+    else:
+        count = sum(len(lines) for lines in _mapped_lines(texts))
+
+    def pieces():
+        head, tail = _block_parts(path)
+        yield head
+        if clean:
+            yield from _mapped_text(path)
+        else:
+            width = len(str(count))
+            number = 1
+            for lines in _mapped_lines(_mapped_text(path)):
+                yield ("\n" if number > 1 else "") + number_lines_from(
+                    lines, number, width
+                )
+                number += len(lines)
+        yield tail
+
+    return pieces()
+
+
+def _export_selection(selection, clean, cache=None):
+    """
+    Block for part of a file. Lines keep the file's own numbers; the
+    width is that of the last one, as for the whole file. With a cache,
+    line-offset indexes of large files are kept in its lines/ directory.
+    """
+    if is_binary_file(selection.path):
+        return None, "binary, skipped"
+    lines_dir = cache.root / "lines" if cache is not None else None
+    try:
+        start, end = selection.resolve(lines_dir)
+        lines = read_lines(selection.path, start, end, lines_dir)
+    except (OSError, ValueError, SyntaxError) as e:
+        # ValueError covers UnicodeDecodeError
+        return None, f"Error: {e}"
+    if clean:
+        listing = "\n".join(lines)
+    else:
+        listing = number_lines_from(lines, start, len(str(end)))
+    head, tail = _block_parts(selection.path)
+    return head + listing + tail, None
+
+
+def _export_one(path, clean, cache=None, fingerprints=None, digest=None):
+    """
+    Read and format one file: (block, None), or (None, why it was skipped).
+    If fingerprints is a dict, the manifest fingerprint of each file read
+    in full goes in it, taken from the bytes read for the export. digest
+    is passed on to _export_mapped() for large files.
+    """
+    if isinstance(path, Selection):
+        return _export_selection(path, clean, cache)
+    try:
+        st = os.stat(path)
+        if cache is not None and st.st_size < MMAP_THRESHOLD:
+            block = cache.lookup(path, st, clean)
+            if block is not None:
+                return block, None
+    except OSError as e:
+        return None, f"Error: {e}"
+    # Checked on the file itself: the manifest and the scan cache
+    # may predate it, and a binary must not be read in full
+    if is_binary_file(path):
+        return None, "binary, skipped"
+    try:
+        if st.st_size >= MMAP_THRESHOLD:
+            return _export_mapped(path, clean, digest), None
+        if cache is None and fingerprints is None:
+            with open(path, "r") as f:
+                content = f.read()
+            return format_block(path, content, clean), None
+        with open(path, "rb") as f:
+            data = f.read()
+        if fingerprints is not None:
+            from xtrshow.manifest import data_fingerprint
+
+            fingerprints[path] = data_fingerprint(st, data)
+        name = None
+        if cache is not None:
+            block, name = cache.lookup_content(path, st, clean, data)
+            if block is not None:
+                return block, None
+        import io
+
+        # Decoded exactly as open(path, "r") would have
+        content = io.TextIOWrapper(io.BytesIO(data)).read()
+    except (IOError, ValueError) as e:
+        # ValueError covers UnicodeDecodeError
+        return None, f"Error: {e}"
+    block = format_block(path, content, clean)
+    if cache is not None:
+        cache.store(path, st, clean, name, block)
+    return block, None
+
+
+def _export_hashed(path, clean, cache=None, fingerprints=None):
+    """
+    _export_one() plus a digest of what the block lists, for --dedup.
+    Files whose blocks would list the same text get the same digest; large
+    mapped files are digested from their text as _export_mapped() decodes
+    it up front, without being formatted or read again.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    block, problem = _export_one(path, clean, cache, fingerprints, digest)
+    if problem is not None:
+        return block, problem, None
+    if isinstance(block, str):
+        head, _ = _block_parts(getattr(path, "path", path))
+        body = block[len(head) :]
+        digest.update(body.encode("utf-8", "surrogatepass"))
+    return block, None, digest.digest()
+
+
+def reference_block(path, original):
+    """One-line block standing in for a file identical to original"""
+    return f"\n# File: {path} (identical to {original})\n"
+
+
+def iter_export_blocks(
+    paths,
+    clean=False,
+    jobs=1,
+    cache=None,
+    dedup=False,
+    fingerprints=None,
+    on_problem=None,
+):
+    """
+    Yield (path, block) for each path, in order. Binary and unreadable
+    files are skipped; on_problem(path, problem), if given, is called for
+    each of them, problem being e.g. "binary, skipped" or "Error: ...". A
+    block is a str, except for files of MMAP_THRESHOLD bytes or more: those
+    come as an iterator of pieces, produced as they are written (see
+    write_block()).
+
+    With jobs > 1 files are read and formatted on a thread pool, which
+    hides I/O latency on cold caches and network mounts. Only a small
+    window of files is in flight ahead of the one being yielded, so
+    memory stays bounded, and results (problems included) come out in
+    the order of paths -- the output is identical to jobs=1.
+
+    cache is an optional BlockCache serving blocks of unchanged files.
+
+    With dedup=True a file whose listing is identical to one yielded
+    earlier comes as a one-line reference_block() to that file instead.
+
+    fingerprints, if a dict, collects the manifest fingerprint of every
+    file read in full (see xtrshow.manifest), hashed from the bytes the
+    export reads anyway. Files served from the cache by their stat, mapped
+    files and binaries are not read in full and are left out.
+
+    paths may also hold Selection objects (see xtrshow.selection): their
+    blocks list just the selected lines, and they are yielded under their
+    spec, e.g. "src/app.py:10-40".
+    """
+    export_one = _export_hashed if dedup else _export_one
+    if fingerprints is not None:
+        import functools
+
+        export_one = functools.partial(export_one, fingerprints=fingerprints)
+    if jobs > 1:
+        results = _export_parallel(paths, clean, jobs, cache, export_one)
+    else:
+        results = ((path, export_one(path, clean, cache)) for path in paths)
+    seen = {}  # digest -> first path with it
+    for path, (block, problem, *digest) in results:
+        if problem is not None:
+            if on_problem is not None:
+                on_problem(str(path), problem)
+            continue
+        if digest:
+            if digest[0] in seen:
+                block = reference_block(path, seen[digest[0]])
+            else:
+                seen[digest[0]] = path
+        yield str(path), block
+
+
+def _export_parallel(paths, clean, jobs, cache, export_one):
+    """(path, export_one() result) pairs in order, computed on a pool"""
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        window = deque()
+        for path in paths:
+            window.append((path, pool.submit(export_one, path, clean, cache)))
+            if len(window) >= jobs * 2:
+                path, future = window.popleft()
+                yield path, future.result()
+        while window:
+            path, future = window.popleft()
+            yield path, future.result()
+
+
+def split_delta(paths, fingerprints, manifest, options):
+    """
+    (changed, unchanged, removed) for an export of paths, given their
+    current fingerprints (missing for files that are gone) and the
+    manifest of the last export. Everything counts as changed if that
+    export ran with other options.
+    """
+    changed, unchanged, removed = [], [], []
+    for path in paths:
+        fingerprint = fingerprints.get(path)
+        if fingerprint is None:
+            removed.append(path)
+        elif manifest.options != options or manifest.changed(path, fingerprint):
+            changed.append(path)
+        else:
+            unchanged.append(path)
+    selected = set(paths)
+    removed.extend(p for p in manifest.files if p not in selected)
+    return changed, unchanged, removed
+
+
+def write_block(out, block, strip=False):
+    """
+    Write one block from iter_export_blocks() to out. strip=True drops the
+    newline that opens and the one that closes every block.
+    """
+    if isinstance(block, str):
+        out.write(block[1:-1] if strip else block)
+        return
+    previous = None
+    for piece in block:
+        if previous is not None:
+            out.write(previous)
+        elif strip:
+            piece = piece[1:]
+        previous = piece
+    if previous is not None:
+        out.write(previous[:-1] if strip else previous)
+
+
+def write_export(blocks, out):
+    """
+    Write (path, block) pairs to out as they come, separated exactly like
+    "\n".join() of all of them, without ever holding them all at once.
+    Returns the number of blocks written.
+    """
+    count = 0
+    for _, block in blocks:
+        if count:
+            out.write("\n")
+        write_block(out, block)
+        count += 1
+    return count
+
+
+def export_text(paths, clean=False, jobs=1, cache=None, dedup=False, on_problem=None):
+    """The whole export of paths as one string, as xtrshow -o writes it"""
+    import io
+
+    blocks = iter_export_blocks(
+        paths, clean=clean, jobs=jobs, cache=cache, dedup=dedup, on_problem=on_problem
+    )
+    out = io.StringIO()
+    write_export(blocks, out)
+    return out.getvalue()
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,360 @@
+# ./xtrshow/finder.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+Fuzzy path finder behind the TUI's type-to-filter mode.
+
+A PathIndex is built once over every scanned path. Along with the paths
+it keeps, for every byte that occurs in them, a bitmap of the paths that
+contain it: one bit per path, in a single Python int. A FuzzyFinder
+session then narrows the index one keystroke at a time by AND-ing the
+previous candidates with the typed character's bitmap -- a few
+microseconds' work in C, however many paths there are -- and backspace
+pops back to the bitmap it came from. No keystroke loops over the paths.
+
+The candidates are a superset of the true fuzzy matches -- they only
+guarantee that every query character occurs somewhere in the path. The
+order check and the real scoring are deferred to results(), which looks at
+a small pool of the most promising candidates instead of all of them.
+
+The index keeps its paths shortest first and joined into one string, and
+their file names in another. The pool is filled tier by tier in the order
+score() ranks them -- file names starting with the query, file names
+containing it, paths containing it, in-order matches -- with str.find()
+and a regex, both running in C and stopping as soon as the pool is full.
+Matches come out shortest first without any sorting. When a search runs to
+the end without filling the pool it has found every match, and since a
+longer query can only match fewer paths, the keystrokes after it filter
+that short list instead of searching again.
+"""
+
+import operator
+import re
+from bisect import bisect_right
+from itertools import accumulate, compress, repeat
+
+# How many candidates results() scores in full. Everything else is ranked
+# by the cheap pre-ranking alone.
+SCORE_POOL = 256
+
+# Match tiers results() fills its pool from (see FuzzyFinder._tiers)
+_TIERS = 4
+
+# Characters paths are mostly made of (lowercase: the index is)
+_PATH_BYTES = b"abcdefghijklmnopqrstuvwxyz0123456789/._- "
+
+_TO_DIGITS = bytes.maketrans(b"\0\1", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\0\1")
+
+
+def _encode(text):
+    # Undecodable file names arrive as lone surrogates
+    return text.encode("utf-8", "surrogatepass")
+
+
+def _subsequence_regex(query):
+    """
+    Regex finding query's characters in order within one path of the
+    index's joined text (paths are separated by NUL bytes)
+    """
+    parts = [re.escape(query[0])]
+    for c in query[1:]:
+        e = re.escape(c)
+        # A negated class instead of .*? keeps the match linear
+        parts.append(f"[^{e}\0]*{e}")
+    return re.compile("".join(parts))
+
+
+def _name(path):
+    return path[path.rfind("/") + 1 :]
+
+
+def score(path, query):
+    """
+    Rank of a (lowercased) path for a (lowercased) query; higher is better,
+    None if the query is not a subsequence of the path.
+
+    Contiguous matches in the file name beat contiguous matches elsewhere,
+    which beat scattered matches; ties favour earlier, tighter and shorter.
+    """
+    base = path.rfind("/") + 1
+    pos = path.find(query, base)
+    if pos >= 0:
+        return 3_000_000 - (pos - base) * 1000 - len(path)
+    pos = path.find(query)
+    if pos >= 0:
+        return 2_000_000 - pos * 1000 - len(path)
+
+    # Greedy subsequence: total gap between matched characters
+    gaps = 0
+    at = -1
+    for c in query:
+        nxt = path.find(c, at + 1)
+        if nxt < 0:
+            return None
+        if at >= 0:
+            gaps += nxt - at - 1
+        at = nxt
+    return 1_000_000 - gaps * 1000 - len(path)
+
+
+class PathIndex:
+    """Every scanned path, lowercased once for matching"""
+
+    def __init__(self, paths, items=None):
+        self.paths = list(paths)
+        # Whatever the caller wants back for each path (e.g. tree nodes)
+        self.items = list(items) if items is not None else self.paths
+        self.lower = [p.lower() for p in self.paths]
+        # An int per path, a tuple for the rare case-insensitive duplicates:
+        # half a million small lists would make every full GC pass crawl
+        self._positions = {}
+        for i, p in enumerate(self.lower):
+            known = self._positions.setdefault(p, i)
+            if known != i:
+                if isinstance(known, int):
+                    known = (known,)
+                self._positions[p] = known + (i,)
+        # Each lowercase form once, shortest first (ties in index order)
+        self.shortest = sorted(self._positions, key=len)
+        self._text = "\0".join(self.shortest)
+        self._starts = list(accumulate((len(p) + 1 for p in self.shortest), initial=0))
+        # The file names alike, each after a NUL so a prefix is found too
+        names = [p.rpartition("/")[2] for p in self.shortest]
+        self._names = "\0" + "\0".join(names)
+        self._name_starts = list(
+            accumulate(map((1).__add__, map(len, names)), initial=0)
+        )
+        self.everything = (1 << len(self.shortest)) - 1
+        self._bitmaps = self._byte_bitmaps()
+
+    def _byte_bitmaps(self):
+        """
+        {byte: bitmap of the paths containing it}. The first path in
+        shortest is the most significant bit.
+        """
+        data = _encode(self._text)
+        lines = data.split(b"\0") if self.shortest else []
+        # Bytes of the usual path characters are checked directly (memchr);
+        # whatever else occurs is collected from what is left without them
+        alphabet = [c for c in _PATH_BYTES if c in data]
+        alphabet += sorted(set(data.translate(None, _PATH_BYTES + b"\0")))
+        bitmaps = {}
+        for c in alphabet:
+            flags = bytes(map(operator.contains, lines, repeat(c)))
+            bitmaps[c] = int(flags.translate(_TO_DIGITS), 2)
+        return bitmaps
+
+    def bitmap(self, char):
+        """Bitmap of the paths containing every byte of char"""
+        bits = self.everything
+        for c in _encode(char):
+            bits &= self._bitmaps.get(c, 0)
+        return bits
+
+    def count(self, bits):
+        """How many paths a bitmap holds"""
+        return bin(bits).count("1")
+
+    def members(self, bits):
+        """The lowercase paths a bitmap holds, shortest first"""
+        if bits == self.everything:
+            return self.shortest
+        digits = format(bits, f"0{len(self.shortest)}b").encode()
+        return list(compress(self.shortest, digits.translate(_FROM_DIGITS)))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def positions(self, lowered):
+        """Indices of the paths whose lowercase form is lowered"""
+        found = self._positions.get(lowered, ())
+        return (found,) if isinstance(found, int) else found
+
+    def search(self, find, limit, found, names=False):
+        """
+        Add to found, shortest first, the lowercase paths in which find
+        matches, until found holds limit; find(pos) returns the offset of
+        the next match in the joined paths (or names) from pos on, or -1.
+        """
+        starts = self._name_starts if names else self._starts
+        pos = 0
+        while len(found) < limit:
+            at = find(pos)
+            if at < 0:
+                break
+            line = bisect_right(starts, at) - 1
+            found.setdefault(self.shortest[line], None)
+            pos = starts[line + 1]
+
+
+class FuzzyFinder:
+    """One interactive search over a PathIndex"""
+
+    def __init__(self, index):
+        self.index = index
+        self.query = ""
+        # _stack[k] is the candidate bitmap for the first k query characters;
+        # _found[k] holds, per tier of _tiers(), every path they match, once
+        # a search has found few enough to have seen them all (a longer
+        # query only narrows those lists)
+        self._stack = [index.everything]
+        self._found = [[None] * _TIERS]
+
+    @property
+    def candidates(self):
+        """The candidates' lowercase paths, shortest first"""
+        return self.index.members(self._stack[-1])
+
+    @property
+    def count(self):
+        return self.index.count(self._stack[-1])
+
+    def push(self, char):
+        """Extend the query by one character, narrowing the last candidates"""
+        c = char.lower()
+        bits = self._stack[-1]
+        if c not in self.query:
+            bits &= self.index.bitmap(c)
+        self.query += c
+        self._stack.append(bits)
+        self._found.append([None] * _TIERS)
+
+    def pop(self):
+        """Drop the last query character, restoring its candidate list"""
+        if self.query:
+            self.query = self.query[:-1]
+            self._stack.pop()
+            self._found.pop()
+
+    def set_query(self, query):
+        """Type query from scratch, reusing the longest common prefix"""
+        common = 0
+        for a, b in zip(self.query, query.lower()):
+            if a != b:
+                break
+            common += 1
+        while len(self.query) > common:
+            self.pop()
+        for c in query[common:]:
+            self.push(c)
+
+    def _tiers(self, query):
+        """
+        (tier, names, find, test) for each tier of score() matches, best
+        first: file names starting with the query, file names containing
+        it, paths containing it, paths matching it as a subsequence. find
+        searches the index's joined paths (or names) for the tier, test
+        checks a single path; a tier's matches include the previous ones'.
+        """
+        names, text = self.index._names, self.index._text
+        if "/" not in query:
+            prefix = "\0" + query
+            yield (
+                0,
+                True,
+                lambda pos: names.find(prefix, pos),
+                lambda p: _name(p).startswith(query),
+            )
+            yield (
+                1,
+                True,
+                lambda pos: names.find(query, pos),
+                lambda p: query in _name(p),
+            )
+        yield 2, False, lambda pos: text.find(query, pos), lambda p: query in p
+        if len(query) > 1:
+            search = _subsequence_regex(query).search
+
+            def find(pos):
+                m = search(text, pos)
+                return m.start() if m else -1
+
+            yield 3, False, find, lambda p: search(p) is not None
+
+    def _pool(self, query):
+        """The paths results() scores: the shortest of each tier in turn"""
+        found, previous = self._found[-1], self._found[-2]
+        tiers = list(self._tiers(query))
+        for tier, _, _, test in tiers:
+            if found[tier] is None and previous[tier] is not None:
+                found[tier] = [p for p in previous[tier] if test(p)]
+
+        # File names starting with the query are among those containing it:
+        # one search for the latter usually settles both tiers, and when it
+        # stops early its shortest matches are all the pool takes from them
+        named = None
+        if len(tiers) > 2 and found[0] is None:
+            named = found[1]
+            if named is None:
+                shortest = {}
+                self.index.search(tiers[1][2], SCORE_POOL, shortest, True)
+                named = list(shortest)
+                if len(named) < SCORE_POOL:
+                    found[1] = named
+            if found[1] is not None:
+                found[0] = [p for p in found[1] if tiers[0][3](p)]
+
+        pool = {}
+        for tier, names, find, test in tiers:
+            known = found[tier]
+            if known is None and tier == 1:
+                known = named
+            if known is not None:
+                for p in known:
+                    if len(pool) >= SCORE_POOL:
+                        break
+                    pool.setdefault(p, None)
+            else:
+                self.index.search(find, SCORE_POOL, pool, names)
+                if len(pool) < SCORE_POOL:
+                    # Searched to the end: the pool holds all of the tier
+                    found[tier] = sorted(pool, key=len)
+            if len(pool) >= SCORE_POOL:
+                break
+        return list(pool)
+
+    def results(self, limit=50):
+        """
+        Up to limit index positions, best match first.
+
+        A small pool is scored in full: the shortest matches of the best
+        tier score() ranks, topped up from the next tiers -- or every match,
+        when there are fewer than that.
+        """
+        query = self.query
+        if not query:
+            pool = self.index.shortest[:limit]
+            return [i for p in pool for i in self.index.positions(p)][:limit]
+        if not self._stack[-1]:
+            return []
+
+        pool = self._pool(query)
+
+        scored = []
+        for p in pool:
+            s = score(p, query)
+            if s is not None:
+                scored.append((-s, p))
+        scored.sort()
+
+        out = []
+        for _, p in scored:
+            out.extend(self.index.positions(p))
+            if len(out) >= limit:
+                break
+        return out[:limit]
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,210 @@
+# ./xtrshow/ignore.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+.gitignore-style ignore rules for the xtrshow tree.
+
+Each ignore file is compiled once into a single regex per entry kind, and
+each directory gets an IgnoreMatcher: the stack of every ignore file from
+the scan root down to that directory. The tree consults the matcher while
+listing a directory, so ignored subtrees are dropped before anyone lists
+them.
+
+Supported: comments, blank lines, `!` negation, trailing `/` (directories
+only), leading or inner `/` (anchored to the ignore file's directory),
+`*`, `?`, `[...]`, `**` and backslash escapes. Ignore files above the scan
+root, .git/info/exclude and the global excludes file are not read.
+"""
+
+import re
+from pathlib import Path
+
+# Read in this order, so .ignore (ripgrep/ag convention) wins over .gitignore
+IGNORE_FILES = (".gitignore", ".ignore")
+
+
+def _translate(pattern):
+    """Translate one gitignore glob (no '!' or trailing '/') into a regex"""
+    i, n = 0, len(pattern)
+    res = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                j = i + 2
+                # '**' only means "any depth" as a whole path segment
+                if (i == 0 or pattern[i - 1] == "/") and (j == n or pattern[j] == "/"):
+                    if j == n:
+                        res.append(".*")
+                        i = j
+                    else:
+                        res.append("(?:.*/)?")
+                        i = j + 1
+                    continue
+                res.append("[^/]*")
+                i = j
+                continue
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                body = pattern[i + 1 : j].replace("\\", "\\\\")
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                res.append(f"[{body}]")
+                i = j + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            res.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            res.append(re.escape(c))
+        i += 1
+    return "".join(res)
+
+
+def _parse_line(line):
+    """
+    Parse one ignore-file line into (regex, negate, dir_only), or None for
+    blank lines and comments.
+    """
+    line = line.rstrip("\r\n")
+    if not line or line.startswith("#"):
+        return None
+    # Trailing spaces are dropped unless escaped
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    if not line:
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    dir_only = line.endswith("/")
+    if dir_only:
+        line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to the file's directory;
+    # otherwise it matches the name at any depth below it.
+    anchored = "/" in line
+    regex = _translate(line.lstrip("/"))
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return regex, negate, dir_only
+
+
+def _combine(rules):
+    """
+    Fold rules into one regex. Alternatives are in reverse file order and
+    each is its own group, so on a fullmatch m.lastindex names the *last*
+    matching rule -- the one gitignore says wins.
+    """
+    if not rules:
+        return None, ()
+    rules = rules[::-1]
+    regex = re.compile("|".join(f"({r[0]})" for r in rules), re.DOTALL)
+    return regex, tuple(r[1] for r in rules)
+
+
+class IgnoreRules:
+    """The compiled rules of the ignore file(s) in one directory"""
+
+    def __init__(self, lines):
+        rules = [r for r in map(_parse_line, lines) if r]
+        self._files = _combine([r for r in rules if not r[2]])
+        self._dirs = _combine(rules)
+
+    def __bool__(self):
+        return self._dirs[0] is not None
+
+    def match(self, rel_path, is_dir):
+        """
+        True if rel_path (relative to the rules' directory) is ignored,
+        False if a '!' rule re-includes it, None if no rule applies.
+        """
+        regex, negations = self._dirs if is_dir else self._files
+        if regex is None:
+            return None
+        m = regex.fullmatch(rel_path)
+        if m is None:
+            return None
+        return not negations[m.lastindex - 1]
+
+
+def read_rules(dir_path, names):
+    """
+    Compile the ignore files of dir_path. names is the directory's listing,
+    so directories without ignore files cost nothing. Returns None when
+    there is nothing to apply.
+    """
+    lines = []
+    for filename in IGNORE_FILES:
+        if filename in names:
+            try:
+                text = Path(dir_path, filename).read_text(errors="replace")
+            except OSError:
+                continue
+            lines.extend(text.splitlines())
+    rules = IgnoreRules(lines) if lines else None
+    return rules or None
+
+
+class IgnoreMatcher:
+    """
+    Rule stack for one directory: (prefix, IgnoreRules) pairs, outermost
+    first, where prefix is this directory's path relative to the rules'
+    own directory. Deeper ignore files take precedence over shallower ones.
+    """
+
+    __slots__ = ("levels",)
+
+    def __init__(self, levels=()):
+        self.levels = levels
+
+    def descend(self, name, rules=None):
+        """Matcher for subdirectory name, adding that directory's own rules"""
+        levels = tuple((prefix + name + "/", r) for prefix, r in self.levels)
+        if rules:
+            levels += (("", rules),)
+        return IgnoreMatcher(levels)
+
+    def with_rules(self, rules):
+        """This directory's matcher extended by rules found in it"""
+        if not rules:
+            return self
+        return IgnoreMatcher(self.levels + (("", rules),))
+
+    def match(self, name, is_dir):
+        """True if the entry name in this directory is ignored"""
+        for prefix, rules in reversed(self.levels):
+            result = rules.match(prefix + name, is_dir)
+            if result is not None:
+                return result
+        return False
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
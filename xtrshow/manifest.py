@@ -0,0 +1,250 @@
+# ./xtrshow/manifest.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+The .xtrshow_manifest file: the last selection, and what it looked like
+when it was exported.
+
+Version 2 is JSON:
+
+    {"version": 2, "time_ns": ..., "options": {"clean": false},
+     "files": [{"path": "src/a.py", "size": 120, "mtime_ns": ...,
+                "ino": ..., "hash": "<sha256>", "lines": 7}, ...]}
+
+Files are kept in selection order. A file's fingerprint (everything but
+its path) describes it as of the last export; it is missing for files
+selected but never exported. With it, xtrshow --update can tell what
+changed from a stat alone, and report sizes and line counts without
+opening anything. The hash and line count are taken from the bytes the
+export reads, so binaries and files it did not read (large mapped ones,
+blocks served by the block cache) may only have their stat fields.
+
+Version 1 -- one path per line -- is still read. Its files carry no
+fingerprints, so everything in it counts as new.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+MANIFEST_PATH = Path(".xtrshow_manifest")
+
+VERSION = 2
+
+# A file or directory modified this close to an export or scan could change
+# again within the same mtime tick, so its stat is not trusted ("racy", as
+# in git). Shared with the block cache and the scan cache.
+RACY_WINDOW_NS = 2_000_000_000
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_STAT_FIELDS = ("size", "mtime_ns", "ino")
+
+
+def stat_fingerprint(st):
+    """Fingerprint of a file whose content was not read: its stat fields"""
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "ino": st.st_ino}
+
+
+def _content_fingerprint(st, chunks):
+    import hashlib
+
+    digest = hashlib.sha256()
+    breaks = 0
+    after_cr = False
+    last = b""
+    for chunk in chunks:
+        digest.update(chunk)
+        breaks += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+        if after_cr and chunk.startswith(b"\n"):
+            breaks -= 1
+        after_cr = chunk.endswith(b"\r")
+        last = chunk[-1:]
+    fingerprint = stat_fingerprint(st)
+    fingerprint["hash"] = digest.hexdigest()
+    fingerprint["lines"] = breaks + (1 if last and last not in b"\r\n" else 0)
+    return fingerprint
+
+
+def file_fingerprint(path, st=None):
+    """
+    Fingerprint of path: its stat fields, the SHA-256 of its bytes and its
+    line count as numbered on export (\\n, \\r\\n and \\r breaks), from one
+    pass over the file. Raises OSError.
+    """
+    if st is None:
+        st = os.stat(path)
+    with open(path, "rb") as f:
+        return _content_fingerprint(st, iter(lambda: f.read(HASH_CHUNK_SIZE), b""))
+
+
+def data_fingerprint(st, data):
+    """file_fingerprint() of a file whose bytes, data, are already read"""
+    return _content_fingerprint(st, [data])
+
+
+class Manifest:
+    """The selection in a manifest file, with its files' fingerprints"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self.exists = False
+        self.version = VERSION
+        self.paths = []
+        self.files = {}  # path -> fingerprint
+        self.options = None
+        self.time_ns = 0
+        self._started_ns = time.time_ns()
+        self._refused = False
+        self._load()
+
+    def _load(self):
+        try:
+            text = self.path.read_text()
+        except OSError:
+            return
+        self.exists = True
+        if text.lstrip().startswith("{"):
+            try:
+                data = json.loads(text)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                version = data.get("version")
+                # A newer version than this one knows is neither read nor,
+                # by save(), overwritten
+                if isinstance(version, int) and version > VERSION:
+                    self.version = version
+                if version == VERSION:
+                    self.time_ns = data.get("time_ns", 0)
+                    self.options = data.get("options")
+                    for entry in data.get("files", []):
+                        # Hand-edited or truncated entries are dropped
+                        if not isinstance(entry, dict):
+                            continue
+                        path = entry.pop("path", None)
+                        if not isinstance(path, str):
+                            continue
+                        self.paths.append(path)
+                        if entry:
+                            self.files[path] = entry
+                return
+        self.version = 1
+        self.paths = [line for line in text.splitlines() if line.strip()]
+
+    def total_size(self):
+        """Bytes in the selection as last exported, None if not all known"""
+        if any(p not in self.files for p in self.paths):
+            return None
+        return sum(self.files[p]["size"] for p in self.paths)
+
+    def fingerprint(self, path, read=True):
+        """
+        Current fingerprint of path, or None if it is gone or unreadable.
+        The file is only read when its stat no longer matches the recorded
+        fingerprint, and binaries never are. With read=False it is not read
+        at all: the export fills in the content (data_fingerprint()).
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        known = self.files.get(path)
+        if (
+            known is not None
+            and known.get("size") == st.st_size
+            and known.get("mtime_ns") == st.st_mtime_ns
+            and known.get("ino") == st.st_ino
+            and self.time_ns - st.st_mtime_ns >= RACY_WINDOW_NS
+        ):
+            return known
+        if not read:
+            return stat_fingerprint(st)
+        from xtrshow.export import is_binary_file
+
+        try:
+            if is_binary_file(path):
+                return stat_fingerprint(st)
+            return file_fingerprint(path, st)
+        except OSError:
+            return None
+
+    def changed(self, path, fingerprint):
+        """
+        True if path was not in the last export or its content differs.
+        Without a hash on both sides, only an unchanged stat counts as the
+        same content.
+        """
+        known = self.files.get(path)
+        if known is None:
+            return True
+        if known.get("hash") is None or fingerprint.get("hash") is None:
+            return any(known.get(f) != fingerprint[f] for f in _STAT_FIELDS)
+        return known["hash"] != fingerprint["hash"]
+
+    def select(self, paths):
+        """
+        Make paths the selection. Fingerprints of files that stay selected
+        are kept: they still describe the last export of those files.
+        """
+        self.paths = list(paths)
+        self.files = {p: self.files[p] for p in self.paths if p in self.files}
+
+    def record(self, fingerprints, options):
+        """Fingerprints and options of an export of the selection"""
+        self.files = {p: fingerprints[p] for p in self.paths if p in fingerprints}
+        self.options = options
+        # Fingerprints are taken after this, so nothing newer is trusted
+        self.time_ns = self._started_ns
+
+    def save(self):
+        """
+        Write the manifest, always as version 2 -- unless it was written by
+        a newer xtrshow, which is warned about (once) and left alone.
+        """
+        if self.version > VERSION:
+            if not self._refused:
+                self._refused = True
+                print(
+                    f"Warning: {self.path} is from a newer xtrshow "
+                    f"(version {self.version}); not overwriting it",
+                    file=sys.stderr,
+                )
+            return
+        files = []
+        for path in self.paths:
+            entry = {"path": path}
+            entry.update(self.files.get(path, {}))
+            files.append(entry)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": VERSION,
+                    "time_ns": self.time_ns,
+                    "options": self.options,
+                    "files": files,
+                },
+                indent=1,
+            )
+            + "\n"
+        )
+        os.replace(tmp, self.path)
+        self.exists = True
+        self.version = VERSION
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
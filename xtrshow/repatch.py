@@ -6,10 +6,9 @@ import sys
 import re
 import argparse
 import os
-import shutil
 from pathlib import Path
 
-from xtrshow import get_version
+from xtrshow import add_version_argument
 
 # Subdirectory of .xtrpatch/ that mirrors targets living outside the cwd.
 ABS_BACKUP_PREFIX = "_abs"
@@ -474,6 +473,8 @@ def get_backup_path(src_path, backup_dir_root):
 
 def create_backup(filepath):
     """Creates a versioned backup of the file."""
+    import shutil
+
     try:
         src = Path(filepath).resolve()
         backup_root = Path.cwd() / ".xtrpatch"
@@ -491,6 +492,8 @@ def archive_patch_file(patch_source_path, target_filepath, version_index):
     Copies the patch file to .xtrpatch/.../target_file.version.patch
     This stores the patch alongside the backup of the file it modified.
     """
+    import shutil
+
     if not patch_source_path:
         return
     try:
@@ -576,6 +579,8 @@ def save_error_report(target_filepath, version_index, log_content):
 
 def revert_file(target_file):
     """Reverts the file to its most recent backup."""
+    import shutil
+
     try:
         target = Path(target_file).resolve()
         backup_dir, filename = _backup_location(target)
@@ -994,9 +999,7 @@ def main():
         description="Apply AI-generated search/replace blocks",
         usage="%(prog)s [options] [target_file] [patch_file]",
     )
-    parser.add_argument(
-        "-v", "--version", action="version", version=f"%(prog)s {get_version()}"
-    )
+    add_version_argument(parser)
 
     parser.add_argument(
         "--revert", action="store_true", help="Revert file(s) to latest backup"
@@ -0,0 +1,238 @@
+# ./xtrshow/selection.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+Exporting part of a file: path:START-END and path::Symbol selections.
+
+    xtrshow/repatch.py:700-860      lines 700 to 860
+    xtrshow/repatch.py:700-         line 700 to the end
+    xtrshow/repatch.py:700          line 700 alone
+    xtrshow/cli.py::main            a def or class, decorators included
+    xtrshow/cli.py::TreeLoader.refresh
+
+Lines are counted the way xtrpatch counts them (\\n, \\r\\n and \\r end a
+line), so the numbers in an exported slice are the file's own and line
+hints written against them still apply.
+
+Slicing goes through a line-offset index: the byte offset at which each
+line starts, built in one chunked pass and kept in memory for the most
+recently used files (keyed by path, size and mtime_ns, so an edited file
+is indexed afresh). Given a cache directory, the index of a large file is
+kept on disk there as well, so the next xtrshow run finds it instead of
+reading the whole file again. Reading lines 700-860 of a large file is
+then one seek and one read of just those bytes.
+"""
+
+import functools
+import os
+import re
+
+# Files whose line-offset index is kept between slices
+LINE_INDEX_CACHE_SIZE = 64
+
+INDEX_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large have their line-offset index kept on disk
+PERSIST_INDEX_SIZE = 8 * 1024 * 1024
+
+_RANGE_SPEC = re.compile(r"(.+):(\d+)(?:-(\d*))?")
+_SYMBOL_SPEC = re.compile(r"(.+)::([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)")
+
+
+def _scan_lines(path):
+    from array import array
+    from itertools import accumulate
+
+    offsets = array("q", [0])
+    pos = 0
+    pending = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(INDEX_CHUNK_SIZE), b""):
+            parts = (pending + chunk).splitlines(keepends=True)
+            # The last part may go on in the next chunk: a line without its
+            # break yet, or a \r the next chunk may start with \n
+            pending = parts.pop() if not parts[-1].endswith(b"\n") else b""
+            ends = accumulate(map(len, parts), initial=pos)
+            next(ends)
+            offsets.extend(ends)
+            pos = offsets[-1]
+    if pending:
+        offsets.append(pos + len(pending))
+    return offsets
+
+
+def _index_file(cache_dir, path):
+    import hashlib
+
+    name = hashlib.sha256(path.encode("utf-8", "surrogatepass")).hexdigest()
+    return cache_dir / name
+
+
+def _load_index(cache_dir, path, size, mtime_ns):
+    """The index kept on disk for this version of path, or None"""
+    from array import array
+
+    offsets = array("q")
+    try:
+        offsets.frombytes(_index_file(cache_dir, path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    # Stamped with the size and mtime_ns it was built for
+    if len(offsets) < 3 or offsets[:2].tolist() != [size, mtime_ns]:
+        return None
+    offsets = offsets[2:]
+    return offsets if offsets[-1] == size else None
+
+
+def _store_index(cache_dir, path, size, mtime_ns, offsets):
+    import time
+    from array import array
+
+    from xtrshow.export import prepare_cache_dir
+    from xtrshow.manifest import RACY_WINDOW_NS
+
+    if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+        return
+    target = _index_file(cache_dir, path)
+    try:
+        prepare_cache_dir(cache_dir)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            array("q", [size, mtime_ns]).tofile(f)
+            offsets.tofile(f)
+        os.replace(tmp, target)
+    except OSError:
+        pass  # only costs the next run a rescan
+
+
+@functools.lru_cache(maxsize=LINE_INDEX_CACHE_SIZE)
+def _line_index(path, size, mtime_ns, cache_dir):
+    persist = cache_dir is not None and size >= PERSIST_INDEX_SIZE
+    offsets = _load_index(cache_dir, path, size, mtime_ns) if persist else None
+    if offsets is None:
+        offsets = _scan_lines(path)
+        if persist:
+            _store_index(cache_dir, path, size, mtime_ns, offsets)
+    return offsets
+
+
+def line_index(path, cache_dir=None):
+    """
+    Byte offsets at which each line of path starts, followed by the file's
+    size: line n (1-based) is bytes index[n - 1] to index[n], and the file
+    has len(index) - 1 lines. With cache_dir (a Path), the index of a file
+    of PERSIST_INDEX_SIZE bytes or more is kept there for later runs.
+    Raises OSError.
+    """
+    st = os.stat(path)
+    return _line_index(os.path.abspath(path), st.st_size, st.st_mtime_ns, cache_dir)
+
+
+def read_lines(path, start, end, cache_dir=None):
+    """Lines start to end (1-based, inclusive) of path, decoded like open()"""
+    import io
+
+    index = line_index(path, cache_dir)
+    with open(path, "rb") as f:
+        f.seek(index[start - 1])
+        data = f.read(index[end] - index[start - 1])
+    text = io.TextIOWrapper(io.BytesIO(data)).read()
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def find_symbol(path, name):
+    """
+    (start, end) lines of the def or class called name in a Python file,
+    decorators included. A dotted name looks inside classes and functions:
+    "TreeLoader.refresh". Raises ValueError (SyntaxError included) and
+    OSError.
+    """
+    import ast
+
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    definitions = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    body = tree.body
+    node = None
+    for part in name.split("."):
+        node = next(
+            (n for n in body if isinstance(n, definitions) and n.name == part), None
+        )
+        if node is None:
+            raise ValueError(f"no def or class named {name}")
+        body = node.body
+    start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+    return start, node.end_lineno
+
+
+class Selection:
+    """Part of a file named by a path:START-END or path::Symbol spec"""
+
+    __slots__ = ("path", "start", "end", "symbol")
+
+    def __init__(self, path, start=None, end=None, symbol=None):
+        self.path = path
+        self.start = start
+        self.end = end
+        self.symbol = symbol
+
+    def __str__(self):
+        if self.symbol is not None:
+            return f"{self.path}::{self.symbol}"
+        if self.end == self.start:
+            return f"{self.path}:{self.start}"
+        return f"{self.path}:{self.start}-{self.end or ''}"
+
+    def resolve(self, cache_dir=None):
+        """
+        (start, end) lines selected, checked against the file; cache_dir as
+        for line_index()
+        """
+        if self.symbol is not None:
+            return find_symbol(self.path, self.symbol)
+        count = len(line_index(self.path, cache_dir)) - 1
+        end = count if self.end is None else min(self.end, count)
+        if not 1 <= self.start <= end:
+            raise ValueError(f"{self}: the file has {count} lines")
+        return self.start, end
+
+
+def parse_selection(spec):
+    """
+    A Selection for a path:START-END or path::Symbol spec, or spec itself
+    when it names a whole file (including one with a colon in its name).
+    Raises ValueError for a range that ends before it starts.
+    """
+    if os.path.exists(spec):
+        return spec
+    m = _SYMBOL_SPEC.fullmatch(spec)
+    if m:
+        return Selection(m.group(1), symbol=m.group(2))
+    m = _RANGE_SPEC.fullmatch(spec)
+    if m:
+        start, end = int(m.group(2)), m.group(3)
+        if end is None:
+            end = start
+        else:
+            end = int(end) if end else None
+        if end is not None and end < start:
+            raise ValueError(f"{spec}: range ends before it starts")
+        return Selection(m.group(1), start, end)
+    return spec
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
@@ -0,0 +1,239 @@
+# ./xtrshow/watch.py
+# License: Apache-2.0 (disclaimer at bottom of file)
+"""
+Directory watching for the open xtrshow tree.
+
+A watcher is told about every directory the tree has listed, each under a
+key of the caller's choosing (the tree uses the directory's FileNode), and
+changes() hands back the keys of the directories whose entries have changed
+since the last call. The tree then re-lists just those directories.
+
+On Linux the kernel reports changes through inotify, reached with ctypes so
+there is nothing to install. Elsewhere -- or once inotify runs out of
+watches -- directories are polled instead: their mtime changes whenever an
+entry is created, deleted or renamed, and a bounded slice of them is
+stat'ed per call so a huge tree never stalls the UI. Polling does not see
+a file's size change in place; inotify does (IN_CLOSE_WRITE).
+"""
+
+import os
+import struct
+import sys
+import threading
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_EXCL_UNLINK = 0x04000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+    | IN_EXCL_UNLINK
+)
+
+_EVENT = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Watches directories by comparing their mtime, a slice per changes()"""
+
+    def __init__(self, batch=2000):
+        self.batch = batch
+        self._dirs = {}  # key -> [path, mtime_ns]
+        self._order = []
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def watch(self, path, key):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+        with self._lock:
+            if key not in self._dirs:
+                self._order.append(key)
+            self._dirs[key] = [path, mtime_ns]
+        return True
+
+    def unwatch(self, key):
+        with self._lock:
+            # _order is compacted lazily in changes()
+            self._dirs.pop(key, None)
+
+    def __len__(self):
+        return len(self._dirs)
+
+    def changes(self):
+        """Keys of watched directories whose mtime moved since last seen"""
+        with self._lock:
+            if len(self._order) > 2 * len(self._dirs):
+                self._order = [k for k in self._order if k in self._dirs]
+                self._cursor = 0
+            order = self._order
+            if not order:
+                return []
+            start = self._cursor % len(order)
+            picked = order[start : start + self.batch]
+            if len(picked) < self.batch:
+                picked += order[: min(start, self.batch - len(picked))]
+            self._cursor = start + len(picked)
+            records = [(k, self._dirs.get(k)) for k in picked]
+
+        changed = []
+        for key, record in records:
+            if record is None:
+                continue
+            try:
+                mtime_ns = os.stat(record[0]).st_mtime_ns
+            except OSError:
+                # Gone: its parent's mtime changed too and reports it
+                self.unwatch(key)
+                continue
+            if mtime_ns != record[1]:
+                record[1] = mtime_ns
+                changed.append(key)
+        return changed
+
+    def close(self):
+        with self._lock:
+            self._dirs.clear()
+            self._order = []
+
+
+class InotifyWatcher:
+    """
+    Watches directories through Linux inotify. Directories the kernel won't
+    take (max_user_watches exhausted) are polled by a PollingWatcher.
+    Raises OSError if inotify is unavailable.
+    """
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            self._add_watch = libc.inotify_add_watch
+            self._rm_watch = libc.inotify_rm_watch
+            init = libc.inotify_init1
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify is not available: {e}")
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._get_errno = ctypes.get_errno
+
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = self._get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._keys = {}  # wd -> key
+        self._wds = {}  # key -> wd
+        self._lock = threading.Lock()
+        self.fallback = PollingWatcher()
+
+    def watch(self, path, key):
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            # ENOSPC (out of watches) and friends: poll this one instead
+            return self.fallback.watch(path, key)
+        with self._lock:
+            self._keys[wd] = key
+            self._wds[key] = wd
+        return True
+
+    def unwatch(self, key):
+        with self._lock:
+            wd = self._wds.pop(key, None)
+            if wd is not None and self._keys.get(wd) is key:
+                del self._keys[wd]
+                self._rm_watch(self.fd, wd)
+        self.fallback.unwatch(key)
+
+    def __len__(self):
+        return len(self._wds) + len(self.fallback)
+
+    def changes(self):
+        """Keys of watched directories with pending events, in event order"""
+        changed = {}
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            if not chunk:
+                break
+            data += chunk
+
+        with self._lock:
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped: everything may have changed
+                    changed.update(dict.fromkeys(self._wds))
+                    continue
+                key = self._keys.get(wd)
+                if key is None:
+                    continue
+                if mask & IN_IGNORED:
+                    # The directory is gone (its parent reports the delete)
+                    del self._keys[wd]
+                    if self._wds.get(key) == wd:
+                        del self._wds[key]
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    continue
+                changed[key] = None
+
+        changed.update(dict.fromkeys(self.fallback.changes()))
+        return list(changed)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.fallback.close()
+
+
+def create_watcher():
+    """The best watcher this platform offers"""
+    try:
+        return InotifyWatcher()
+    except OSError:
+        return PollingWatcher()
+
+
+# Copyright Michael Godfrey 2026 | aloecraft.org <michael@aloecraft.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.